@@ -1,6 +1,7 @@
 # external Modules
 import pytest
 import random
+import time
 from typing import Callable, Dict, List, Tuple, Any, Union, Optional
 import subprocess
 from pathlib import Path
@@ -45,6 +46,13 @@ class HelperMethods:
             assert res.success is True
             assert res.data is True
 
+    def slow_task(self, seconds: float) -> bool:
+        """
+        A task that sleeps for the given number of seconds.
+        """
+        time.sleep(seconds)
+        return True
+
     def dummy_task(self, x) -> str:
         """
         A simple dummy task that returns a formatted string.
@@ -90,6 +98,58 @@ class TestAppCore:
         results = test_appcore_initialization.process_pool_executor(tasks, workers=4, override=False, timeout=5, chunk_size=10)
         helper_methods.verify_results(results.data, expected_count=50)
 
+    def test_process_pool_reuse(self, test_appcore_initialization: AppCore, helper_methods: HelperMethods) -> None:
+        """
+        Test that process_pool_executor reuses one worker pool until shutdown_pool is called.
+        """
+        tasks = [(helper_methods.metrix_task, {"n": i+1, "m": i+1}) for i in range(4)]
+        test_appcore_initialization.process_pool_executor(tasks, workers=2, timeout=5, chunk_size=2)
+        pool = test_appcore_initialization._process_pool
+        assert pool is not None
+        results = test_appcore_initialization.process_pool_executor(tasks, workers=2, timeout=5)
+        helper_methods.verify_results(results.data, expected_count=4)
+        assert test_appcore_initialization._process_pool is pool, "Pool should be reused for the same worker count"
+
+        assert test_appcore_initialization.shutdown_pool().success
+        assert test_appcore_initialization._process_pool is None
+
+    def test_process_pool_recovers_after_timeout(self, test_appcore_initialization: AppCore, helper_methods: HelperMethods) -> None:
+        """
+        Test that a timed-out task does not keep its worker: the next call gets a fresh pool and succeeds.
+        """
+        # the overrunning task keeps running in the discarded pool, so keep it short enough not to delay interpreter exit
+        timed_out = test_appcore_initialization.process_pool_executor([(helper_methods.slow_task, {"seconds": 3})], workers=1, timeout=0.5)
+        assert timed_out.success is False
+        assert test_appcore_initialization._process_pool is None, "Pool with a stuck task should be discarded"
+
+        start = time.perf_counter()
+        results = test_appcore_initialization.process_pool_executor([(helper_methods.dummy_task, {"x": 1})], workers=1, timeout=5)
+        assert results.success, results.error
+        assert results.data[0].success and results.data[0].data == "dummy, 1"
+        assert time.perf_counter() - start < 3, "The new pool should not wait for the overrunning task"
+        test_appcore_initialization.shutdown_pool()
+
+    def test_process_pool_executor_vector(self, test_appcore_initialization: AppCore) -> None:
+        """
+        Test the process pool executor in vector mode, including division by zero and invalid input.
+        """
+        ns, ms = np.arange(1, 1001), np.arange(1000) * 2
+        results = test_appcore_initialization.process_pool_executor((np.divide, (ns, ms)), workers=2, timeout=5, chunk_size=128, vector=True)
+        assert results.success, results.error
+        assert results.data.shape == (1000,)
+        assert np.isinf(results.data[0]), "Division by zero should produce inf instead of raising"
+        np.testing.assert_allclose(results.data[1:], ns[1:] / ms[1:])
+
+        # 10 elements on 8 workers split into 5 chunks of 2; the extra workers are not an error
+        uneven = test_appcore_initialization.process_pool_executor((np.add, (np.arange(10), np.arange(10))), workers=8, timeout=10, vector=True)
+        assert uneven.success, uneven.error
+        np.testing.assert_array_equal(uneven.data, np.arange(10) * 2)
+
+        mismatched = test_appcore_initialization.process_pool_executor((np.divide, (ns, ms[:10])), workers=2, timeout=5, vector=True)
+        assert mismatched.success is False
+        wrong_chunk = test_appcore_initialization.process_pool_executor((np.divide, (ns, ms)), workers=2, timeout=5, chunk_size=0, vector=True)
+        assert wrong_chunk.success is False
+
     def test_get_text_by_lang(self, test_appcore_initialization: AppCore) -> None:
         """
         Test the get_text_by_lang method for retrieving text based on language code.
@@ -261,6 +321,29 @@ class TestCLIMethods:
         except Exception as e:
             pytest.fail(f"clear_console raised an exception: {e}")
 
+    def test_clear_console_ansi(self, test_appcore_initialization: AppCore, monkeypatch) -> None:
+        """
+        Test that clear_console writes the ANSI sequence on a terminal instead of spawning a shell.
+        """
+        import io
+        import sys
+        appcore_module = sys.modules[AppCore.__module__]
+
+        class FakeTTY(io.StringIO):
+            def isatty(self) -> bool:
+                return True
+
+        def fail_run(*args, **kwargs):
+            raise AssertionError("subprocess.run should not be called on a VT terminal")
+
+        fake_stdout = FakeTTY()
+        monkeypatch.setattr(sys, "stdout", fake_stdout)
+        monkeypatch.setattr(appcore_module, "_VT_SUPPORTED", True)
+        monkeypatch.setattr(appcore_module.subprocess, "run", fail_run)
+        result = test_appcore_initialization.clear_console()
+        assert result.success
+        assert fake_stdout.getvalue() == AppCore.ANSI_CLEAR_SCREEN
+
     def test_exit_application(self, test_appcore_initialization: AppCore) -> None:
         """
         Test the exit_application method to ensure it executes without errors.
@@ -269,6 +352,28 @@ class TestCLIMethods:
             test_appcore_initialization.exit_application(code=0)
         assert exc_info.value.code == 0
 
+    def test_exit_application_pause(self, test_appcore_initialization: AppCore, monkeypatch) -> None:
+        """
+        Test that exit_application(pause=True) waits for a line on stdin before exiting.
+        """
+        import os
+        import sys
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"\n")
+        os.close(write_fd)
+        with os.fdopen(read_fd) as fake_stdin:
+            monkeypatch.setattr(sys, "stdin", fake_stdin)
+            with pytest.raises(SystemExit) as exc_info:
+                test_appcore_initialization.exit_application(code=3, pause=True)
+        assert exc_info.value.code == 3
+
+        # stdin without a file descriptor (e.g. redirected to StringIO) works as well
+        import io
+        monkeypatch.setattr(sys, "stdin", io.StringIO("\n"))
+        with pytest.raises(SystemExit) as exc_info:
+            test_appcore_initialization.exit_application(code=4, pause=True)
+        assert exc_info.value.code == 4
+
     def test_restart_application(self, test_appcore_initialization: AppCore) -> None:
         """
         Test the restart_application method to ensure it executes without errors.
@@ -436,6 +541,22 @@ class TestResultWrapper:
         assert result.success is True
         assert result.data == "Hi, World!"
 
+    def test_result_wrapper_safe(self, test_appcore_initialization: AppCore) -> None:
+        """Test ResultWrapper with safe=True and functions returning None"""
+        @ResultWrapper(safe=True)
+        def divide(a, b):
+            return a / b
+
+        @ResultWrapper()
+        def returns_none():
+            return None
+
+        assert divide(10, 2).data == 5
+        with pytest.raises(ZeroDivisionError):
+            divide(10, 0)
+        result = returns_none()
+        assert result.success is True and result.data is None
+
 
 class TestSafeCLIInput:
     """Test cases for safe_CLI_input method"""
@@ -1,8 +1,10 @@
 # external Modules
 import pytest
+import time
 
 # internal Modules
 from tbot223_core import Exception
+from tbot223_core.Result import Result
 
 @pytest.fixture(scope="module")
 def tracker():
@@ -65,6 +67,65 @@ class TestExceptionTracker:
         assert "OS" in tracker._system_info
         assert "Python_Version" in tracker._system_info
 
+    def test_system_info_cached(self, tmp_path, monkeypatch) -> None:
+        """
+        Test that system info is collected once and shared, and re-collected on request.
+        """
+        first, second = Exception.ExceptionTracker(), Exception.ExceptionTracker()
+        assert first._system_info is second._system_info, "System info should be shared between trackers"
+
+        monkeypatch.chdir(tmp_path)
+        refreshed = Exception.ExceptionTracker(refresh_system_info=True)
+        assert refreshed._system_info["Current_Working_Directory"] == str(tmp_path)
+        monkeypatch.undo()
+        Exception.ExceptionTracker(refresh_system_info=True)
+
+    def test_system_info_copied_into_reports(self) -> None:
+        """
+        Test that editing computer_info in one report does not change later reports.
+        """
+        try:
+            raise ValueError("first")
+        except ValueError as e:
+            first = Exception.ExceptionTracker().get_exception_return(e)
+        first.data["computer_info"].pop("OS")
+        first.data["computer_info"]["Cwd"] = "/elsewhere"
+
+        try:
+            raise ValueError("second")
+        except ValueError as e:
+            second = Exception.ExceptionTracker().get_exception_return(e)
+        assert "OS" in second.data["computer_info"]
+        assert "Cwd" not in second.data["computer_info"]
+
+    def test_system_info_probe_failure(self, monkeypatch) -> None:
+        """
+        Test that one failing platform probe does not prevent collecting the others.
+        """
+        import platform
+        def fail():
+            raise OSError("probe failed")
+        monkeypatch.setattr(platform, "processor", fail)
+        try:
+            info = Exception.ExceptionTracker(refresh_system_info=True)._system_info
+            assert info["Processor"] == "<Unavailable>"
+            assert info["Python_Version"] == platform.python_version()
+        finally:
+            monkeypatch.undo()
+            Exception.ExceptionTracker(refresh_system_info=True)
+
+    def test_timestamp_reused_within_second(self, monkeypatch) -> None:
+        """
+        Test that the exception timestamp is formatted once per second and matches strftime.
+        """
+        fixed = 1_700_000_000.25
+        monkeypatch.setattr(Exception.time, "time", lambda: fixed)
+        stamp = Exception._get_timestamp()
+        assert stamp == time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(int(fixed)))
+
+        monkeypatch.setattr(Exception.time, "strftime", lambda *args: pytest.fail("strftime called again within the same second"))
+        assert Exception._get_timestamp() == stamp
+
     @Exception.ExceptionTrackerDecorator(mask_tuple=(False, False, False, False), tracker=Exception.ExceptionTracker())
     def dummy_method(self, x: int) -> str:
         """
@@ -80,7 +141,65 @@ class TestExceptionTracker:
         
         assert result.success is False
         assert "ZeroDivisionError" in result.error
+
+    def test_exception_tracker_decorator_preserves_metadata(self) -> None:
+        """
+        Test that the decorator keeps the wrapped function's name, docstring and __wrapped__.
+        """
+        wrapped = type(self).dummy_method
+        assert wrapped.__name__ == "dummy_method"
+        assert wrapped.__qualname__.endswith("dummy_method")
+        assert "A dummy method" in wrapped.__doc__
+        assert wrapped.__wrapped__(self, 5) == 2
     
+    def test_decorator_skips_argument_validation(self, monkeypatch) -> None:
+        """
+        Test that the decorator path builds its Result without re-validating its own arguments.
+        """
+        tracker = Exception.ExceptionTracker()
+
+        @Exception.ExceptionTrackerDecorator(mask_tuple=(False, True, True, True), tracker=tracker)
+        def divide(x: int) -> float:
+            return 10 / x
+
+        monkeypatch.setattr(Exception.ExceptionTracker, "_check_info_args", staticmethod(lambda *args: pytest.fail("validated on the decorator path")))
+        result = divide(0)
+        assert result.success is False
+        assert result.data["input_context"]["params"] == "<Masked>"
+
+    def test_decorator_uses_public_api_and_current_mask(self) -> None:
+        """
+        Test that tracker subclasses keep their get_exception_return override and mask changes apply after decoration.
+        """
+        class CustomTracker(Exception.ExceptionTracker):
+            def get_exception_return(self, error, user_input=None, params=None, mask_tuple=()):
+                return Result(False, "custom", None, mask_tuple)
+
+        custom = Exception.ExceptionTrackerDecorator(tracker=CustomTracker())
+        divide = custom(lambda x: 10 / x)
+        assert divide(0) == (False, "custom", None, (False, False, False, False))
+
+        custom.mask_tuple = (True, True, True, True)
+        assert divide(0).data == (True, True, True, True)
+        custom.mask_tuple = ("invalid",)
+        assert custom.mask_tuple == (False, False, False, False)
+
+        decorator = Exception.ExceptionTrackerDecorator(tracker=Exception.ExceptionTracker())
+        wrapped = decorator(lambda x: 10 / x)
+        decorator.mask_tuple = (False, False, False, True)
+        assert wrapped(0).data["computer_info"] == "<Masked>"
+
+    def test_decorator_default_tracker_shared(self) -> None:
+        """
+        Test that decorators without an explicit tracker share one default instance.
+        """
+        first, second = Exception.ExceptionTrackerDecorator(), Exception.ExceptionTrackerDecorator()
+        assert first.tracker is second.tracker
+        assert first.tracker is Exception._get_default_tracker()
+
+        own = Exception.ExceptionTracker()
+        assert Exception.ExceptionTrackerDecorator(tracker=own).tracker is own
+
     def test_get_exception_info_with_params(self, tracker: Exception.ExceptionTracker) -> None:
         """
         Test get_exception_info with user_input and params
@@ -101,6 +220,29 @@ class TestExceptionTracker:
         assert result.data["input_context"]["params"]["args"] == (1, 2)
         assert result.data["input_context"]["params"]["kwargs"] == {"key": "value"}
     
+    def test_repr_params_detaches_payload(self) -> None:
+        """
+        Test that repr_params stores bounded strings instead of references to the caller's objects
+        """
+        import weakref
+
+        class Payload(list):
+            pass
+
+        payload = Payload(range(10_000))
+        ref = weakref.ref(payload)
+        tracker = Exception.ExceptionTracker(repr_params=True)
+        try:
+            1 / 0
+        except ZeroDivisionError as e:
+            result = tracker.get_exception_return(e, params=((payload,), {"text": "x" * 1000}))
+
+        params = result.data["input_context"]["params"]
+        assert isinstance(params["args"], str) and len(params["args"]) < 300
+        assert isinstance(params["kwargs"], str) and len(params["kwargs"]) < 300
+        del payload
+        assert ref() is None, "The Result should not keep the payload alive"
+
     def test_get_exception_return_with_params(self, tracker: Exception.ExceptionTracker) -> None:
         """
         Test get_exception_return with params
@@ -242,6 +384,28 @@ class TestGetErrorCode:
             assert result.success is False
             assert "not found" in result.error.lower() or "keyerror" in result.error.lower()
     
+    def test_get_error_code_miss_is_quiet(self, tracker: Exception.ExceptionTracker, capsys) -> None:
+        """Test that an unmapped type fails without the critical-error path, and falsy codes still count as found"""
+        result = tracker.get_error_code({"ValueError": 1002}, KeyError("missing"))
+        assert result.success is False
+        assert "KeyError" in result.error and "not found" in result.error
+        assert result.data is None
+        assert capsys.readouterr().out == ""
+        assert tracker.get_error_code({}, KeyError("again")) is result, "Misses for one type should reuse the same Result"
+
+        found = tracker.get_error_code({"ValueError": 0}, ValueError("zero code"))
+        assert found.success is True and found.data == 0
+
+    def test_tracker_failure_logged_not_printed(self, tracker: Exception.ExceptionTracker, capsys, caplog) -> None:
+        """Test that a failure inside the tracker goes to the module logger, not stdout"""
+        with caplog.at_level("ERROR", logger=Exception.__name__):
+            result = tracker.get_error_code(None, ValueError("x"))
+        assert result.success is False
+        assert result.context == "Core.ExceptionTracker.get_error_code, L2"
+        assert "AttributeError" in result.data
+        assert capsys.readouterr().out == ""
+        assert any("get_error_code" in record.getMessage() and record.exc_info for record in caplog.records)
+
     def test_get_error_code_string_codes(self, tracker: Exception.ExceptionTracker) -> None:
         """Test get_error_code with string error codes"""
         error_id_map = {
@@ -345,6 +509,19 @@ class TestExceptionMasking:
             )
             assert result.success is False
     
+    def test_invalid_arguments_reported_without_raising(self, tracker: Exception.ExceptionTracker, capsys) -> None:
+        """Test that invalid arguments return a failed Result directly, without the critical-error path"""
+        error = ValueError("original")
+        info = tracker.get_exception_info(error, params="not a tuple")
+        assert info.success is False
+        assert info.error.startswith("ValueError :The 'params' argument")
+
+        result = tracker.get_exception_return(error, params=([], {}))
+        assert result.success is False
+        assert result.error == "ValueError :original", "The original exception should still be reported"
+        assert "params" in result.data
+        assert capsys.readouterr().out == ""
+
     def test_invalid_mask_tuple_types(self, tracker: Exception.ExceptionTracker) -> None:
         """Test with invalid mask_tuple types"""
         try:
@@ -388,6 +565,46 @@ class TestExceptionInfoStructure:
             assert "message" in error
             assert error["type"] == "ZeroDivisionError"
     
+    def test_exception_location_deep_stack(self, tracker: Exception.ExceptionTracker) -> None:
+        """Test that the location is the innermost frame of a deep traceback"""
+        def recurse(depth: int) -> None:
+            if depth == 0:
+                raise RuntimeError("bottom")
+            recurse(depth - 1)
+
+        try:
+            recurse(50)
+        except RuntimeError as e:
+            location = tracker.get_exception_location(e).data
+            info = tracker.get_exception_info(e, mask_tuple=(False, False, True, False)).data
+            assert location.endswith(", in recurse")
+            assert f"line {info['location']['line']}" in location
+            assert info["origin_location"]["function"] == "test_exception_location_deep_stack"
+
+    def test_exception_location_cached_per_site(self, tracker: Exception.ExceptionTracker) -> None:
+        """Test that repeated exceptions from one site reuse the formatted location"""
+        locations = []
+        for _ in range(3):
+            try:
+                raise KeyError("repeat")
+            except KeyError as e:
+                locations.append(tracker.get_exception_location(e).data)
+        assert locations[0] is locations[1] is locations[2]
+        assert locations[0].endswith(", in test_exception_location_cached_per_site")
+
+    def test_exception_location_same_code_different_files(self, tracker: Exception.ExceptionTracker) -> None:
+        """Test that identical functions compiled from different files keep their own location"""
+        source = "def f():\n    raise ValueError('same body')\n"
+        for filename in ("file_a.py", "file_b.py"):
+            namespace = {}
+            exec(compile(source, filename, "exec"), namespace)
+            try:
+                namespace["f"]()
+            except ValueError as e:
+                result = tracker.get_exception_return(e)
+            assert result.context == f"'{filename}', line 2, in f"
+            assert result.data["location"]["file"] == filename
+
     def test_exception_info_location_structure(self, tracker: Exception.ExceptionTracker) -> None:
         """Test location field structure"""
         try:
@@ -401,6 +618,70 @@ class TestExceptionInfoStructure:
             assert "function" in location
             assert isinstance(location["line"], int)
 
+    def test_masked_traceback_is_never_formatted(self, tracker: Exception.ExceptionTracker, monkeypatch) -> None:
+        """Test that a masked traceback skips traceback formatting on every exception path"""
+        def fail(*args, **kwargs):
+            raise AssertionError("traceback formatted although masked")
+        monkeypatch.setattr(Exception.traceback, "format_exception", fail)
+        monkeypatch.setattr(Exception.traceback, "TracebackException", fail)
+
+        @Exception.ExceptionTrackerDecorator(mask_tuple=(False, False, True, False), tracker=tracker)
+        def divide(x: int) -> float:
+            return 10 / x
+
+        result = divide(0)
+        assert result.success is False
+        assert result.data["traceback"] == "<Masked>"
+        assert result.data["error"]["type"] == "ZeroDivisionError"
+
+    def test_exception_frames_released_without_gc(self, tracker: Exception.ExceptionTracker) -> None:
+        """Test that returned Results do not keep the failing frame (and its locals) alive"""
+        import gc
+        import weakref
+
+        class Payload:
+            pass
+
+        refs = []
+
+        @Exception.ExceptionTrackerDecorator(tracker=tracker)
+        def failing() -> None:
+            payload = Payload()
+            refs.append(weakref.ref(payload))
+            raise RuntimeError("boom")
+
+        def failing_direct() -> Exception.Result:
+            payload = Payload()
+            refs.append(weakref.ref(payload))
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError as e:
+                return tracker.get_exception_return(e)
+
+        gc.disable()
+        try:
+            results = [failing(), failing_direct()]
+            assert all(result.success is False for result in results)
+            assert all(ref() is None for ref in refs), "Frame locals should be freed by refcounting alone"
+        finally:
+            gc.enable()
+
+    def test_exception_return_single_walk(self, tracker: Exception.ExceptionTracker) -> None:
+        """Test default params, shared location and skipped traceback formatting when masked"""
+        try:
+            1 / 0
+        except ZeroDivisionError as e:
+            result = tracker.get_exception_return(e, mask_tuple=(False, False, True, False))
+            location = result.data["location"]
+
+            assert result.context == f"'{location['file']}', line {location['line']}, in {location['function']}"
+            assert result.context == tracker.get_exception_location(e).data
+            assert result.data["traceback"] == "<Masked>"
+            assert result.data["origin_location"]["function"] == "test_exception_return_single_walk"
+
+        unraised = ValueError("never raised")
+        assert tracker.get_exception_location(unraised).data == "'Unknown', line -1, in Unknown"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -40,6 +40,22 @@ class TestFileManager:
         assert read_result_bytes.success, f"Atomic read (bytes) failed: {read_result_bytes.error}"
         assert read_result_bytes.data == test_data_bytes, "Byte data read does not match byte data written."
 
+    def test_read_file_large_raw_path(self, file_manager, tmp_path):
+        test_file = tmp_path / "large.txt"
+        line = "large file line \u00e9\r\n"
+        payload = line * (FileManager.RAW_READ_SIZE_THRESHOLD // len(line) + 1)
+        test_file.write_bytes(payload.encode("utf-8"))
+        assert test_file.stat().st_size > FileManager.RAW_READ_SIZE_THRESHOLD
+
+        text_result = file_manager.read_file(test_file)
+        assert text_result.success, f"Large read failed: {text_result.error}"
+        with open(test_file, "r", encoding="utf-8") as f:
+            assert text_result.data == f.read(), "Large text read should match text-mode newline handling."
+
+        bytes_result = file_manager.read_file(test_file, as_bytes=True)
+        assert bytes_result.success
+        assert bytes_result.data == payload.encode("utf-8")
+
     def test_write_json_and_read_json(self, file_manager, tmp_path):
         test_file = tmp_path / "test_data.json"
         test_data = {"key1": "value1", "key2": 2, "key3": [1, 2, 3]}
@@ -53,6 +69,82 @@ class TestFileManager:
         assert read_result.success, f"Read JSON failed: {read_result.error}"
         assert read_result.data == test_data, "JSON data read does not match data written."
 
+    def test_write_json_backends(self, file_manager, tmp_path, monkeypatch):
+        """Test JSON round trips with and without orjson, across indent widths and orjson-unsupported data"""
+        import sys
+        fm_module = sys.modules[FileManager.__module__]
+        test_data = {"name": "테스트", 1: [1.5, None, True], "big": 2 ** 70}
+        expected = {"name": "테스트", "1": [1.5, None, True], "big": 2 ** 70}
+
+        for orjson_module in (fm_module.orjson, None):
+            monkeypatch.setattr(fm_module, "orjson", orjson_module)
+            for indent in (0, 2, 4):
+                test_file = tmp_path / f"backend_{indent}.json"
+                assert file_manager.write_json(file_path=test_file, data=test_data, indent=indent).success
+                read_result = file_manager.read_json(file_path=test_file)
+                assert read_result.success, f"Read JSON failed: {read_result.error}"
+                assert read_result.data == expected
+                assert isinstance(read_result.data["big"], int), "Integers beyond 64 bits must not be parsed as floats"
+
+            nan_file = tmp_path / "nan.json"
+            nan_file.write_text('{"value": NaN}', encoding="utf-8")
+            read_result = file_manager.read_json(file_path=nan_file)
+            assert read_result.success and read_result.data["value"] != read_result.data["value"]
+
+    def test_write_json_compact_matches_across_backends(self, file_manager, tmp_path, monkeypatch):
+        """Test that compact JSON is byte-identical with and without orjson"""
+        import sys
+        fm_module = sys.modules[FileManager.__module__]
+        test_data = {"name": "테스트", "values": [1, 2.5, None, False], "nested": {"key": "value"}}
+        outputs = []
+        for orjson_module in (fm_module.orjson, None):
+            monkeypatch.setattr(fm_module, "orjson", orjson_module)
+            test_file = tmp_path / "compact.json"
+            assert file_manager.write_json(file_path=test_file, data=test_data, indent=0).success
+            outputs.append(test_file.read_bytes())
+        assert outputs[0] == outputs[1]
+        assert b", " not in outputs[1]
+
+    def test_read_json_parser_selection(self, file_manager, tmp_path):
+        """Test explicit parser selection in read_json"""
+        import sys
+        fm_module = sys.modules[FileManager.__module__]
+        test_file = tmp_path / "parsers.json"
+        test_data = {"items": list(range(100)), "text": "값"}
+        assert file_manager.write_json(file_path=test_file, data=test_data).success
+
+        available = ["auto", "json"] + [name for name in ("orjson", "simdjson") if getattr(fm_module, name) is not None]
+        for parser in available:
+            read_result = file_manager.read_json(file_path=test_file, parser=parser)
+            assert read_result.success, f"{parser} parser failed: {read_result.error}"
+            assert read_result.data == test_data
+        for parser in ("orjson", "simdjson"):
+            if getattr(fm_module, parser) is None:
+                assert not file_manager.read_json(file_path=test_file, parser=parser).success, f"Missing {parser} should fail"
+        assert not file_manager.read_json(file_path=test_file, parser="unknown").success
+
+    def test_read_json_cache(self, file_manager, tmp_path, monkeypatch):
+        """Test that use_cache reuses parsed data until the file changes"""
+        test_file = tmp_path / "cached.json"
+        assert file_manager.write_json(file_path=test_file, data={"version": 1}).success
+
+        first = file_manager.read_json(file_path=test_file, use_cache=True)
+        assert first.success and first.data == {"version": 1}
+
+        with patch.object(FileManager, "_loads_json", side_effect=AssertionError("cache miss")):
+            second = file_manager.read_json(file_path=test_file, use_cache=True)
+        assert second.success and second.data is first.data
+
+        assert file_manager.write_json(file_path=test_file, data={"version": 2}).success
+        assert file_manager.read_json(file_path=test_file, use_cache=True).data == {"version": 2}
+        assert file_manager.read_json(file_path=test_file).data is not first.data
+
+        monkeypatch.setattr(file_manager, "JSON_CACHE_SIZE", 1)
+        other_file = tmp_path / "other.json"
+        assert file_manager.write_json(file_path=other_file, data=[]).success
+        assert file_manager.read_json(file_path=other_file, use_cache=True).success
+        assert len(file_manager._json_cache) == 1
+
     def test_list_of_files(self, file_manager, tmp_path):
         # Create test files
         (tmp_path / "file1.txt").write_text("File 1")
@@ -85,6 +177,32 @@ class TestFileManager:
         # Ensure file is deleted
         assert not test_file.exists(), "Test file still exists after deletion."
 
+    def test_delete_files(self, file_manager, tmp_path):
+        paths = [tmp_path / f"batch_{i}.txt" for i in range(3)]
+        for path in paths:
+            path.write_text("data")
+
+        result = file_manager.delete_files(paths)
+        assert result.success, f"Batch delete failed: {result.error}"
+        assert not any(path.exists() for path in paths)
+
+        # A missing file fails the batch, but the remaining files are still deleted
+        remaining = tmp_path / "remaining.txt"
+        remaining.write_text("data")
+        result = file_manager.delete_files([tmp_path / "missing.txt", remaining])
+        assert not result.success
+        assert not remaining.exists()
+
+    def test_delete_files_rejects_non_sequence(self, file_manager, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        single_letter = tmp_path / "a"
+        single_letter.write_text("data")
+        for invalid in ("abc", tmp_path / "a", {"a": 1}, None):
+            result = file_manager.delete_files(invalid)
+            assert not result.success
+            assert "file_paths must be a list or tuple of paths" in result.error
+        assert single_letter.exists(), "A str argument must not be iterated into single-letter paths"
+
     def test_delete_directory(self, file_manager, tmp_path):
         test_dir = tmp_path / "test_dir"
         test_dir.mkdir()
@@ -164,6 +282,40 @@ class TestFileManagerEdgeCases:
             assert not result.success, "Atomic write unexpectedly succeeded despite replace failure."
             assert target_file.read_text() == original_data, "Original data was altered despite atomic write failure."
 
+    def test_atomic_write_data_types(self, file_manager, tmp_path):
+        """Test atomic_write with bytearray data and rejection of unsupported types without leftovers"""
+        test_file = tmp_path / "typed.bin"
+        assert file_manager.atomic_write(file_path=test_file, data=bytearray(b"\x00abc")).success
+        assert test_file.read_bytes() == b"\x00abc"
+
+        result = file_manager.atomic_write(file_path=tmp_path / "invalid.txt", data=12345)
+        assert not result.success, "Non str/bytes data should fail"
+        assert [p.name for p in tmp_path.iterdir()] == ["typed.bin"], "Temporary files were left behind"
+
+    def test_atomic_write_many(self, file_manager, tmp_path):
+        """Test writing several files in one batch, including a new nested directory"""
+        files = {tmp_path / f"file_{i}.txt": f"sample {i}" for i in range(3)}
+        files[tmp_path / "nested" / "data.bin"] = b"\x00\x01"
+        result = file_manager.atomic_write_many(files)
+        assert result.success, f"Batch write failed: {result.error}"
+        for file_path, data in files.items():
+            content = file_path.read_bytes() if isinstance(data, bytes) else file_path.read_text(encoding="utf-8")
+            assert content == data
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["file_0.txt", "file_1.txt", "file_2.txt", "nested"], "Temporary files were left behind"
+
+    def test_atomic_write_many_failure_cleanup(self, file_manager, tmp_path):
+        """Test that a failed batch write leaves the original data and no temporary files"""
+        target_file = tmp_path / "important_data.txt"
+        target_file.write_text("original")
+
+        with patch('os.replace') as mock_replace:
+            mock_replace.side_effect = OSError("Simulated replace failure")
+            result = file_manager.atomic_write_many({target_file: "new", tmp_path / "other.txt": "other"})
+        assert not result.success, "Batch write unexpectedly succeeded despite replace failure."
+        assert target_file.read_text() == "original"
+        assert [p.name for p in tmp_path.iterdir()] == ["important_data.txt"], "Temporary files were left behind"
+        assert not file_manager.atomic_write_many({}).success, "Empty mapping should fail"
+
     def test_create_directory(self, file_manager, tmp_path):
         """Test creating a directory"""
         new_dir = tmp_path / "new_test_directory"
@@ -1,6 +1,7 @@
 # external Modules
 import pytest
 from pathlib import Path
+import os
 
 # internal Modules
 from tbot223_core.LogSys import LoggerManager, Log
@@ -104,6 +105,99 @@ class TestLogSysEdgeCases:
         assert not result.success, "Stopping handlers for None logger should fail"
 
 
+    def test_buffered_file_logging(self, tmp_path):
+        """Test that file records are buffered and written on flush, on ERROR and by the periodic flush"""
+        import time
+        logger_manager = LoggerManager(base_dir=tmp_path / "logs", second_log_dir="buffered", buffer_capacity=100, flush_interval_ms=50)
+        assert logger_manager.make_logger("buffered_logger").success
+        logger = logger_manager.get_logger("buffered_logger").data
+        logger_manager.stop_stream_handlers(logger)
+        log_file = next((tmp_path / "logs" / "buffered").rglob("buffered_logger.log"))
+
+        logger.info("first message")
+        assert logger_manager.flush().success
+        assert "first message" in log_file.read_text()
+
+        logger.error("error message")
+        assert "error message" in log_file.read_text(), "ERROR records should be written immediately"
+
+        logger.info("periodic message")
+        deadline = time.monotonic() + 5
+        while "periodic message" not in log_file.read_text() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert "periodic message" in log_file.read_text(), "Buffered records should be flushed periodically"
+
+    def test_buffering_is_opt_in_and_flushable_before_exec(self, tmp_path):
+        """Test that LoggerManager writes synchronously by default and buffered records can be flushed before an exec"""
+        assert LoggerManager(base_dir=tmp_path / "logs").buffer_capacity == 0
+
+        logger_manager = LoggerManager(base_dir=tmp_path / "logs", second_log_dir="exec", buffer_capacity=100, flush_interval_ms=60_000)
+        assert logger_manager.make_logger("exec_logger").success
+        logger = logger_manager.get_logger("exec_logger").data
+        logger_manager.stop_stream_handlers(logger)
+        log_file = next((tmp_path / "logs" / "exec").rglob("exec_logger.log"))
+
+        logger.info("restarting")
+        assert "restarting" not in log_file.read_text()
+        LogSys._flush_buffered_handlers()
+        assert "restarting" in log_file.read_text()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_starts_flush_thread_lazily(self, tmp_path):
+        """Test that a forked child drops the parent's buffered records and starts the flush thread only once it logs"""
+        logger_manager = LoggerManager(base_dir=tmp_path / "logs", second_log_dir="forked", buffer_capacity=100, flush_interval_ms=60_000)
+        assert logger_manager.make_logger("forked_logger").success
+        logger = logger_manager.get_logger("forked_logger").data
+        logger_manager.stop_stream_handlers(logger)
+        logger.info("parent message")
+        assert LogSys._flush_thread is not None
+        handler = logger_manager._memory_handlers["forked_logger"]
+
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                idle = LogSys._flush_thread is None and not handler.buffer
+                logger.info("child message")
+                status = 0 if idle and LogSys._flush_thread is not None else 1
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert logger_manager.flush().success
+
+    def test_buffered_flush_single_write(self, tmp_path):
+        """Test that a flush writes all buffered records to the file in one write call"""
+        logger_manager = LoggerManager(base_dir=tmp_path / "logs", second_log_dir="batched", buffer_capacity=100, flush_interval_ms=60_000)
+        assert logger_manager.make_logger("batched_logger").success
+        logger = logger_manager.get_logger("batched_logger").data
+        logger_manager.stop_stream_handlers(logger)
+        logger.debug("below level")  # filtered by the logger level, never buffered
+        for i in range(5):
+            logger.info(f"batched {i}")
+
+        target = logger_manager._memory_handlers["batched_logger"].target
+        writes = []
+        original_write = target.stream.write
+        target.stream.write = lambda data: writes.append(data) or original_write(data)
+        assert logger_manager.flush().success
+        assert len(writes) == 1
+        lines = writes[0].splitlines()
+        assert [line.rsplit(" - ", 1)[1] for line in lines] == [f"batched {i}" for i in range(5)]
+
+    def test_unbuffered_file_logging(self, tmp_path):
+        """Test that buffer_capacity=0 writes every record immediately"""
+        logger_manager = LoggerManager(base_dir=tmp_path / "logs", second_log_dir="unbuffered", buffer_capacity=0)
+        assert logger_manager.make_logger("unbuffered_logger").success
+        logger = logger_manager.get_logger("unbuffered_logger").data
+        logger_manager.stop_stream_handlers(logger)
+        logger.info("direct message")
+        log_file = next((tmp_path / "logs" / "unbuffered").rglob("unbuffered_logger.log"))
+        assert "direct message" in log_file.read_text()
+        with pytest.raises(ValueError):
+            LoggerManager(base_dir=tmp_path / "logs", buffer_capacity=-1)
+
+
 @pytest.mark.usefixtures("setup_module")
 class TestSimpleSetting:
     """Tests for SimpleSetting class"""
@@ -213,6 +307,41 @@ class TestLoggerManagerEdgeCases:
         result = logger_manager.make_logger("int_level", log_level=logging.WARNING)
         assert result.success, "Creating logger with integer level should succeed"
 
+    def test_log_message_filtered_level_skips_logger(self, tmp_path):
+        """Test that log_message returns early for levels the logger does not emit"""
+        import logging
+        logger_manager = LoggerManager(base_dir=tmp_path / "logs", second_log_dir="test")
+        logger_manager.make_logger("filtered_level", log_level=logging.WARNING)
+        logger = logger_manager.get_logger("filtered_level").data
+        log = LogSys.Log(logger)
+
+        logger.log = lambda *args, **kwargs: pytest.fail("filtered message reached logger.log")
+        result = log.log_message("debug", "filtered out")
+        assert result.success
+        assert result.data == "Log message sent successfully."
+        del logger.log
+
+    def test_log_message_lazy_args(self, tmp_path):
+        """Test that %-style args are formatted when emitted and never evaluated for filtered levels"""
+        import logging
+        logger_manager = LoggerManager(base_dir=tmp_path / "logs", second_log_dir="test", buffer_capacity=0)
+        logger_manager.make_logger("lazy_args", log_level=logging.INFO)
+        logger = logger_manager.get_logger("lazy_args").data
+        logger_manager.stop_stream_handlers(logger)
+        log = LogSys.Log(logger)
+
+        class NoFormat:
+            def __str__(self):
+                pytest.fail("filtered message argument was formatted")
+
+        assert log.log_message("DEBUG", "Key '%s' matches.", NoFormat()).success
+        assert log.log_message("INFO", "Key '%s%s' matches.", "a/", "b").success
+        assert log.log_message("INFO", "100% literal without args").success
+        log_file = next((tmp_path / "logs" / "test").rglob("lazy_args.log"))
+        contents = log_file.read_text()
+        assert "Key 'a/b' matches." in contents
+        assert "100% literal without args" in contents
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -136,3 +136,19 @@ class TestResult:
         assert error == "err"
         assert context == "ctx"
         assert data == "val"
+
+    def test_result_has_no_instance_dict(self):
+        """Test Result instances carry no per-instance __dict__ (empty __slots__)."""
+        result = Result(success=True, error=None, context="Slots", data="data")
+        assert Result.__slots__ == ()
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = "value"
+
+    def test_result_ok(self):
+        """Test Result.ok builds the same successful Result as the positional constructor."""
+        result = Result.ok({"key": "value"})
+        assert type(result) is Result
+        assert result == Result(True, None, None, {"key": "value"})
+        assert result.unwrap() == {"key": "value"}
+        assert Result.ok() == (True, None, None, None)
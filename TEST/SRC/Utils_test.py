@@ -1,11 +1,12 @@
 # external Modules
 import pytest
 from pathlib import Path
-import time, random, os, threading
+import time, random, os, threading, hashlib, operator, logging
 from multiprocessing import shared_memory
 
 # internal Modules
 from tbot223_core import Utils, DecoratorUtils, GlobalVars
+from tbot223_core.Utils.GlobalVars import _lock_held_probe
 
 @pytest.fixture(scope="module")
 def setup_module():
@@ -52,6 +53,76 @@ class TestUtils:
         assert verified.success, f"PBKDF2-HMAC verification failed: {verified.error}"
         assert verified.data is True, "PBKDF2-HMAC verification returned False"
 
+    def test_pbkdf2_hmac_dklen(self, setup_module):
+        utils, _, _ = setup_module
+        result = utils.pbkdf2_hmac(password="securepassword", algorithm="sha256", iterations=1000, salt_size=16, dklen=100)
+        assert result.success, f"PBKDF2-HMAC with dklen failed: {result.error}"
+        assert len(bytes.fromhex(result.data['hash_hex'])) == 100
+
+        expected = hashlib.pbkdf2_hmac("sha256", b"securepassword", bytes.fromhex(result.data['salt_hex']), 1000, 100)
+        assert result.data['hash_hex'] == expected.hex()
+
+        verified = utils.verify_pbkdf2_hmac(password="securepassword", salt_hex=result.data['salt_hex'],
+                                            hash_hex=result.data['hash_hex'], algorithm="sha256", iterations=1000)
+        assert verified.success and verified.data is True
+
+    def test_pbkdf2_hmac_bytes_password(self, setup_module):
+        utils, _, _ = setup_module
+        result = utils.pbkdf2_hmac(password=b"securepassword", algorithm="sha256", iterations=1000, salt_size=16)
+        assert result.success, f"PBKDF2-HMAC with bytes password failed: {result.error}"
+
+        # str and pre-encoded bytes passwords verify against each other
+        for password in ("securepassword", b"securepassword"):
+            verified = utils.verify_pbkdf2_hmac(password=password, salt_hex=result.data['salt_hex'],
+                                                hash_hex=result.data['hash_hex'], algorithm="sha256", iterations=1000)
+            assert verified.success and verified.data is True
+
+    def test_verify_pbkdf2_hmac_batch(self, setup_module):
+        utils, _, _ = setup_module
+        records = [utils.pbkdf2_hmac("securepassword", "sha256", 1000, 16).data,
+                   utils.pbkdf2_hmac("otherpassword", "sha256", 1000, 16).data,
+                   utils.pbkdf2_hmac("securepassword", "sha512", 500, 16, dklen=80).data]
+
+        result = utils.verify_pbkdf2_hmac_batch("securepassword", records)
+        assert result.success, f"Batch verification failed: {result.error}"
+        assert result.data == [True, False, True]
+        assert utils.verify_pbkdf2_hmac_batch(b"otherpassword", records).data == [False, True, False]
+        assert utils.verify_pbkdf2_hmac_batch("securepassword", []).data == []
+
+        invalid = utils.verify_pbkdf2_hmac_batch("securepassword", records + [{**records[0], "algorithm": "md5"}])
+        assert not invalid.success, "A record with an unsupported algorithm should fail the batch"
+
+    def test_pbkdf2_hmac_parallel_blocks(self, setup_module):
+        utils, _, _ = setup_module
+        salt = b"0123456789abcdef"
+        for algorithm in ["sha1", "sha256", "sha512"]:
+            assert Utils._pbkdf2_block(b"securepassword", salt, 50, algorithm, 1) == hashlib.pbkdf2_hmac(algorithm, b"securepassword", salt, 50)
+
+        parallel_utils = Utils()
+        parallel_utils.PBKDF2_PARALLEL_MIN_WORKERS = 1
+        parallel_utils.PBKDF2_PARALLEL_THRESHOLD = 1
+        derived = parallel_utils._derive_pbkdf2(b"securepassword", salt, 50, "sha256", dklen=70)
+        assert derived == hashlib.pbkdf2_hmac("sha256", b"securepassword", salt, 50, 70)
+
+    def test_verify_pbkdf2_hmac_cache(self, setup_module):
+        utils, _, _ = setup_module
+        result = utils.pbkdf2_hmac(password="securepassword", algorithm="sha256", iterations=2000, salt_size=16)
+        assert result.success, f"PBKDF2-HMAC failed: {result.error}"
+        salt_hex, hash_hex = result.data['salt_hex'], result.data['hash_hex']
+
+        cached_utils = Utils()
+        wrong = cached_utils.verify_pbkdf2_hmac("wrong_password", salt_hex, hash_hex, 2000, "sha256", use_cache=True)
+        assert wrong.success and wrong.data is False
+        assert len(cached_utils._pbkdf2_cache) == 0, "Failed verifications must not be cached"
+
+        for _ in range(3):
+            verified = cached_utils.verify_pbkdf2_hmac("securepassword", salt_hex, hash_hex, 2000, "sha256", use_cache=True)
+            assert verified.success and verified.data is True
+        assert len(cached_utils._pbkdf2_cache) == 1
+
+        wrong = cached_utils.verify_pbkdf2_hmac("wrong_password", salt_hex, hash_hex, 2000, "sha256", use_cache=True)
+        assert wrong.success and wrong.data is False
+
     def test_find_keys_by_value(self, setup_module) -> None:
         utils, _, _ = setup_module
         """
@@ -162,6 +233,22 @@ class TestDecoratorUtils:
         result = sample_function(delay)
         assert result == "Completed", "Sample function did not return expected result"
 
+    def test_count_runtime_with_logger(self, setup_module, capsys, caplog):
+        """Test count_runtime keeps the function metadata and logs instead of printing when given a logger"""
+        _, decorator_utils, _ = setup_module
+        logger = logging.getLogger("count_runtime_test")
+
+        @decorator_utils.count_runtime(logger=logger)
+        def sample_function():
+            """Sample docstring"""
+            return "Completed"
+
+        with caplog.at_level(logging.DEBUG, logger="count_runtime_test"):
+            assert sample_function() == "Completed"
+        assert sample_function.__name__ == "sample_function" and sample_function.__doc__ == "Sample docstring"
+        assert "sample_function ran for" in caplog.text
+        assert capsys.readouterr().out == ""
+
 @pytest.mark.usefixtures("setup_module")
 class TestGlobalVars:
     def test_set_and_get_global_var(self, setup_module):
@@ -213,6 +300,11 @@ class TestGlobalVars:
         # Access using call syntax
         call_value = global_vars(key)
         assert call_value.data == value, "Call syntax did not return the expected value"
+
+        # None is a value to set, not a request to get
+        assert global_vars("call_none_var", None).success
+        none_result = global_vars("call_none_var")
+        assert none_result.success and none_result.data is None
     
     def test_delete_global_var(self, setup_module):
         _, _, global_vars = setup_module
@@ -315,6 +407,36 @@ class TestGlobalVars:
         assert get_result.success, f"Failed to get variable: {get_result.error}"
         assert get_result.data == value, "Variable value should remain unchanged"
 
+    def test_expected_errors_skip_traceback_report(self, setup_module):
+        """Test missing/existing keys fail with a lightweight Result and unexpected errors keep the full report"""
+        global_vars = GlobalVars()
+        global_vars.set("existing_var", 1)
+
+        missing = global_vars.get("missing_var")
+        assert missing[:3] == (False, "KeyError :\"Global variable 'missing_var' does not exist.\"", "Core.GlobalVars.get")
+        assert missing.data["error"] == {"type": "KeyError", "message": "\"Global variable 'missing_var' does not exist.\""}
+        assert global_vars.delete("missing_var").context == "Core.GlobalVars.delete"
+        duplicate = global_vars.set("existing_var", 2)
+        assert not duplicate.success and "already exists" in duplicate.error
+        assert duplicate.data["error"]["type"] == "KeyError" and "traceback" not in duplicate.data
+
+        unknown_shm = global_vars.shm_sync("test_shm_never_created")
+        assert unknown_shm.context == "Core.GlobalVars.shm_sync" and unknown_shm.data["error"]["type"] == "ValueError"
+        missing_shm = global_vars.shm_update("test_shm_never_created")
+        assert missing_shm.context == "Core.GlobalVars.shm_update" and missing_shm.data["error"]["type"] == "FileNotFoundError"
+
+        unexpected = global_vars.get(["unhashable"])
+        assert not unexpected.success and unexpected.error.startswith("TypeError")
+        assert "traceback" in unexpected.data
+
+    def test_set_invalid_key(self, setup_module):
+        _, _, global_vars = setup_module
+
+        for key in ("", "   ", "\t\n", None, 123, ["unhashable"]):
+            result = global_vars.set(key, "value")
+            assert not result.success, f"Setting key {key!r} should fail"
+            assert "key must be a non-empty string." in result.error
+
 class TestEdgeCases:
     def test_empty_key(self, setup_module):
         _, _, global_vars = setup_module
@@ -404,6 +526,78 @@ class TestEdgeCases:
         assert result.success, f"Failed to get concurrent variable: {result.error}"
         assert result.data == iterations, f"Concurrent increment failed: expected {iterations}, got {result.data}"
 
+    def test_unlocked_reads_wait_for_held_lock(self, setup_module):
+        """Test reads skip the lock normally but wait while another thread holds lock() mid-update"""
+        global_vars = GlobalVars()
+        global_vars.set("pair_a", 0)
+        global_vars.set("pair_b", 0)
+        assert global_vars.get("pair_a").data == 0 and global_vars.exists("pair_b").data is True
+        assert global_vars.exists("missing_pair").data is False
+
+        half_done, reads = threading.Event(), []
+        def compound_update():
+            with global_vars.lock():
+                global_vars.set("pair_a", 1, overwrite=True)
+                half_done.set()
+                time.sleep(0.2)
+                global_vars.set("pair_b", 1, overwrite=True)
+                global_vars.set("pair_c", 1)
+
+        writer = threading.Thread(target=compound_update)
+        writer.start()
+        half_done.wait()
+        reads.append(global_vars.get("pair_a").data)
+        reads.append(global_vars.pair_b)
+        reads.append("pair_c" in global_vars.list_vars().data)
+        writer.join()
+        assert reads == [1, 1, True], "Reads during a held lock() must see the finished update"
+
+    def test_logging_outside_lock(self, setup_module):
+        """Test INFO logs are written after the lock is released"""
+        global_vars = GlobalVars()
+        held_while_logging = []
+        lock = global_vars.lock()
+
+        def probe_lock(acquired):
+            # another thread can only take the RLock if no thread holds it
+            if lock.acquire(False):
+                lock.release()
+                acquired.append(True)
+
+        def lock_is_held():
+            acquired = []
+            probe = threading.Thread(target=probe_lock, args=(acquired,))
+            probe.start()
+            probe.join()
+            return not acquired
+
+        class RecordingLog:
+            def log_message(self, level, message, *args):
+                held_while_logging.append((message, lock_is_held()))
+
+        object.__setattr__(global_vars, '__is_logging_enabled__', True)
+        object.__setattr__(global_vars, 'log', RecordingLog())
+        global_vars.set("logged_var", 1)
+        global_vars.get("logged_var")
+        global_vars.exists("logged_var")
+        global_vars.list_vars()
+        global_vars.delete("logged_var")
+        global_vars.clear()
+        assert len(held_while_logging) == 6
+        assert not any(held for _, held in held_while_logging), held_while_logging
+
+    def test_reads_without_lock_probe(self, setup_module):
+        """Test reads fall back to the locked path when the lock offers no held-check"""
+        assert _lock_held_probe(threading.Lock()) is None
+
+        global_vars = GlobalVars()
+        object.__setattr__(global_vars, '__lock_held__', None)
+        global_vars.set("probe_var", 1)
+        assert global_vars.get("probe_var").data == 1
+        assert global_vars.probe_var == 1
+        assert global_vars.exists("probe_var").data is True
+        assert global_vars.list_vars().data == ["probe_var"]
+
     # I WILL ADD MORE EDGE CASE TESTS HERE IN THE FUTURE
 
 
@@ -522,6 +716,116 @@ class TestSharedMemory:
         global_vars.shm_close(shm_name)
         global_vars.clear()
     
+    def test_shm_sync_and_update_marshal(self, setup_module):
+        """Test shared memory sync and update with marshal serialization"""
+        _, _, global_vars = setup_module
+        
+        shm_name = "test_shm_sync_marshal"
+        global_vars.clear()
+        gen_result = global_vars.shm_gen(name=shm_name, size=4096, create_lock=False)
+        assert gen_result.success, f"Failed to generate shared memory: {gen_result.error}"
+        
+        values = {"marshal_int": 100, "marshal_tuple": (1, 2.5, b"raw"), "marshal_set": {"a", "b"}}
+        for key, value in values.items():
+            global_vars.set(key, value)
+        sync_result = global_vars.shm_sync(shm_name, serialize_format="marshal")
+        assert sync_result.success, f"Failed to sync to shared memory with marshal: {sync_result.error}"
+        
+        global_vars.clear()
+        update_result = global_vars.shm_update(shm_name, serialize_format="marshal")
+        assert update_result.success, f"Failed to update from shared memory with marshal: {update_result.error}"
+        for key, value in values.items():
+            assert global_vars.get(key).data == value, f"{key} should be restored"
+        
+        # Clean up
+        global_vars.shm_close(shm_name)
+        global_vars.clear()
+    
+    def test_shm_sync_and_update_optional_formats(self, setup_module):
+        """Test orjson/msgpack round trips when installed and a clean failure when not"""
+        from tbot223_core.Utils import GlobalVars as gv_module
+        for serialize_format in ("orjson", "msgpack"):
+            writer, reader = GlobalVars(), GlobalVars()
+            shm_name = f"test_shm_optional_{serialize_format}"
+            assert writer.shm_gen(name=shm_name, size=4096, create_lock=False).success
+            writer.set("optional_var", {"nested": [1, 2.5, "three", None, True]})
+            sync_result = writer.shm_sync(shm_name, serialize_format=serialize_format)
+            if getattr(gv_module, serialize_format) is None:
+                assert not sync_result.success, f"Missing {serialize_format} should fail"
+                assert serialize_format not in writer.SERIALIZERS
+            else:
+                assert sync_result.success, f"{serialize_format} sync failed: {sync_result.error}"
+                assert reader.shm_connect(shm_name).success
+                assert reader.shm_update(shm_name, serialize_format=serialize_format).success
+                assert reader.get("optional_var").data == {"nested": [1, 2.5, "three", None, True]}
+                assert reader.shm_close(shm_name, close_only=True).success
+            assert writer.shm_close(shm_name).success
+
+    def test_shm_update_releases_buffer(self, setup_module):
+        """Test shm_update deserializes from the shared buffer and leaves it closable"""
+        for serialize_format in ("pickle", "json", "marshal"):
+            writer, reader = GlobalVars(), GlobalVars()
+            shm_name = f"test_shm_view_{serialize_format}"
+            assert writer.shm_gen(name=shm_name, size=4096, create_lock=False).success
+            writer.set("view_var", {"nested": [1, 2, 3]})
+            assert writer.shm_sync(shm_name, serialize_format=serialize_format).success
+
+            assert reader.shm_connect(shm_name).success
+            assert reader.shm_update(shm_name, serialize_format=serialize_format).success
+            assert reader.get("view_var").data == {"nested": [1, 2, 3]}
+            assert reader.shm_close(shm_name, close_only=True).success, f"{serialize_format}: buffer still exported"
+            assert writer.shm_close(shm_name).success
+    
+    def test_shm_pickle_out_of_band_buffers(self, setup_module):
+        """Test pickle sync writes bytes-like values out-of-band and update restores detached copies"""
+        writer, reader = GlobalVars(), GlobalVars()
+        shm_name = "test_shm_pickle_oob"
+        assert writer.shm_gen(name=shm_name, size=1 << 16, create_lock=False).success
+        writer.set("oob_bytearray", bytearray(b"x" * 10_000))
+        writer.set("oob_mixed", {"small": 1, "raw": bytearray(b"yz" * 1000)})
+        writer.set("oob_bytes", b"in-band")
+        assert writer.shm_sync(shm_name, serialize_format="pickle").success
+
+        assert reader.shm_connect(shm_name).success
+        assert reader.shm_update(shm_name, serialize_format="pickle").success
+        assert reader.get("oob_bytearray").data == bytearray(b"x" * 10_000)
+        assert reader.get("oob_mixed").data == {"small": 1, "raw": bytearray(b"yz" * 1000)}
+        assert reader.get("oob_bytes").data == b"in-band"
+        reader.get("oob_bytearray").data[0] = ord("a")  # restored values must not alias the segment
+        assert reader.shm_close(shm_name, close_only=True).success
+        assert writer.shm_close(shm_name).success
+
+    def test_shm_update_pickle_layout_checks(self, setup_module):
+        """Test pickle updates read segments without an out-of-band table and reject corrupted layouts cleanly"""
+        import pickle, struct
+        writer, reader = GlobalVars(), GlobalVars()
+        shm_name = "test_shm_pickle_layout"
+        assert writer.shm_gen(name=shm_name, size=4096, create_lock=False).success
+        shm = writer.shm_get(shm_name).data
+        try:
+            # pre-series layout: length header and pickle stream only, leftover bytes after it
+            shm.buf[:4096] = b"\xff" * 4096
+            payload = pickle.dumps({"legacy_var": [1, 2, 3]})
+            shm.buf[:8] = struct.pack("Q", len(payload))
+            shm.buf[8:8 + len(payload)] = payload
+            assert reader.shm_connect(shm_name).success
+            assert reader.shm_update(shm_name, serialize_format="pickle").success
+            assert reader.get("legacy_var").data == [1, 2, 3]
+
+            # json segment read as pickle: a clean deserialization error, not a struct error
+            writer.set("json_var", 1)
+            assert writer.shm_sync(shm_name, serialize_format="json").success
+            wrong_format = reader.shm_update(shm_name, serialize_format="pickle")
+            assert not wrong_format.success and "Unpickling error" in wrong_format.error
+
+            # header claiming more data than the segment holds
+            shm.buf[:8] = struct.pack("Q", 1 << 60)
+            corrupted = reader.shm_update(shm_name, serialize_format="pickle")
+            assert not corrupted.success and "not written by shm_sync or is corrupted" in corrupted.error
+            assert reader.shm_close(shm_name, close_only=True).success
+        finally:
+            writer.shm_close(shm_name)
+
     def test_shm_get(self, setup_module):
         """Test getting shared memory object"""
         _, _, global_vars = setup_module
@@ -606,6 +910,74 @@ class TestSharedMemory:
             except:
                 pass
     
+    def test_shm_cache_lru_eviction(self, setup_module):
+        """Test the shared memory cache evicts the least recently used entry"""
+        global_vars = GlobalVars(shared_memory_cache_max_size=2)
+        names = ["test_lru_a", "test_lru_b", "test_lru_c"]
+        try:
+            for name in names[:2]:
+                assert global_vars.shm_gen(name=name, size=128, create_lock=False).success
+            assert global_vars.shm_cache_management("test_lru_a", None).success  # touch a, so b is now oldest
+            assert global_vars.shm_gen(name="test_lru_c", size=128, create_lock=False).success
+            assert list(global_vars.__shm_cache__) == ["test_lru_a", "test_lru_c"]
+            assert global_vars.shm_get("test_lru_a").success  # cache hits refresh recency too
+            assert list(global_vars.__shm_cache__) == ["test_lru_c", "test_lru_a"]
+
+            assert not global_vars.shm_cache_management("not_cached", None).success
+        finally:
+            for name in names:
+                global_vars.shm_close(name)
+    
+    def test_shm_cache_batch_eviction(self, setup_module):
+        """Test a full shared memory cache evicts a tenth of its capacity at once and closes the evicted segments"""
+        global_vars = GlobalVars(shared_memory_cache_max_size=20)
+        names = [f"test_batch_lru_{index}" for index in range(21)]
+        try:
+            for name in names[:20]:
+                assert global_vars.shm_gen(name=name, size=128, create_lock=False).success
+            evicted = [global_vars.__shm_cache__[name] for name in names[:2]]
+            assert global_vars.shm_gen(name=names[20], size=128, create_lock=False).success
+            assert list(global_vars.__shm_cache__) == names[2:]
+            assert all(shm.buf is None for shm in evicted), "Evicted segments should be closed"
+        finally:
+            for name in names:
+                global_vars.shm_close(name)
+
+    def test_shm_get_closes_evicted_outside_lock(self, setup_module):
+        """Test segments evicted when shm_get opens a new one are closed after the lock is released"""
+        global_vars = GlobalVars(shared_memory_cache_max_size=1)
+        writer = GlobalVars()
+        lock = global_vars.lock()
+        lock_free_on_close = []
+
+        def probe_lock():
+            # another thread can only take the RLock if no thread holds it
+            acquired = lock.acquire(False)
+            if acquired:
+                lock.release()
+            lock_free_on_close.append(acquired)
+
+        try:
+            assert global_vars.shm_gen(name="test_evict_outside_a", size=128, create_lock=False).success
+            assert writer.shm_gen(name="test_evict_outside_b", size=128, create_lock=False).success
+            evicted = global_vars.__shm_cache__["test_evict_outside_a"]
+            close = evicted.close
+            def close_and_probe():
+                probe = threading.Thread(target=probe_lock)
+                probe.start()
+                probe.join()
+                close()
+            evicted.close = close_and_probe
+
+            assert global_vars.shm_get("test_evict_outside_b").success
+            assert list(global_vars.__shm_cache__) == ["test_evict_outside_b"]
+            assert lock_free_on_close == [True], "Evicted segment was closed while the lock was held"
+            assert evicted.buf is None
+        finally:
+            global_vars.shm_close("test_evict_outside_b", close_only=True)
+            writer.shm_close("test_evict_outside_b")
+            global_vars.shm_close("test_evict_outside_a")
+
     def test_shm_lock_method(self, setup_module):
         """Test the lock() method for GlobalVars"""
         _, _, global_vars = setup_module
@@ -679,6 +1051,14 @@ class TestSharedMemoryFailures:
         
         global_vars.shm_close(shm_name)
     
+    def test_shm_connect_nonexistent(self, setup_module):
+        """Test connecting to missing shared memory fails without registering the name"""
+        global_vars = GlobalVars()
+        result = global_vars.shm_connect("test_shm_connect_missing")
+        assert not result.success and result.error == "FileNotFoundError"
+        assert "test_shm_connect_missing" not in global_vars.__shm_name__
+        assert "test_shm_connect_missing" not in global_vars.__shm_cache__
+
     def test_shm_close_nonexistent(self, setup_module):
         """Test closing nonexistent shared memory"""
         _, _, global_vars = setup_module
@@ -754,6 +1134,62 @@ class TestUtilsMethods:
         result = utils.insert_at_intervals([1, 2, 3], -1, 'X')
         assert not result.success, "Negative interval should fail"
 
+    def test_insert_at_intervals_layout(self, setup_module):
+        """Test insert_at_intervals inserts before every group of `interval` elements"""
+        utils, _, _ = setup_module
+
+        assert utils.insert_at_intervals(list(range(1, 10)), 3, 'X').data == ['X', 1, 2, 3, 'X', 4, 5, 6, 'X', 7, 8, 9]
+        assert utils.insert_at_intervals(list(range(1, 10)), 3, 'X', at_start=False).data == [1, 2, 3, 'X', 4, 5, 6, 'X', 7, 8, 9]
+        assert utils.insert_at_intervals("abcdefghi", 3, '-', at_start=False).data == "abc-def-ghi"
+        assert utils.insert_at_intervals("ab", 3, '-', at_start=False).data == "ab"
+
+    def test_insert_at_intervals_list_matches_reference(self, setup_module):
+        """Test both list strategies (strided slices and chunk appends) against a simple reference"""
+        utils, _, _ = setup_module
+
+        def reference(data, interval, insert, at_start):
+            result = []
+            for i, item in enumerate(data):
+                if (i - (0 if at_start else interval)) % interval == 0 and (at_start or i >= interval):
+                    result.append(insert)
+                result.append(item)
+            return result
+
+        data = list(range(23))
+        for interval in (1, 2, 4, 5, 11, 22, 23, 50):
+            for at_start in (True, False):
+                assert utils.insert_at_intervals(data, interval, None, at_start).data == reference(data, interval, None, at_start), (interval, at_start)
+
+    def test_insert_at_intervals_bytes(self, setup_module, monkeypatch):
+        """Test insert_at_intervals with bytes, with and without NumPy"""
+        utils, _, _ = setup_module
+        from tbot223_core.Utils import Utils as utils_module
+
+        for np_module in (utils_module.np, None):
+            monkeypatch.setattr(utils_module, "np", np_module)
+            assert utils.insert_at_intervals(b"abcdefgh", 3, b'-').data == b"-abc-def-gh"
+            assert utils.insert_at_intervals(bytearray(b"abcdefgh"), 3, ord('-'), at_start=False).data == bytearray(b"abc-def-gh")
+            assert utils.insert_at_intervals(b"abcdefgh", 3, b'::').data == b"::abc::def::gh"
+
+        result = utils.insert_at_intervals(b"abcdefgh", 3, 'X')
+        assert not result.success, "Non-bytes insert into bytes should fail"
+
+    def test_insert_at_intervals_interleave_matches_join(self, setup_module):
+        """Test the NumPy interleave path matches the slice join for ASCII strings and bytes"""
+        pytest.importorskip("numpy")
+        utils, _, _ = setup_module
+        join_utils, interleave_utils = Utils(), Utils()
+        join_utils.INTERLEAVE_MIN_INSERTS = float("inf")
+        interleave_utils.INTERLEAVE_MIN_INSERTS = 1
+
+        text = "0123456789abcdef" * 5 + "xyz"
+        for interval in (1, 3, 4, 16, 83, 84):
+            for at_start in (True, False):
+                for data, insert in ((text, "-"), (text.encode(), b"-"), (text + "\u00e9", "-")):
+                    expected = join_utils.insert_at_intervals(data, interval, insert, at_start).data
+                    assert interleave_utils.insert_at_intervals(data, interval, insert, at_start).data == expected, (interval, at_start)
+        assert Utils._interleave(b"abcdefgh", 4, ord("-"), 0) == b"-abcd-efgh"
+
 
 @pytest.mark.usefixtures("setup_module")
 class TestHashingFailures:
@@ -790,6 +1226,75 @@ class TestHashingFailures:
         assert result.success, "Empty string should be hashable"
         assert len(result.data) > 0, "Hash should not be empty"
 
+    def test_hashing_bytes_like_data(self, setup_module):
+        """Test hashing with bytes-like data matches hashing the equivalent string"""
+        utils, _, _ = setup_module
+        
+        expected = utils.hashing("test_data", algorithm="sha256").data
+        for data in (b"test_data", bytearray(b"test_data"), memoryview(b"test_data")):
+            result = utils.hashing(data, algorithm="sha256")
+            assert result.success, f"{type(data).__name__} data should be hashable"
+            assert result.data == expected
+
+    def test_hashing_blake2(self, setup_module):
+        """Test hashing with the BLAKE2 algorithms"""
+        utils, _, _ = setup_module
+        
+        for algorithm in ("blake2b", "blake2s"):
+            result = utils.hashing("test_data", algorithm=algorithm)
+            assert result.success, f"{algorithm} should be supported"
+            assert result.data == hashlib.new(algorithm, b"test_data").hexdigest()
+
+    def test_hashing_raw_digest(self, setup_module):
+        """Test raw=True returns digest bytes for every supported algorithm"""
+        utils, _, _ = setup_module
+
+        assert set(utils._HASH_CONSTRUCTORS) == set(utils.HASHING_ALGORITHMS)
+        for algorithm in utils.HASHING_ALGORITHMS:
+            hex_result = utils.hashing("test_data", algorithm=algorithm)
+            raw_result = utils.hashing("test_data", algorithm=algorithm, raw=True)
+            assert raw_result.success, f"{algorithm} raw digest failed"
+            assert isinstance(raw_result.data, bytes)
+            assert raw_result.data.hex() == hex_result.data
+
+
+    def test_find_keys_by_value_deep_nesting(self, setup_module):
+        """Test nested lookups deeper than the recursion limit keep key order and nested structure"""
+        import sys
+        utils, _, _ = setup_module
+        depth = sys.getrecursionlimit() + 100
+        deep_dict = current = {}
+        for _ in range(depth):
+            current["v"] = 1
+            current["x"] = {}
+            current = current["x"]
+
+        keys = utils.find_keys_by_value(deep_dict, 1, "eq", True, separator=".", return_mod="path").data
+        assert len(keys) == depth
+        assert keys[:2] == ["v", "x.v"]
+
+        nested_tuple = utils.find_keys_by_value({'a': 1, 'b': {'c': 1, 'd': {'e': 1}}, 'f': 1}, 1, "eq", True, separator="tuple").data
+        assert nested_tuple == ('a', ('c', ('e',)), 'f')
+
+    def test_find_keys_by_value_vectorized_matches_loop(self, setup_module):
+        """Test the NumPy fast path returns the same keys as the per-key loop"""
+        pytest.importorskip("numpy")
+        utils, _, _ = setup_module
+        size = utils.VECTORIZED_LOOKUP_MIN_SIZE
+        int_dict = {f"k{i}": i % 7 for i in range(size)}
+        float_dict = {f"f{i}": (i % 7) / 2 for i in range(size)}
+        mixed_dict = {**int_dict, "float": 3.0}  # 'eq' must keep skipping the type mismatch
+        big_dict = {**int_dict, "big": 2 ** 70}  # outside int64, falls back to the loop
+
+        cases = [(int_dict, 3), (float_dict, 1.5), (mixed_dict, 3), (big_dict, 3)]
+        for data, threshold in cases:
+            for comparison in ("eq", "ne", "lt", "le", "gt", "ge"):
+                expected = utils._lookup_dict(data, threshold, getattr(operator, comparison), comparison)
+                result = utils.find_keys_by_value(data, threshold, comparison)
+                assert result.success, result.error
+                assert result.data == expected, f"{comparison} mismatch"
+        assert isinstance(utils.find_keys_by_value(int_dict, 3, "eq", separator="tuple").data, tuple)
+        assert utils._lookup_dict_vectorized(mixed_dict, 3, operator.eq, "eq") is None
 
 @pytest.mark.usefixtures("setup_module")
 class TestPBKDF2Failures:
@@ -892,6 +1397,19 @@ class TestPBKDF2Failures:
         )
         assert not result.success, "Invalid salt hex should fail"
 
+    def test_verify_pbkdf2_invalid_hash_hex(self, setup_module):
+        """Test verify_pbkdf2_hmac with invalid hash hex"""
+        utils, _, _ = setup_module
+        
+        result = utils.verify_pbkdf2_hmac(
+            password="test_password",
+            salt_hex="abc123",
+            hash_hex="not_valid_hex",
+            iterations=100000,
+            algorithm="sha256"
+        )
+        assert not result.success, "Invalid hash hex should fail"
+
 
 @pytest.mark.usefixtures("setup_module")
 class TestStrToPath:
@@ -932,6 +1450,14 @@ class TestStrToPath:
         assert result.success, "Path with special characters should succeed"
         assert isinstance(result.data, Path)
 
+    def test_str_to_path_cached(self, setup_module):
+        """Test repeated strings reuse the parsed Path object"""
+        utils, _, _ = setup_module
+
+        first = utils.str_to_path("cached/path").data
+        assert utils.str_to_path("cached/path").data is first
+        assert utils.str_to_path("other/path").data == Path("other/path")
+
 
 @pytest.mark.usefixtures("setup_module")
 class TestDecoratorUtilsMethods:
@@ -1,40 +1,45 @@
 # external Modules
 import pytest
 from pathlib import Path
-import subprocess
-import sys
 
 # internal Modules
 from SRC import AppCore_test, Exception_test, LogSys_test, Utils_test, FileManager_test, Result_test
 from tbot223_core import FileManager
 
+_TEST_MODULES = (AppCore_test, Exception_test, LogSys_test, Utils_test, FileManager_test, Result_test)
+_PYTEST_BASE_ARGS = ("-p", "no:cacheprovider")
+
+def _run_pytest(*modules, extra_args=()):
+    """Run the given test modules in a single in-process pytest session."""
+    return pytest.main([*(module.__file__ for module in modules), *_PYTEST_BASE_ARGS, *extra_args])
+
 class Test_CoreV2:
     def test_AppCore(self):
-        pytest.main([AppCore_test.__file__, "-m not performance"])
+        _run_pytest(AppCore_test, extra_args=("-m", "not performance"))
 
     def test_Exception(self):
-        pytest.main([Exception_test.__file__])
+        _run_pytest(Exception_test)
 
     def test_LogSys(self):
-        pytest.main([LogSys_test.__file__])
+        _run_pytest(LogSys_test)
 
     def test_Utils(self):
-        pytest.main([Utils_test.__file__])
+        _run_pytest(Utils_test)
 
     def test_FileManager(self):
-        pytest.main([FileManager_test.__file__])
+        _run_pytest(FileManager_test)
     
     def test_Result(self):
-        pytest.main([Result_test.__file__])
+        _run_pytest(Result_test)
 
     def run_all_tests(self, include_performance=False, duration=False):
-        test_path = str(Path(__file__).resolve().parent / "SRC")
-        args = [sys.executable, "-m", "pytest", test_path, "-v"] # avoid pytest invocation issues on some systems
+        # One session for every module: plugins load and collection run only once
+        args = ["-v"]
         if not include_performance:
-            args.extend(["-m", "not performance"])
+            args += ("-m", "not performance")
         if duration:
-            args.extend(["--durations=10"])
-        subprocess.run(args)
+            args.append("--durations=10")
+        return _run_pytest(*_TEST_MODULES, extra_args=args)
 
 if __name__ == "__main__":
     def verify_input(prompt, valid_responses):
@@ -53,9 +58,11 @@ if __name__ == "__main__":
     tester.run_all_tests(include_performance=include_performance, duration=duration)
     if log_del == 'y':
         log_dir = Path(__file__).resolve().parent / "SRC" / "logs"
-        with FileManager(is_logging_enabled=False) as FM:
-            if log_dir.exists() and log_dir.is_dir():
-                for item in log_dir.iterdir():
-                    FM.delete_directory(item)
-            else:
-                print(f"No log directory found at: {log_dir}")
+        if log_dir.is_dir():
+            # One rmtree over the whole log directory (scandir + fd-relative unlinks), then restore the empty directory
+            with FileManager(is_logging_enabled=False) as FM:
+                FM.delete_directory(log_dir)
+            log_dir.mkdir(parents=True, exist_ok=True)
+            print(f"Cleared logs in: {log_dir}")
+        else:
+            print(f"No log directory found at: {log_dir}")
@@ -1,6 +1,12 @@
 from pathlib import Path
 from tbot223_core import AppCore
 import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if __name__ == "__main__":
     # Define base directory and language directory
@@ -38,9 +44,19 @@ if __name__ == "__main__":
     LANG_DIR.mkdir(parents=True, exist_ok=True)
 
     # Write language files
+    # Serialize each file to one UTF-8 blob and write it with a single unbuffered os.write
     for lang_code, files in LANG_FILES.items():
-        with open(LANG_DIR / f"{lang_code}.json", "w", encoding="utf-8") as f:
-            json.dump(files, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            data = orjson.dumps(files, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(files, ensure_ascii=False).encode("utf-8")
+        fd = os.open(LANG_DIR / f"{lang_code}.json", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
     # Initialize AppCore
     ap = AppCore(is_logging_enabled=True, base_dir=BASE_DIR)
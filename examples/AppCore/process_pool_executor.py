@@ -34,4 +34,27 @@ if __name__ == "__main__":
         else:
             print(f"task {idx} :{res.error}")
 
+    # Vector mode: each worker divides a whole NumPy chunk, so pickling happens once per chunk instead of once per task
+    # (requires numpy, an optional dependency; the demo is skipped when it is not installed)
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+        print("numpy is not installed, skipping the vector mode demo")
+
+    if np is not None:
+        ns = np.arange(1, TASK_COUNT + 1)
+        ms = np.arange(TASK_COUNT) * 2
+        vector_results = ap.process_pool_executor(data=(np.divide, (ns, ms)), workers=2, timeout=1, chunk_size=512, vector=True)
+
+        # Division by zero does not raise in vector mode; it shows up as a non-finite value instead
+        if vector_results.success:
+            for idx in np.flatnonzero(~np.isfinite(vector_results.data)):
+                print(f"vector task {idx} : division by zero")
+        else:
+            print(vector_results.error)
+
+    # Release the worker processes kept alive between process_pool_executor calls
+    ap.shutdown_pool()
+
     print("\n -------------- \n TEST COMPLETE \n -------------- \n")
\ No newline at end of file
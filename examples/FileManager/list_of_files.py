@@ -10,10 +10,9 @@ if __name__ == "__main__":
 
     # sample file path
     sample_dir = BASE_DIR / "SampleDir"
-    for i in range(5):
-        fm.atomic_write(sample_dir / f"file_{i}.txt", f"This is sample file {i}.")
-    for i in range(3):
-        fm.atomic_write(sample_dir / f"document_{i}.doc", f"This is sample document {i}.")
+    sample_files = {sample_dir / f"file_{i}.txt": f"This is sample file {i}." for i in range(5)}
+    sample_files.update({sample_dir / f"document_{i}.doc": f"This is sample document {i}." for i in range(3)})
+    fm.atomic_write_many(sample_files)
 
     # List files in the directory
     files = fm.list_of_files(sample_dir)
@@ -40,8 +40,7 @@ if __name__ == "__main__":
     read_pretty_data = fm.read_json("pretty_user_data.json").data
     print("Read back pretty data:", read_pretty_data)
 
-    # Cleanup: remove the created files
-    fm.delete_file("user_data.json")
-    fm.delete_file("pretty_user_data.json")
+    # Cleanup: remove the created files in one batch
+    fm.delete_files(["user_data.json", "pretty_user_data.json"])
 
     print("\n -------------- \n TEST COMPLETE \n -------------- \n")
\ No newline at end of file
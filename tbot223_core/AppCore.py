@@ -6,13 +6,50 @@ from typing import Any, Callable, List, Dict, Tuple, Union, Optional, Generator
 import math
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import logging
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 #internal Modules
 from tbot223_core.Result import Result
 from tbot223_core.Exception import ExceptionTracker
 from tbot223_core.FileManager import FileManager
-from tbot223_core.LogSys import LoggerManager, Log
+from tbot223_core.LogSys import LoggerManager, Log, _flush_buffered_handlers
+
+def _enable_virtual_terminal() -> bool:
+    """
+    Enable ANSI escape sequence processing for the console.
+
+    Returns:
+        bool: True if the console accepts ANSI escape sequences, False otherwise.
+    """
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11) # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004)) # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        return False
+
+_VT_SUPPORTED = _enable_virtual_terminal()
+
+def _vector_worker(func: Callable[ ... , Any], arrays: Tuple) -> Any:
+    """
+    Apply a vectorized function to one chunk of arrays inside a worker process.
+
+    - Floating point errors (e.g. division by zero) are not raised; they produce inf/nan in the output instead.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return func(*arrays)
 
 class AppCore:
     """
@@ -34,6 +71,9 @@ class AppCore:
 
         process_pool_executor(data, workers, override, timeout) -> Result:
             Execute functions in parallel using ProcessPoolExecutor.
+
+        shutdown_pool() -> Result:
+            Shut down the persistent process pool used by process_pool_executor.
         
         get_text_by_lang(key, lang) -> Result:
             Retrieve localized text for the given key and language.
@@ -47,6 +87,8 @@ class AppCore:
         restart_application() -> Result:
             Restart the current application. ( Returns Only On Failure )
     """
+
+    ANSI_CLEAR_SCREEN = "\x1b[2J\x1b[H"
     
     def __init__(self, is_logging_enabled: bool=True, is_debug_enabled: bool=False, default_lang: str="en",
                  base_dir: Union[str, Path]=None,
@@ -74,6 +116,8 @@ class AppCore:
         self._file_manager  = filemanager or FileManager(is_logging_enabled=False, base_dir=self._PARENT_DIR)
         
         # Initialize internal variables
+        self._process_pool = None
+        self._process_pool_workers = None
         self._lang_cache = {}
         self._default_lang = default_lang
         self._supported_langs_getter = lambda self: self._file_manager.list_of_files(self._LANG_DIR, extensions=['.json'], only_name=True).data
@@ -146,8 +190,9 @@ class AppCore:
         """
         results = [None] * len(data)
 
-        executor_type = ThreadPoolExecutor if type == 'thread' else ProcessPoolExecutor
-        with executor_type(max_workers=workers) as executor:
+        executor = ThreadPoolExecutor(max_workers=workers) if type == 'thread' else self._get_process_pool(workers)
+        future_to_task = {}
+        try:
             future_to_task = {executor.submit(func, **params): idx for idx, (func, params) in enumerate(data)}
 
             for future in as_completed(future_to_task, timeout=timeout * len(future_to_task)):
@@ -158,15 +203,65 @@ class AppCore:
                 except Exception as e:
                     if self.__is_logging_enabled__:
                         self.log.log_message("ERROR", f"Error executing task at index {idx}: {str(e)}")
+                    if isinstance(e, BrokenProcessPool):
+                        self.shutdown_pool()
                     results[idx] = self._exception_tracker.get_exception_return(e, params=data[idx][1])
-                    
-            try:
-                executor.shutdown(wait=True)
-            except Exception as e:
-                if self.__is_logging_enabled__:
-                    self.log.log_message("ERROR", f"Error during executor shutdown: {str(e)}")
+        finally:
+            if type == 'thread':
+                try:
+                    executor.shutdown(wait=True)
+                except Exception as e:
+                    if self.__is_logging_enabled__:
+                        self.log.log_message("ERROR", f"Error during executor shutdown: {str(e)}")
+            else:
+                # The process pool outlives this call; drop tasks that have not started (e.g. after a timeout).
+                # Tasks already running cannot be cancelled and would keep their workers, so the pool is discarded
+                stuck = [future for future in future_to_task if not future.cancel() and not future.done()]
+                if stuck:
+                    if self.__is_logging_enabled__:
+                        self.log.log_message("WARNING", f"{len(stuck)} process pool task(s) still running; discarding the pool.")
+                    self._discard_process_pool()
         return results
+
+    def _get_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Return the persistent process pool, creating it (or recreating it for a different worker count) on demand.
+
+        Args:
+            workers : Number of worker processes.
+
+        Returns:
+            The ProcessPoolExecutor shared by process_pool_executor calls.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> pool = app_core._get_process_pool(workers=4)
+        """
+        if self._process_pool is not None and self._process_pool_workers != workers:
+            self.shutdown_pool()
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=workers)
+            self._process_pool_workers = workers
+        return self._process_pool
     
+    def _discard_process_pool(self) -> None:
+        """
+        Drop the persistent process pool without waiting for it.
+
+        - Used when tasks are still running after a timeout: they cannot be cancelled, and a plain
+          shutdown would wait for them. The next process_pool_executor call creates a fresh pool.
+        - Tasks that overran their timeout keep running in the old pool's workers until they finish;
+          the workers exit afterwards.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> app_core._discard_process_pool()
+        """
+        pool, self._process_pool, self._process_pool_workers = self._process_pool, None, None
+        if pool is None:
+            return
+        pool.shutdown(wait=False, cancel_futures=True)
+
     def _chunk_list(self, data_list: List, chunk_size: int) -> Generator[List, None, None]:
         """
         Helper method to split a list into smaller chunks.
@@ -187,6 +282,62 @@ class AppCore:
         for i in range(0, len(data_list), chunk_size):
             yield data_list[i:i + chunk_size]
 
+    def _vector_process_pool_executor(self, data: Tuple[Callable[ ... , Any], Tuple], workers: int, override: bool, timeout: float, chunk_size: Optional[int]) -> Result:
+        """
+        Vector mode of process_pool_executor. Each worker receives whole array chunks instead of single tasks.
+
+        Args:
+            data : Tuple of (function, arrays), where arrays is a tuple of equal-length 1-D array-likes passed positionally to the function.
+            workers : Number of worker processes.
+            override : If True, allows workers to exceed the number of chunks.
+            timeout : Maximum time to wait for each chunk to complete.
+            chunk_size : Number of elements per chunk. If None, the arrays are split evenly across workers.
+
+        Returns:
+            Result object containing the concatenated NumPy array.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, use process_pool_executor(..., vector=True).
+            >>> result = app_core._vector_process_pool_executor((np.add, (a, b)), workers=2, override=False, timeout=10, chunk_size=None)
+        """
+        try:
+            if np is None:
+                raise ImportError("vector mode requires numpy")
+            if not (isinstance(data, tuple) and len(data) == 2 and callable(data[0]) and isinstance(data[1], (tuple, list)) and len(data[1]) > 0):
+                raise ValueError("vector data must be a tuple of (function, arrays)")
+            func, arrays = data[0], tuple(np.asarray(array) for array in data[1])
+            length = len(arrays[0])
+            if length == 0 or any(array.ndim != 1 or len(array) != length for array in arrays):
+                raise ValueError("arrays must be non-empty 1-D arrays of equal length")
+            if workers is None or not isinstance(workers, int) or workers <= 0:
+                raise ValueError("workers must be a positive integer")
+            if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+                raise ValueError("chunk_size must be a positive integer")
+            computed_chunk = chunk_size if chunk_size is not None else max(1, int(math.ceil(length / workers)))
+
+            tasks = [(_vector_worker, {"func": func, "arrays": tuple(array[i:i + computed_chunk] for array in arrays)})
+                     for i in range(0, length, computed_chunk)]
+            # ceil(length / workers) can yield fewer chunks than workers (e.g. 10 elements on 8 workers -> 5 chunks)
+            workers = min(workers, len(tasks))
+            is_valid, error_message = self._check_executable(tasks, workers, override, timeout, chunk_size)
+            if not is_valid:
+                if self.__is_logging_enabled__:
+                    self.log.log_message("ERROR", f"Process pool executor validation failed: {error_message}")
+                return Result(False, error_message, None, None)
+            workers = min(workers or os.cpu_count(), os.cpu_count()) if override else workers
+            chunk_results = self._generic_executor(tasks, workers, timeout, type='process')
+            for chunk_result in chunk_results:
+                if not chunk_result.success:
+                    return chunk_result
+
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Process pool executor completed {length} elements in {len(tasks)} vector chunks.")
+            return Result(True, None, None, np.concatenate([chunk_result.data for chunk_result in chunk_results]))
+        except Exception as e:
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Error in vector process pool executor: {str(e)}")
+            return self._exception_tracker.get_exception_return(e)
+
     @staticmethod
     def __lang_cache_management__(func):
         """
@@ -266,26 +417,39 @@ class AppCore:
                 self.log.log_message("ERROR", f"Error in thread pool executor: {str(e)}")
             return self._exception_tracker.get_exception_return(e)
 
-    def process_pool_executor(self, data: List[Tuple[Callable[ ... , Any], Dict]], workers: int = os.cpu_count(), override: bool = False, timeout: float = None, chunk_size: Optional[int] = None) -> Result:
+    def process_pool_executor(self, data: Union[List[Tuple[Callable[ ... , Any], Dict]], Tuple[Callable[ ... , Any], Tuple]], workers: int = os.cpu_count(), override: bool = False, timeout: float = None, chunk_size: Optional[int] = None, vector: bool = False) -> Result:
         """
         Execute functions in parallel using ProcessPoolExecutor.
 
+        - The worker pool is created on first use and reused by later calls with the same worker count. Call shutdown_pool() to release it.
+        - Tasks that overrun the timeout cannot be stopped: they keep running until they finish, and later calls use a fresh pool.
+
         Args:
             data : List of tuples, Each containing a function and a dictionary of arguments. Example: [(func1, {'arg1': val1}), (func2, {'arg2': val2})]
             workers : Number of worker processes to use. Defaults to os.cpu_count().
             override : If True, allows workers to exceed the number of tasks. also limits is unlocked.
             timeout : Maximum time to wait for each function to complete. ( 0.1 seconds minimum )
             chunk_size : Number of tasks to submit at once to each worker process. If None, it will be calculated based on the number of workers and total tasks.
+                In vector mode, the number of elements in each array chunk.
+            vector : If True, data is a single (func, arrays) tuple. The arrays are split into chunks and each worker applies func to whole NumPy chunks. (requires numpy)
 
         Returns:
             indexed list of Result objects corresponding to each function execution.
+            In vector mode, a single NumPy array with the concatenated output of every chunk.
 
         Example:
             >>> data = [(func1, {'arg1': val1}), (func2, {'arg2': val2})]
             >>> result = app_core.process_pool_executor(data, workers=4, override=False, timeout=10)
             >>> for res in result.data:
             >>>     print(res.success, res.data)
+            >>>
+            >>> # Vector mode: one pickled chunk per worker instead of one task per element
+            >>> ns, ms = np.arange(1, 5001), np.arange(5000) * 2
+            >>> result = app_core.process_pool_executor((np.divide, (ns, ms)), workers=2, timeout=10, vector=True)
+            >>> print(result.data)  # [inf, 1.0, 0.75, ...]
         """
+        if vector:
+            return self._vector_process_pool_executor(data, workers, override, timeout, chunk_size)
         try:
             is_valid, error_message = self._check_executable(data, workers, override, timeout, chunk_size)
             if not is_valid:
@@ -308,6 +472,32 @@ class AppCore:
                 self.log.log_message("ERROR", f"Error in process pool executor: {str(e)}")
             return self._exception_tracker.get_exception_return(e)
         
+    def shutdown_pool(self) -> Result:
+        """
+        Shut down the persistent process pool used by process_pool_executor.
+
+        - The next process_pool_executor call creates a new pool.
+        - Call this before exiting if process_pool_executor was used, so worker processes are joined cleanly.
+
+        Returns:
+            Result object indicating success or failure of the operation.
+
+        Example:
+            >>> results = app_core.process_pool_executor(data, workers=4, timeout=10)
+            >>> app_core.shutdown_pool()
+        """
+        try:
+            pool, self._process_pool, self._process_pool_workers = self._process_pool, None, None
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+                if self.__is_logging_enabled__:
+                    self.log.log_message("INFO", "Process pool shut down.")
+            return Result(True, None, None, "Process pool shut down.")
+        except Exception as e:
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Error in shutdown_pool: {str(e)}")
+            return self._exception_tracker.get_exception_return(e)
+
     @__lang_cache_management__
     def get_text_by_lang(self, key: str, lang: str) -> Result:
         """
@@ -362,6 +552,9 @@ class AppCore:
         """
         Clear the console screen using the appropriate command based on the operating system.
 
+        - If stdout is a terminal that supports ANSI escape sequences, the screen is cleared by writing them directly.
+        - Otherwise, falls back to the 'cls' or 'clear' shell command.
+
         Returns:
             Result object indicating success or failure of the operation.
 
@@ -369,8 +562,12 @@ class AppCore:
             >>> result = app_core.clear_console() # then console is cleared
         """
         try:
-            command = 'cls' if os.name == 'nt' else 'clear'
-            subprocess.run(command, shell=True, check=True)
+            if _VT_SUPPORTED and sys.stdout.isatty():
+                sys.stdout.write(self.ANSI_CLEAR_SCREEN)
+                sys.stdout.flush()
+            else:
+                command = 'cls' if os.name == 'nt' else 'clear'
+                subprocess.run(command, shell=True, check=True)
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", "Console cleared successfully.")
@@ -424,6 +621,8 @@ class AppCore:
                 self.log.log_message("INFO", "Restarting application.")
             if pause:
                 input("Press Enter to restart...")
+            # execl replaces the process without running logging.shutdown(), so write buffered records first
+            _flush_buffered_handlers()
             os.execl(python, python, * sys.argv)
         except Exception as e:
             if self.__is_logging_enabled__:
@@ -501,6 +700,9 @@ class AppCore:
                 self.log.log_message("ERROR", f"Error in safe_CLI_input: {str(e)}")
             return self._exception_tracker.get_exception_return(e)
         
+# Results are immutable, so every wrapped call that returns None can share one instance
+_SUCCESS_EMPTY = Result(True, None, None, None)
+
 class ResultWrapper:
     """
     A decorator class that ensures the return value of an existing function is wrapped in a Result object.
@@ -508,8 +710,12 @@ class ResultWrapper:
     - DO NOT use ExceptionTrackerDecorator with ResultWrapper, as ResultWrapper already handles exceptions.
     - if the decorated function already returns a Result object, it will be returned as is.
     - If an exception occurs during the function execution, it will be caught and a Result object indicating failure will be returned.
+    - If safe is True, the function is trusted not to raise: exceptions are not caught and propagate to the caller.
     - Use for Non-critical functions where you want to ensure a Result object is always returned.
 
+    Args:
+        safe : If True, skip exception handling on every call. Defaults to False.
+
     Example:
         >>> @ResultWrapper()
         >>> def my_function(x, y):
@@ -518,18 +724,31 @@ class ResultWrapper:
         >>> print(result.success)  # Output: True
         >>> print(result.data)     # Output: 15
     """
-    def __init__(self):
-        pass
+    def __init__(self, safe: bool=False):
+        self._safe = safe
+        self._exception_tracker = ExceptionTracker()
 
     def __call__(self, func: Callable[..., Any]) -> Result:
+        if self._safe:
+            def safe_wrapper(*args, **kwargs) -> Result:
+                result = func(*args, **kwargs)
+                if result is None:
+                    return _SUCCESS_EMPTY
+                if isinstance(result, Result):
+                    return result
+                return Result(True, None, None, result)
+            return safe_wrapper
+
+        tracker = self._exception_tracker
         def wrapper(*args, **kwargs) -> Result:
             try:
                 result = func(*args, **kwargs)
+                if result is None:
+                    return _SUCCESS_EMPTY
                 if isinstance(result, Result):
                     return result
                 
                 return Result(True, None, None, result)
             except Exception as e:
-                tracker = ExceptionTracker()
                 return tracker.get_exception_return(error=e, params=(args, kwargs))
-        return wrapper
\ No newline at end of file
+        return wrapper
@@ -1,14 +1,125 @@
 # external modules
 import sys
 import os
-import platform
 import time
 import traceback
-from typing import Any, Tuple
+import threading
+import logging
+import reprlib
+from functools import cache, lru_cache, wraps
+from typing import Any, Optional, Tuple
 
 # internal modules
 from tbot223_core.Result import Result
 
+@cache
+def _get_system_info() -> dict:
+    """
+    Collect system information for exception reports.
+
+    - Cached: platform queries (platform.processor() may spawn a subprocess) run only once per process.
+    - Lazy: platform is imported and queried on first use (the first unmasked exception report), not at import time.
+    - The returned dict is shared by all trackers; reports hold a copy, so callers editing a report cannot change it.
+    - Each platform probe is guarded on its own; a failing one reports "<Unavailable>" and is not retried.
+    - Pass refresh_system_info=True to ExceptionTracker to pick up changes such as a new working directory.
+    """
+    import platform
+
+    def query(func) -> str:
+        # One failing probe (e.g. processor() on a locked-down host) must not lose the other fields
+        try:
+            return func()
+        except Exception:
+            return "<Unavailable>"
+
+    # Safely get current working directory
+    try:
+        cwd = os.getcwd()
+    except Exception:
+        cwd = "<Permission Denied or Unavailable>"
+
+    return {
+        "OS": query(platform.system),
+        "OS_version": query(platform.version),
+        "Release": query(platform.release),
+        "Architecture": query(platform.machine),
+        "Processor": query(platform.processor),
+        "Python_Version": query(platform.python_version),
+        "Python_Executable": sys.executable,
+        "Current_Working_Directory": cwd
+    }
+
+# Failures inside the tracker itself are reported here instead of print(), so applications can route or silence them
+_logger = logging.getLogger(__name__)
+
+def _handling_failure(e: Exception, where: str) -> Result:
+    """
+    Log an exception raised while handling another exception and return the failed Result for it.
+
+    - data keeps the full traceback string, as for any other failed Result of the core modules.
+    """
+    tb_str = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+    _logger.error("An error occurred while handling another exception in %s. This may indicate a critical issue.", where, exc_info=e)
+    return Result(False, f"{type(e).__name__} :{str(e)}", where, tb_str)
+
+# Bounded repr for ExceptionTracker(repr_params=True); long strings and containers are truncated with "..."
+_params_repr = reprlib.Repr()
+_params_repr.maxstring = 200
+_params_repr.maxother = 200
+
+# Placeholder for masked error info fields
+_MASKED = "<Masked>"
+
+# Location string for exceptions that were never raised (no traceback)
+_UNKNOWN_LOCATION = "'Unknown', line -1, in Unknown"
+
+@lru_cache(maxsize=256)
+def _format_location_cached(filename: str, name: str, lineno: int) -> str:
+    """
+    Format "'{file}', line {line}, in {function}", cached per raise site.
+
+    - Keyed on the file name explicitly: code objects compare equal across files when their bodies match.
+    """
+    return f"'{filename}', line {lineno}, in {name}"
+
+def _format_location(code: Any, lineno: int) -> str:
+    """
+    Format "'{file}', line {line}, in {function}" for a code object and line number.
+
+    - Repeated failures of the same (e.g. flaky, decorated) raise site reuse the cached string.
+    """
+    return _format_location_cached(code.co_filename, code.co_name, lineno)
+
+# Sentinel for get_error_code lookups, so codes such as None or 0 are still valid values
+_MISSING = object()
+
+@lru_cache(maxsize=128)
+def _error_code_miss(name: str) -> Result:
+    """
+    Return the failed get_error_code Result for an unmapped exception type name.
+
+    - Result is immutable, so one instance per type name is reused for every miss.
+    """
+    return Result(False, f"KeyError :\"Error type '{name}' not found in error_id_map.\"", "Core.ExceptionTracker.get_error_code, L2", None)
+
+# (second, formatted timestamp) of the last exception report; swapped as one tuple so concurrent readers never see a mismatched pair
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+def _get_timestamp() -> str:
+    """
+    Return the current local time as "%Y-%m-%d %H:%M:%S".
+
+    - Exceptions raised within the same second reuse the already formatted string,
+      so bursts of exceptions do not repeat the localtime()/strftime() calls.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    second, formatted = _timestamp_cache
+    if second != now:
+        formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
 class ExceptionTracker():
     """
     The ExceptionTracker class provides functionality to track location information when exceptions occur and return related information.
@@ -24,26 +135,172 @@ class ExceptionTracker():
 
     4. Predefined Error Code Retrieval: Provides functionality to get a predefined error code based on the exception type.
         - get_error_code: Returns a predefined error code for the exception type.
+
+    Args:
+        - refresh_system_info : If True, re-collect the cached system information (e.g. after changing the working directory). Defaults to False.
+        - repr_params : If True, store params args/kwargs as bounded repr strings instead of the objects themselves,
+            so long-retained failure Results do not keep large caller payloads (e.g. numpy arrays) alive. Defaults to False.
     """
 
-    def __init__(self):
-        # Cache system information
-        # Safely get current working directory
-        try:
-            cwd = os.getcwd()
-        except Exception:
-            cwd = "<Permission Denied or Unavailable>"
-
-        self._system_info = {
-            "OS": platform.system(),
-            "OS_version": platform.version(),
-            "Release": platform.release(),
-            "Architecture": platform.machine(),
-            "Processor": platform.processor(),
-            "Python_Version": platform.python_version(),
-            "Python_Executable": sys.executable,
-            "Current_Working_Directory": cwd
+    def __init__(self, refresh_system_info: bool=False, repr_params: bool=False):
+        # System information is gathered once per process, on first use, and shared by every tracker
+        if refresh_system_info:
+            _get_system_info.cache_clear()
+        self.repr_params = repr_params
+
+    @property
+    def _system_info(self) -> dict:
+        return _get_system_info()
+
+    # internal Methods
+    @staticmethod
+    def _traceback_ends(error: Exception) -> Tuple[Any, Any]:
+        """
+        Walk the traceback of error once and return its first (origin) and last (most recent) entries.
+
+        Args:
+            - error : The exception object.
+
+        Returns:
+            Tuple (first, last) of traceback objects, or (None, None) if the exception was never raised.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> first, last = ExceptionTracker._traceback_ends(error)
+        """
+        first = last = error.__traceback__
+        if last is not None:
+            while last.tb_next is not None:
+                last = last.tb_next
+        return first, last
+
+    @staticmethod
+    def _frame_location(tb: Any) -> dict:
+        """
+        Read the file, line and function of a traceback entry directly, without building FrameSummary objects.
+
+        Args:
+            - tb : A traceback object, or None.
+
+        Returns:
+            dict with "file", "line" and "function" keys. ("Unknown"/-1 if tb is None)
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> ExceptionTracker._frame_location(error.__traceback__)
+            >>> # Output: {'file': 'script.py', 'line': 10, 'function': '<module>'}
+        """
+        if tb is None:
+            return {"file": "Unknown", "line": -1, "function": "Unknown"}
+        code = tb.tb_frame.f_code
+        return {"file": code.co_filename, "line": tb.tb_lineno, "function": code.co_name}
+
+    @staticmethod
+    def _check_info_args(error: Exception, params: Any, mask_tuple: Any) -> Optional[str]:
+        """
+        Validate the arguments of get_exception_info / get_exception_return without raising.
+
+        - Invalid arguments are an expected outcome here, so they are reported as a message instead of an exception,
+          which would allocate a traceback only to be caught again.
+
+        Args:
+            - error : The exception object.
+            - params : (args, kwargs). (None must already be replaced by ((), {}))
+            - mask_tuple : Must be a tuple of exactly 4 booleans.
+
+        Returns:
+            None if the arguments are valid, otherwise a message describing the first invalid one.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> ExceptionTracker._check_info_args(e, ((), {}), (False, False))
+            >>> # Output: "The 'mask_tuple' argument must have exactly 4 boolean values."
+        """
+        if error is None:
+            return "The 'error' argument must be an Exception instance, not None."
+        if not isinstance(params, tuple) or len(params) != 2 or not isinstance(params[0], tuple) or not isinstance(params[1], dict):
+            return "The 'params' argument must be a tuple of (args, kwargs)."
+        # bool cannot be subclassed, so comparing the set of element types equals an isinstance check per element
+        if not isinstance(mask_tuple, tuple) or not set(map(type, mask_tuple)) <= {bool}:
+            return "The 'mask_tuple' argument must be a tuple of booleans."
+        if len(mask_tuple) != 4:
+            return "The 'mask_tuple' argument must have exactly 4 boolean values."
+        return None
+
+    def _build_exception_return(self, error: Exception, user_input: Any, params: Tuple[Tuple, dict], mask_tuple: Tuple[bool, ...]) -> Result:
+        """
+        Build the failed Result of get_exception_return from already validated arguments.
+
+        - Used directly by ExceptionTrackerDecorator, whose params and mask_tuple are valid by construction.
+
+        Args:
+            - error : The exception object.
+            - user_input : User input context related to the exception.
+            - params : (args, kwargs) related to the exception.
+            - mask_tuple : 4 booleans for ("user_input", "params", "traceback", "computer_info").
+
+        Returns:
+            Result: Result(False, "{type} :{message}", location, error_info)
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> result = tracker._build_exception_return(e, None, ((), {}), (False, False, False, False))
+        """
+        location_str, info = self._get_location_and_info(error, user_input, params, mask_tuple)
+        # Reuse the type name and message already computed for the info dict
+        error_detail = info["error"]
+        return Result(False, f"{error_detail['type']} :{error_detail['message']}", location_str, info)
+
+    def _get_location_and_info(self, error: Exception, user_input: Any, params: Tuple[Tuple, dict], mask_tuple: Tuple[bool, ...]) -> Tuple[str, dict]:
+        """
+        Build the location string and the error info dict of an exception with a single traceback walk.
+
+        - Shared by get_exception_info and get_exception_return, so the exception path builds one Result in total.
+        - Arguments are trusted: callers validate them with _check_info_args first (or, like the decorator, build them valid).
+
+        Args:
+            - error : The exception object.
+            - user_input : User input context related to the exception.
+            - params : (args, kwargs) related to the exception.
+            - mask_tuple : 4 booleans for ("user_input", "params", "traceback", "computer_info").
+
+        Returns:
+            Tuple (location, error_info) of the "'{file}', line {line}, in {function}" string and the error info dict.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> location, error_info = tracker._get_location_and_info(e, None, ((), {}), (False, False, False, False))
+        """
+        origin_tb, last_tb = self._traceback_ends(error)
+
+        # Mask decisions are fixed for the whole call, so unpack them once and branch inline
+        mask_input, mask_params, mask_traceback, mask_info = mask_tuple
+
+        error_info = {
+            "success": False,
+            "error":{
+                "type": type(error).__name__,
+                "message": str(error)
+            },
+            "location": self._frame_location(last_tb),  # Most recent frame
+            "origin_location": self._frame_location(origin_tb),  # Original frame
+            "timestamp": _get_timestamp(),
+            "input_context": {
+                "user_input": _MASKED if mask_input else user_input,
+                "params": _MASKED if mask_params else {
+                    "args": _params_repr.repr(params[0]) if self.repr_params else params[0],
+                    "kwargs": _params_repr.repr(params[1]) if self.repr_params else params[1]
+                }
+            },
+            "id": None,  # Reserved for future use (to provide unique IDs for exceptions)
+            # Formatting the traceback is the most expensive part, so it is skipped entirely when masked.
+            # It stays an eager str (not a lazy object) so error info remains JSON-serializable, as documented in README.md
+            "traceback": _MASKED if mask_traceback else ''.join(traceback.format_exception(type(error), error, error.__traceback__)),
+            "computer_info": _MASKED if mask_info else dict(self._system_info)
         }
+        # The location string shares the frame already found for the info dict
+        location = _format_location(last_tb.tb_frame.f_code, last_tb.tb_lineno) if last_tb is not None else _UNKNOWN_LOCATION
+        return location, error_info
 
     # L1 Methods
     def get_exception_location(self, error: Exception) -> Result:
@@ -66,13 +323,15 @@ class ExceptionTracker():
             >>> # Output: 'script.py', line 10, in <module>
         """
         try:
-            tb = traceback.extract_tb(error.__traceback__)
-            frame = tb[-1]  # Most recent frame
-            return Result(True, None, None, f"'{frame.filename}', line {frame.lineno}, in {frame.name}")
+            # Walk the traceback links directly to the most recent frame; no per-frame objects are created
+            tb = error.__traceback__
+            if tb is None:
+                return Result(True, None, None, _UNKNOWN_LOCATION)
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            return Result(True, None, None, _format_location(tb.tb_frame.f_code, tb.tb_lineno))
         except Exception as e:
-            print("An error occurred while handling another exception. This may indicate a critical issue.")
-            tb_str = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
-            return Result(False, f"{type(e).__name__} :{str(e)}", "Core.ExceptionTracker.get_exception_location, L1", tb_str)
+            return _handling_failure(e, "Core.ExceptionTracker.get_exception_location, L1")
 
     def get_exception_info(self, error: Exception, user_input: Any=None, params: Tuple[Tuple, dict]=None, mask_tuple: Tuple[bool, ...] = ()) -> Result:
         """
@@ -84,7 +343,7 @@ class ExceptionTracker():
         Args:
             - error : The exception object to track.
             - user_input : User input context related to the exception. Defaults to None.
-            - params : Additional parameters related to the exception. Defaults to None. expected format: (args, kwargs)
+            - params : Additional parameters related to the exception. Defaults to None (treated as no args/kwargs). expected format: (args, kwargs)
             - mask_tuple : A tuple of booleans indicating which parts of the error information to mask. Defaults to an empty tuple.
 
         Note:
@@ -109,54 +368,14 @@ class ExceptionTracker():
             >>> # Output: ( error_info dict, see Readme.md for structure )
         """
         try:
-            if error is None:
-                raise ValueError("The 'error' argument must be an Exception instance, not None.")
-            if isinstance(params[0], tuple) is False or isinstance(params[1], dict) is False:
-                raise ValueError("The 'params' argument must be a tuple of (args, kwargs).")
-            if not isinstance(mask_tuple, tuple) or not all(isinstance(i, bool) for i in mask_tuple):
-                raise ValueError("The 'mask_tuple' argument must be a tuple of booleans.")
-            if len(mask_tuple) != 4:
-                raise ValueError("The 'mask_tuple' argument must have exactly 4 boolean values.")
-
-            tb = traceback.extract_tb(error.__traceback__)
-            frame = tb[-1]  # Most recent frame
-            frame2 = tb[0]  # Original frame 
-
-            masking = lambda index, return_value: "<Masked>" if mask_tuple[index] else return_value
-
-            error_info = {
-                "success": False,
-                "error":{
-                    "type": type(error).__name__ if error else "UnknownError", 
-                    "message": str(error) if error else "No exception information available"
-                },
-                "location": {
-                    "file": frame.filename if frame else "Unknown",
-                    "line": frame.lineno if frame else -1,
-                    "function": frame.name if frame else "Unknown"
-                },
-                "origin_location": {
-                    "file": frame2.filename if frame2 else "Unknown",
-                    "line": frame2.lineno if frame2 else -1,
-                    "function": frame2.name if frame2 else "Unknown"
-                },                
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
-                "input_context": {
-                    "user_input": masking(0, user_input),
-                    "params": masking(1, {
-                        "args": params[0] if params else (),
-                        "kwargs": params[1] if params else {}
-                    }) 
-                },
-                "id": None,  # Reserved for future use (to provide unique IDs for exceptions)
-                "traceback": masking(2, ''.join(traceback.format_exception(type(error), error, error.__traceback__))),
-                "computer_info": masking(3, self._system_info)
-            }
-            return Result(True, None, None, error_info)
+            if params is None:
+                params = ((), {})
+            invalid = self._check_info_args(error, params, mask_tuple)
+            if invalid is not None:
+                return Result(False, f"ValueError :{invalid}", "Core.ExceptionTracker.get_exception_info, L1", invalid)
+            return Result(True, None, None, self._get_location_and_info(error, user_input, params, mask_tuple)[1])
         except Exception as e:
-            print("An error occurred while handling another exception. This may indicate a critical issue.")
-            tb_str = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
-            return Result(False, f"{type(e).__name__} :{str(e)}", "Core.ExceptionTracker.get_exception_info, L1", tb_str)
+            return _handling_failure(e, "Core.ExceptionTracker.get_exception_info, L1")
     
     # L2 Methods
     def get_exception_return(self, error: Exception, user_input: Any=None, params: Tuple[Tuple, dict]=None, mask_tuple: Tuple[bool, ...]=()) -> Result:
@@ -191,13 +410,17 @@ class ExceptionTracker():
         """
         try:
             effective_mask = mask_tuple if len(mask_tuple) == 4 else (False, False, False, False)
-            return Result(False, f"{type(error).__name__} :{str(error)}", self.get_exception_location(error).data, self.get_exception_info(error, user_input, params, mask_tuple=effective_mask).data)
+            if params is None:
+                params = ((), {})
+            invalid = self._check_info_args(error, params, effective_mask)
+            if invalid is not None:
+                # Invalid arguments: still report the original exception, with the validation message as data
+                return Result(False, f"{type(error).__name__} :{str(error)}", self.get_exception_location(error).data, invalid)
+            return self._build_exception_return(error, user_input, params, effective_mask)
         except Exception as e:
-            print("An error occurred while handling another exception. This may indicate a critical issue.")
-            tb_str = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
-            return Result(False, f"{type(e).__name__} :{str(e)}", "Core.ExceptionTracker.get_exception_return, L2", tb_str)
+            return _handling_failure(e, "Core.ExceptionTracker.get_exception_return, L2")
     
-    def get_error_code(self, error_id_map: dict, error: Exception) -> None:
+    def get_error_code(self, error_id_map: dict, error: Exception) -> Result:
         """
         Function to get a predefined error code based on the exception type.
 
@@ -215,7 +438,7 @@ class ExceptionTracker():
             
         Returns:
             Result: A Result object containing the error code if found.
-                - If the exception type is not found in the error_id_map, returns a Result with success=False and an appropriate error message.
+                - If the exception type is not found in the error_id_map, returns a Result with success=False, an appropriate error message and data None.
 
         Example:
             >>> error_id_map = {
@@ -230,15 +453,30 @@ class ExceptionTracker():
             >>> # Output: 1001
         """
         try:
-            if type(error).__name__ not in error_id_map:
-                raise KeyError(f"Error type '{type(error).__name__}' not found in error_id_map.")
-            else:
-                return Result(True, None, None, error_id_map[type(error).__name__])
+            name = type(error).__name__
+            code = error_id_map.get(name, _MISSING)
+            if code is _MISSING:
+                # An unmapped type is an expected outcome, so report it without raising and formatting a traceback
+                return _error_code_miss(name)
+            return Result(True, None, None, code)
         except Exception as e:
-            print("An error occurred while handling another exception. This may indicate a critical issue.")
-            tb_str = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
-            return Result(False, f"{type(e).__name__} :{str(e)}", "Core.ExceptionTracker.get_error_code, L2", tb_str)
+            return _handling_failure(e, "Core.ExceptionTracker.get_error_code, L2")
         
+# Shared tracker for decorators created without an explicit one; a default ExceptionTracker keeps no mutable state
+_default_tracker = None
+_default_tracker_lock = threading.Lock()
+
+def _get_default_tracker() -> "ExceptionTracker":
+    """
+    Return the process-wide default ExceptionTracker, creating it on first use.
+    """
+    global _default_tracker
+    if _default_tracker is None:
+        with _default_tracker_lock:
+            if _default_tracker is None:
+                _default_tracker = ExceptionTracker()
+    return _default_tracker
+
 class ExceptionTrackerDecorator():
     """
     Decorator for wrapping functions with ExceptionTracker.
@@ -252,7 +490,7 @@ class ExceptionTrackerDecorator():
             - If True, the corresponding detail will be masked. (user_input, params, traceback, computer_info)
             - If False, the detail will be shown.
             - If make mistake in format, defaults to (False, False, False, False).
-        - tracker: An instance of ExceptionTracker to use. If None, a new instance will be created. Defaults to None.
+        - tracker: An instance of ExceptionTracker to use. If None, a shared default instance is used. Defaults to None.
 
     Returns:
         If no exception occurs, returns the original function's return value.
@@ -269,18 +507,35 @@ class ExceptionTrackerDecorator():
         >>> # Output: ((10,), {'y': 0})
     """
     def __init__(self, mask_tuple: Tuple[bool, bool, bool, bool] = (False, False, False, False), tracker: ExceptionTracker=None):
-        self.tracker = tracker or ExceptionTracker()
+        self.tracker = tracker or _get_default_tracker()
         self.mask_tuple = mask_tuple
-        if not isinstance(self.mask_tuple, tuple) or not all(isinstance(i, bool) for i in self.mask_tuple):
-            self.mask_tuple = (False, False, False, False)
-        if len(self.mask_tuple) != 4:
-            self.mask_tuple = (False, False, False, False)
+
+    @property
+    def mask_tuple(self) -> Tuple[bool, bool, bool, bool]:
+        return self._mask_tuple
+
+    @mask_tuple.setter
+    def mask_tuple(self, mask_tuple: Tuple[bool, bool, bool, bool]) -> None:
+        # Validated on every assignment, so a mask changed after decoration is always well-formed
+        if not isinstance(mask_tuple, tuple) or not set(map(type, mask_tuple)) <= {bool}:
+            mask_tuple = (False, False, False, False)
+        if len(mask_tuple) != 4:
+            mask_tuple = (False, False, False, False)
+        self._mask_tuple = mask_tuple
 
     def __call__(self, func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                # Use the tracker to get standardized exception return
-                return self.tracker.get_exception_return(error=e, params=(args, kwargs), mask_tuple=self.mask_tuple)
+                # Use the tracker to get standardized exception return; tracker and mask are read at call time
+                tracker = self.tracker
+                if type(tracker) is ExceptionTracker:
+                    # mask_tuple is validated on assignment and (args, kwargs) is always well-formed, so argument checks are skipped
+                    try:
+                        return tracker._build_exception_return(e, None, (args, kwargs), self._mask_tuple)
+                    except Exception:
+                        pass  # get_exception_return below reports the failure instead of raising it
+                return tracker.get_exception_return(error=e, params=(args, kwargs), mask_tuple=self._mask_tuple)
         return wrapper
\ No newline at end of file
@@ -1,5 +1,5 @@
 #external Modules
-from typing import List, Union, Any, Optional
+from typing import Dict, List, Union, Any, Optional
 from pathlib import Path
 import tempfile
 import json
@@ -7,10 +7,21 @@ import shutil
 import stat
 import os
 import logging
+import re
+import threading
+from collections import OrderedDict
 if os.name != 'nt':
     import fcntl
 else:
     import msvcrt
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 #internal Modules
 from tbot223_core.Result import Result
@@ -18,6 +29,12 @@ from tbot223_core.Exception import ExceptionTracker
 from tbot223_core.LogSys import LoggerManager, Log
 from tbot223_core.Utils.Utils import Utils
 
+# fdatasync skips flushing metadata that is not needed to read the data back (e.g. mtime); not available on Windows/macOS
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# Integers with 20+ digits may exceed 64 bits, which orjson parses as floats
+_LONG_INT_PATTERN = re.compile(rb"\d{20}")
+
 class FileManager:
     """
     The FileManager class provides various file management functionalities such as reading, writing, deleting files and directories, and listing files.
@@ -35,13 +52,16 @@ class FileManager:
         - atomic_write(file_path, data) -> Result:
             Atomically write data to a file.
 
+        - atomic_write_many(files) -> Result:
+            Atomically write several files in one batch.
+
         - read_file(file_path, as_bytes=False) -> Result:
             Read the content of a file.
 
         - write_json(file_path, data, indent=4) -> Result:
             Write JSON serializable data to a file in JSON format.
 
-        - read_json(file_path) -> Result:
+        - read_json(file_path, parser="auto", use_cache=False) -> Result:
             Read JSON content from a file and parse it into a Python object.
 
         - list_of_files(dir_path, extensions=None, only_name=False) -> Result:
@@ -50,6 +70,9 @@ class FileManager:
         - delete_file(file_path) -> Result:
             Delete a file.
 
+        - delete_files(file_paths) -> Result:
+            Delete several files in one batch.
+
         - delete_directory(dir_path) -> Result:
             Delete a directory and all its contents.
 
@@ -60,6 +83,16 @@ class FileManager:
     # File locking threshold: files larger than this size will be locked during read operations
     LOCK_FILE_SIZE_THRESHOLD = 10 * 1024 * 1024  # 10 MB
 
+    # Raw read threshold: files larger than this are read unbuffered in a single fstat-sized read and decoded once
+    RAW_READ_SIZE_THRESHOLD = 1024 * 1024  # 1 MB
+
+    # JSON parsing: simdjson's per-call setup only pays off on larger documents, smaller ones go to orjson/json
+    SIMDJSON_SIZE_THRESHOLD = 16 * 1024  # 16 KB
+    JSON_PARSERS = ("auto", "simdjson", "orjson", "json")
+
+    # read_json(use_cache=True): number of parsed files kept per FileManager, least recently used evicted first
+    JSON_CACHE_SIZE = 128
+
     def __init__(self, is_logging_enabled: bool=True, is_debug_enabled: bool=False,
                  base_dir: Union[str, Path]=None,
                  logger_manager_instance: Optional[LoggerManager]=None, logger: Optional[logging.Logger]=None, 
@@ -74,6 +107,8 @@ class FileManager:
 
         # Initialize classes
         self._exception_tracker = ExceptionTracker()
+        self._json_cache = OrderedDict()
+        self._json_cache_lock = threading.Lock()
         self._logger_manager = None
         self.logger = None
         if self.__is_logging_enabled__:
@@ -156,20 +191,155 @@ class FileManager:
                 msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, os.path.getsize(file.name))
             else:
                 msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, os.path.getsize(file.name))
+
+    @staticmethod
+    def _write_temp_file(dir_path: Path, data: Any) -> Path:
+        """
+        Write data to a new temporary file in dir_path and sync it to disk, using raw fd syscalls.
+
+        - bytes-like data is written as-is; str is encoded as utf-8 with platform newlines, matching a text-mode write.
+        - The temporary file is removed again if writing fails.
+
+        Args:
+            - dir_path : The directory to create the temporary file in.
+            - data : The data to write. (str or bytes-like)
+
+        Returns:
+            Path: The path of the temporary file.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> temp_path = file_manager._write_temp_file(Path("some/directory"), "Hello, World!")
+        """
+        if isinstance(data, str):
+            payload = (data.replace("\n", os.linesep) if os.linesep != "\n" else data).encode("utf-8")
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            payload = data
+        else:
+            raise TypeError(f"data must be str or bytes, not {type(data).__name__}")
+
+        fd, temp_name = tempfile.mkstemp(dir=str(dir_path))
+        try:
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                try:
+                    _fdatasync(fd)
+                except OSError:
+                    pass  # syncing not supported on some platforms/filesystems
+            finally:
+                os.close(fd)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+        return Path(temp_name)
+
+    def _replace_temp_with_target(self, temp_path: Path, target_path: Path):
+        """
+        Replace target_path with temp_path, holding an exclusive lock on the target while renaming (Unix only).
+
+        Args:
+            - temp_path : The temporary file containing the new data.
+            - target_path : The file to replace.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> file_manager._replace_temp_with_target(Path("example.txt.tmp"), Path("example.txt"))
+        """
+        if os.name == 'nt':
+            os.replace(temp_path, target_path)
+            return
+        with open(target_path, "a+b") as f:
+            self._lock(f, 1)
+            try:
+                os.replace(temp_path, target_path)
+            finally:
+                self._lock(f, 0)
+
+    @staticmethod
+    def _fsync_directory(dir_path: Path):
+        """
+        Flush a directory entry to disk so that renames inside it survive a crash. (No-op on Windows)
+
+        Args:
+            - dir_path : The directory to sync.
+
+        Example:
+            >>> file_manager._fsync_directory(Path("some/directory"))
+        """
+        if os.name == 'nt':
+            return
+        fd = os.open(dir_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass  # some filesystems do not support syncing directories
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def _loads_json(cls, raw: bytes, parser: str = "auto") -> Any:
+        """
+        Parse UTF-8 JSON bytes with the requested parser.
+
+        - "auto" uses simdjson for documents of at least SIMDJSON_SIZE_THRESHOLD bytes, otherwise orjson, otherwise json; whichever is installed.
+        - In "auto" mode, documents containing integers beyond 64 bits are parsed by the json module, as the faster parsers would turn them into floats.
+        - Documents a faster parser rejects (e.g. NaN/Infinity literals) are retried with the json module, which also reports real syntax errors.
+
+        Args:
+            - raw : The JSON document as bytes.
+            - parser : One of JSON_PARSERS. Defaults to "auto".
+
+        Returns:
+            The parsed Python object.
+
+        Raises:
+            ValueError: If parser is unknown.
+            ImportError: If the explicitly requested parser is not installed.
+
+        Example:
+            >>> file_manager._loads_json(b'{"key": [1, 2, 3]}')
+            >>> # Output: {'key': [1, 2, 3]}
+        """
+        if parser not in cls.JSON_PARSERS:
+            raise ValueError(f"parser must be one of {cls.JSON_PARSERS}")
+        if parser == "auto":
+            if _LONG_INT_PATTERN.search(raw) is not None:
+                parser = "json"
+            elif simdjson is not None and len(raw) >= cls.SIMDJSON_SIZE_THRESHOLD:
+                parser = "simdjson"
+            elif orjson is not None:
+                parser = "orjson"
+            else:
+                parser = "json"
+        elif (parser == "simdjson" and simdjson is None) or (parser == "orjson" and orjson is None):
+            raise ImportError(f"{parser} is not installed")
+
+        try:
+            if parser == "simdjson":
+                # recursive=True materializes plain dicts/lists, so the result does not depend on the parser's lifetime
+                return simdjson.Parser().parse(raw, recursive=True)
+            if parser == "orjson":
+                return orjson.loads(raw)
+        except ValueError:
+            pass
+        return json.loads(raw)
             
 
     def atomic_write(self, file_path: Union[str, Path], data: Any) -> Result:
         """
         Atomically write "data" to "file_path"
 
-        - If data is bytes, write in binary mode; if str, write in text mode with utf-8 encoding.
+        - If data is bytes-like, write it as-is; if str, write it as utf-8 text with platform newlines.
         - Use a temporary file in the same directory and rename it to ensure atomicity.
+        - The temporary file is written with raw os.write calls and synced with fdatasync where available.
         - Ensure that the parent directory of file_path exists; create it if it does not.
         - Flush and sync data to disk before renaming to minimize data loss risk.
 
         Args:
             - file_path : The path to the file where data will be written.
-            - data : The data to write to the file. Can be str or bytes.
+            - data : The data to write to the file. Can be str or bytes-like.
 
         Returns:
             Result: A Result object indicating success or failure of the write operation.
@@ -181,36 +351,14 @@ class FileManager:
             >>> else:
             >>>     print(f"Write failed: {result.error_message}")
         """
+        temp_path = None
         try:
             file_path = self._str_to_path(file_path)
             if not file_path.parent.exists():
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            is_bytes = isinstance(data, bytes)
-            mode = 'wb' if is_bytes else 'w'
-            encoding = None if is_bytes else 'utf-8'
-
-            def replace_temp_with_target(temp_path: Path, target_path: Path):
-                if os.name == 'nt':
-                    os.replace(temp_path, target_path)
-                    return
-                with open(target_path, "a+b") as f:
-                    self._lock(f, 1)
-                    try:
-                        os.replace(temp_path, target_path)
-                    finally:
-                        self._lock(f, 0)
 
-            with tempfile.NamedTemporaryFile(mode, delete=False, dir=str(file_path.parent), encoding=encoding) as temp:
-                temp_path = Path(temp.name)
-                temp.write(data)
-                temp.flush()
-                try:
-                    os.fsync(temp.fileno())
-                except (AttributeError, OSError):
-                    pass  # os.fsync not available on some platforms
-                temp.close()
-                replace_temp_with_target(temp_path, file_path)
+            temp_path = self._write_temp_file(file_path.parent, data)
+            self._replace_temp_with_target(temp_path, file_path)
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Successfully wrote to {file_path}")
@@ -219,7 +367,7 @@ class FileManager:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to write to {file_path}: {e}")
             try:
-                if os.path.exists(temp_path):
+                if temp_path is not None and os.path.exists(temp_path):
                     os.unlink(temp_path)
                     if self.__is_logging_enabled__:
                         self.log.log_message("INFO", f"Temporary file {temp_path} deleted.")
@@ -227,6 +375,61 @@ class FileManager:
                 if self.__is_logging_enabled__:
                     self.log.log_message("ERROR", f"Failed to delete temporary file {temp_path}: {ex}")
             return self._exception_tracker.get_exception_return(e)
+
+    def atomic_write_many(self, files: Dict[Union[str, Path], Any]) -> Result:
+        """
+        Atomically write several files in one batch.
+
+        - Each file is written atomically as in atomic_write, but the batch as a whole is not: if a rename fails, files renamed before it keep their new content.
+        - All temporary files are written and synced first, then renamed into place, then each parent directory is synced once.
+        - Data types follow atomic_write: bytes-like data is written as-is, str as utf-8 text with platform newlines.
+
+        Args:
+            - files : A mapping of file path to the data to write.
+
+        Returns:
+            Result: A Result object indicating success or failure of the batch write.
+
+        Example:
+            >>> result = file_manager.atomic_write_many({"a.txt": "Hello", "b.bin": b"World"})
+            >>> if result.success:
+            >>>     print("Write successful!")
+            >>> else:
+            >>>     print(f"Write failed: {result.error}")
+        """
+        pending = []
+        try:
+            if not isinstance(files, dict) or len(files) == 0:
+                raise ValueError("files must be a non-empty dict of path to data")
+            targets = [(self._str_to_path(file_path), data) for file_path, data in files.items()]
+            parents = {file_path.parent for file_path, _ in targets}
+            for parent in parents:
+                parent.mkdir(parents=True, exist_ok=True)
+
+            for file_path, data in targets:
+                pending.append((self._write_temp_file(file_path.parent, data), file_path))
+
+            # Renamed temp files no longer exist, so the cleanup below only removes the ones left behind
+            for temp_path, file_path in pending:
+                self._replace_temp_with_target(temp_path, file_path)
+            pending.clear()
+            for parent in parents:
+                self._fsync_directory(parent)
+
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Successfully wrote {len(targets)} files")
+            return Result(True, None, None, f"Successfully wrote {len(targets)} files")
+        except Exception as e:
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to write files: {e}")
+            for temp_path, _ in pending:
+                try:
+                    if os.path.exists(temp_path):
+                        os.unlink(temp_path)
+                except Exception as ex:
+                    if self.__is_logging_enabled__:
+                        self.log.log_message("ERROR", f"Failed to delete temporary file {temp_path}: {ex}")
+            return self._exception_tracker.get_exception_return(e)
         
     def read_file(self, file_path: Union[str, Path], as_bytes: bool=False) -> Result:
         """
@@ -235,6 +438,8 @@ class FileManager:
         - If as_bytes is True, read in binary mode; otherwise, read in text mode with utf-8 encoding.
         - Return the content in the data field of the Result object.
         - Use file locking to ensure safe read operations.
+        - Files larger than RAW_READ_SIZE_THRESHOLD skip the buffered/text layers: they are read unbuffered in one call,
+          then decoded once with the same newline translation as text mode.
 
         Args:
             - file_path : The path to the file to read.
@@ -255,7 +460,8 @@ class FileManager:
 
             mode = 'rb' if as_bytes else 'r'
             encoding = None if as_bytes else 'utf-8'
-            LOCK = (os.path.getsize(file_path) > self.LOCK_FILE_SIZE_THRESHOLD)
+            size = os.path.getsize(file_path)
+            LOCK = (size > self.LOCK_FILE_SIZE_THRESHOLD)
 
             def safe_read(f, lock):
                 if lock:
@@ -267,8 +473,17 @@ class FileManager:
                         self._lock(f, 0)
                 return content
             
-            with open(file_path, mode, encoding=encoding) as f:
-                content = safe_read(f, LOCK)
+            if size > self.RAW_READ_SIZE_THRESHOLD:
+                # FileIO.readall sizes its buffer from fstat, so the whole file arrives without an intermediate buffer copy
+                with open(file_path, 'rb', buffering=0) as f:
+                    content = safe_read(f, LOCK)
+                if not as_bytes:
+                    content = content.decode('utf-8')
+                    if '\r' in content:
+                        content = content.replace('\r\n', '\n').replace('\r', '\n')
+            else:
+                with open(file_path, mode, encoding=encoding) as f:
+                    content = safe_read(f, LOCK)
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Successfully read from {file_path}")
@@ -284,11 +499,14 @@ class FileManager:
 
         - Use atomic_write to ensure atomicity.
         - Pretty-print JSON with specified indentation.
+        - If orjson is installed, it serializes compact (indent 0 or None) and 2-space output; other widths and data orjson rejects use the json module.
+          Note that orjson writes NaN and Infinity as null.
+        - Output is always utf-8 bytes with "\n" line endings; compact output has no spaces after separators, whichever backend is used.
 
         Args:
             - file_path : The path to the file where JSON data will be written.
             - data : The JSON serializable data to write to the file.
-            - indent (int, optional): Number of spaces for indentation in the JSON file. Defaults to 4.
+            - indent (int, optional): Number of spaces for indentation in the JSON file. 0 or None writes compact JSON. Defaults to 4.
         
         Returns:
             Result: A Result object indicating success or failure of the write operation.
@@ -303,7 +521,16 @@ class FileManager:
         """
         try:
             file_path = self._str_to_path(file_path)
-            json_data = json.dumps(data, indent=indent, ensure_ascii=False)
+            json_data = None
+            if orjson is not None and indent in (None, 0, 2):
+                try:
+                    json_data = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+                except TypeError:
+                    pass  # e.g. integers beyond 64 bits; the json module handles these
+            if json_data is None:
+                # Compact output uses the same separators as orjson, so files do not depend on which backend wrote them
+                separators = None if indent else (',', ':')
+                json_data = json.dumps(data, indent=indent or None, separators=separators, ensure_ascii=False).encode('utf-8')
             write_result = self.atomic_write(file_path, json_data)
             if not write_result.success:
                 return write_result
@@ -316,14 +543,21 @@ class FileManager:
                 self.log.log_message("ERROR", f"Failed to write JSON to {file_path}: {e}")
             return self._exception_tracker.get_exception_return(e)
         
-    def read_json(self, file_path: Union[str, Path]) -> Result:
+    def read_json(self, file_path: Union[str, Path], parser: str = "auto", use_cache: bool = False) -> Result:
         """
         Read JSON content from "file_path" and parse it into a Python object
 
         - Return the parsed object in the data field of the Result object.
+        - The optional simdjson and orjson packages are used when installed; see parser.
+        - With use_cache=True, the parsed object is reused while the file is unchanged (same device, inode, mtime and size),
+          so repeated reads of e.g. a config file cost one stat instead of a read and parse.
+          The cached object is shared between calls: do not modify it.
 
         Args:
             - file_path : The path to the JSON file to read.
+            - parser : "auto" (default), "simdjson", "orjson" or "json". "auto" picks simdjson for files of at least
+                SIMDJSON_SIZE_THRESHOLD bytes and orjson for smaller ones, falling back to json.
+            - use_cache : If True, serve unchanged files from the in-memory parse cache. Defaults to False.
 
         Returns:
             Result: A Result object containing the parsed JSON data in the data field.
@@ -342,13 +576,34 @@ class FileManager:
             if file_path.suffix.lower() != '.json':
                 raise ValueError("File extension is not .json")
 
-            read_result = self.read_file(file_path)
+            if parser not in self.JSON_PARSERS:
+                raise ValueError(f"parser must be one of {self.JSON_PARSERS}")
+
+            cache_key = None
+            if use_cache:
+                # atomic_write replaces the file, so a rewrite always changes the inode even within one mtime tick
+                st = os.stat(file_path)
+                cache_key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, parser)
+                with self._json_cache_lock:
+                    if cache_key in self._json_cache:
+                        self._json_cache.move_to_end(cache_key)
+                        return Result(True, None, None, self._json_cache[cache_key])
+
+            # Parse the raw bytes directly; every parser decodes UTF-8 itself
+            read_result = self.read_file(file_path, as_bytes=True)
             if not read_result.success:
                 return read_result
+            parsed = self._loads_json(read_result.data, parser)
+
+            if cache_key is not None:
+                with self._json_cache_lock:
+                    self._json_cache[cache_key] = parsed
+                    while len(self._json_cache) > self.JSON_CACHE_SIZE:
+                        self._json_cache.popitem(last=False)
             
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Successfully read JSON from {file_path}")
-            return Result(True, None, None, json.loads(read_result.data))
+            return Result(True, None, None, parsed)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to read JSON from {file_path}: {e}")
@@ -473,6 +728,57 @@ class FileManager:
                 self.log.log_message("ERROR", f"Failed to delete {file_path}: {e}")
             return self._exception_tracker.get_exception_return(e)
         
+    def delete_files(self, file_paths: List[Union[str, Path]]) -> Result:
+        """
+        Delete every file in "file_paths" in one batch
+
+        - Unlinks directly without a separate exists() check, so each file costs a single syscall.
+        - Logs once for the whole batch instead of once per file.
+        - Every path is attempted; if any could not be deleted, an OSError listing them is raised after the loop.
+
+        Args:
+            - file_paths : List or tuple of paths to the files to delete.
+
+        Returns:
+            Result: A Result object indicating success or failure of the batch delete.
+
+        Example:
+            >>> result = file_manager.delete_files(["user_data.json", "pretty_user_data.json"])
+            >>> if result.success:
+            >>>     print(result.data)
+            >>> else:
+            >>>     print(f"Batch deletion failed: {result.error}")
+            >>> # Output: Successfully deleted 2 files
+        """
+        try:
+            # a str would otherwise be iterated character by character, deleting single-letter relative paths
+            if not isinstance(file_paths, (list, tuple)):
+                raise ValueError("file_paths must be a list or tuple of paths")
+            failed = {}
+            deleted = 0
+            for file_path in file_paths:
+                file_path = self._str_to_path(file_path)
+                try:
+                    try:
+                        os.unlink(file_path)
+                    except PermissionError:
+                        os.chmod(file_path, stat.S_IWRITE)
+                        os.unlink(file_path)
+                    deleted += 1
+                except OSError as e:
+                    failed[str(file_path)] = f"{type(e).__name__}: {e.strerror or e}"
+
+            if failed:
+                raise OSError(f"Failed to delete {len(failed)} file(s): {failed}")
+
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Successfully deleted {deleted} files")
+            return Result(True, None, None, f"Successfully deleted {deleted} files")
+        except Exception as e:
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to delete files: {e}")
+            return self._exception_tracker.get_exception_return(e)
+
     def delete_directory(self, dir_path: Union[str, Path]) -> Result:
         """
         Delete the directory at "dir_path" and all its contents
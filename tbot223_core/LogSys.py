@@ -3,12 +3,137 @@ import os
 from typing import Union, Any, Optional
 from pathlib import Path
 import logging
+import logging.handlers
+import threading
 import time
+import weakref
+from types import MappingProxyType
 
 # internal Modules
 from tbot223_core.Result import Result
 from tbot223_core.Exception import ExceptionTracker
 
+# Level name -> level number for Log.log_message, shared read-only by every Log instance
+_LOG_LEVELS = MappingProxyType({
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+})
+
+# Returned by every successful log_message call; Result is immutable, so one instance is enough
+_LOG_SENT = Result(True, None, None, "Log message sent successfully.")
+
+# Buffered file handlers (MemoryHandler -> flush interval in seconds), flushed by one shared background thread
+_buffered_handlers = weakref.WeakKeyDictionary()
+_flush_lock = threading.Lock()
+_flush_thread = None
+
+def _register_buffered_handler(handler: logging.handlers.MemoryHandler, interval: float) -> None:
+    """
+    Register a MemoryHandler for periodic flushing. The flush thread starts on the first buffered record.
+    """
+    with _flush_lock:
+        _buffered_handlers[handler] = interval
+
+def _start_flush_thread() -> None:
+    """
+    Start the shared flush thread if it is not running in this process.
+    """
+    global _flush_thread
+    with _flush_lock:
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_flush_loop, name="LogSysFlush", daemon=True)
+            _flush_thread.start()
+
+def _flush_loop() -> None:
+    """
+    Flush every registered MemoryHandler at the shortest registered interval.
+    """
+    while True:
+        with _flush_lock:
+            interval = min(_buffered_handlers.values(), default=0.1)
+        time.sleep(interval)
+        with _flush_lock:
+            handlers = list(_buffered_handlers.keys())
+        for handler in handlers:
+            handler.flush()
+        del handlers
+
+def _reset_flush_thread() -> None:
+    """
+    Reset the flush thread state in a forked child. Records buffered by the parent are dropped so they are not written twice.
+
+    - The thread is not started here: a child that never logs (e.g. a multiprocessing worker) never starts one,
+      and one that does starts it on its first buffered record.
+    """
+    global _flush_lock, _flush_thread
+    _flush_lock = threading.Lock()
+    _flush_thread = None
+    for handler in list(_buffered_handlers.keys()):
+        # handler locks are already reinitialized by logging's own at-fork hook
+        handler.acquire()
+        try:
+            handler.buffer.clear()
+        finally:
+            handler.release()
+
+def _flush_buffered_handlers() -> None:
+    """
+    Write every buffered record now. For exits that skip logging.shutdown(), such as os.execl or os._exit.
+    """
+    with _flush_lock:
+        handlers = list(_buffered_handlers.keys())
+    for handler in handlers:
+        handler.flush()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_flush_thread)
+
+class _BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that formats every buffered record and hands them to its FileHandler target as one write.
+
+    - The stock MemoryHandler calls target.handle() per record, which means one write() and one flush() per record.
+    - Records are still filtered by the target's level and filters, and formatted by the target's formatter.
+    - The first record buffered in a process starts the shared flush thread.
+    """
+    def emit(self, record: logging.LogRecord) -> None:
+        if _flush_thread is None:
+            _start_flush_thread()
+        super().emit(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self.target is None or not self.buffer:
+                return
+            target = self.target
+            records, self.buffer = self.buffer, []
+            lines = []
+            for record in records:
+                if record.levelno < target.level or not target.filter(record):
+                    continue
+                try:
+                    lines.append(target.format(record) + target.terminator)
+                except Exception:
+                    target.handleError(record)
+            if not lines:
+                return
+            target.acquire()
+            try:
+                if target.stream is None:
+                    target.stream = target._open()
+                target.stream.write("".join(lines))
+                target.stream.flush()
+            except Exception:
+                target.handleError(records[-1])
+            finally:
+                target.release()
+        finally:
+            self.release()
+
 class LoggerManager:
     """
     Logger Manager class to create and manage logger instances
@@ -16,6 +141,8 @@ class LoggerManager:
     Attributes:
         - base_dir : Base directory for logs.
         - second_log_dir : Subdirectory name within the base log directory.
+        - buffer_capacity : Number of records buffered before they are written to the log file. 0 (default) writes every record immediately.
+        - flush_interval_ms : Buffered records are written at least this often (in milliseconds), even if the buffer is not full.
 
     Methods:
         - make_logger(logger_name, log_level, time) -> Result
@@ -23,13 +150,27 @@ class LoggerManager:
 
         - get_logger(logger_name) -> Result
             Get logger instance by name
+
+        - flush() -> Result
+            Write all buffered log records to their files
     """
-    def __init__(self, base_dir: Union[str, Path]=None, second_log_dir: Union[str, Path]="default"):
+    def __init__(self, base_dir: Union[str, Path]=None, second_log_dir: Union[str, Path]="default",
+                 buffer_capacity: int=0, flush_interval_ms: int=100):
         """
         Initialize logger manager
         """
         # Dictionary to hold logger instances
         self._loggers = {}
+
+        # Opt-in (buffer_capacity > 0): file records are buffered in a MemoryHandler per logger and flushed when
+        # the buffer is full, on ERROR or above, and periodically by a background thread
+        if not isinstance(buffer_capacity, int) or buffer_capacity < 0:
+            raise ValueError("buffer_capacity must be a non-negative integer")
+        if not isinstance(flush_interval_ms, (int, float)) or flush_interval_ms <= 0:
+            raise ValueError("flush_interval_ms must be a positive number")
+        self.buffer_capacity = buffer_capacity
+        self.flush_interval_ms = flush_interval_ms
+        self._memory_handlers = {}
         
         # Initialize base directory for logs
         self._BASE_DIR = Path(base_dir) if base_dir is not None else Path.cwd() / "logs"
@@ -85,7 +226,15 @@ class LoggerManager:
             file_handler = logging.FileHandler(log_filename)
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            if self.buffer_capacity > 0:
+                # Buffered records reach the file as a single write per flush
+                memory_handler = _BatchMemoryHandler(self.buffer_capacity, flushLevel=logging.ERROR, target=file_handler)
+                memory_handler.setLevel(log_level)
+                logger.addHandler(memory_handler)
+                self._memory_handlers[logger_name] = memory_handler
+                _register_buffered_handler(memory_handler, self.flush_interval_ms / 1000)
+            else:
+                logger.addHandler(file_handler)
 
             # Set console handler
             console_handler = logging.StreamHandler()
@@ -97,6 +246,26 @@ class LoggerManager:
         except Exception as e:
             return ExceptionTracker().get_exception_return(e)
         
+    def flush(self) -> Result:
+        """
+        Write all buffered log records to their files.
+
+        Returns:
+            Result: A Result object indicating success or failure of the operation.
+
+        Example:
+            >>> logger_manager = LoggerManager()
+            >>> logger_manager.make_logger("my_logger")
+            >>> logger_manager.get_logger("my_logger").data.info("buffered message")
+            >>> logger_manager.flush() # the message is now in the log file
+        """
+        try:
+            for memory_handler in list(self._memory_handlers.values()):
+                memory_handler.flush()
+            return Result(True, None, None, "Log buffers flushed successfully.")
+        except Exception as e:
+            return ExceptionTracker().get_exception_return(e)
+
     def get_logger(self, logger_name: str) -> Result:
         """
         Get logger instance by name
@@ -127,6 +296,7 @@ class LoggerManager:
     def stop_stream_handlers(self, logger: logging.Logger) -> Result:
         """
         Stop stream handlers for generated by `LoggerManager.make_logger` method.
+        Buffered file records of the logger are flushed first.
 
         **WARNING**:
             - This method assumes that the stream handler is the second handler added to the logger.
@@ -147,6 +317,9 @@ class LoggerManager:
         try:
             if logger is None or not isinstance(logger, logging.Logger):
                 raise ValueError("logger must be an instance of logging.Logger.")
+            memory_handler = self._memory_handlers.get(logger.name)
+            if memory_handler is not None:
+                memory_handler.flush()
             stream_handler = logger.handlers[1]  # Assuming the second handler is the stream handler
             stream_handler.close()
             logger.handlers.pop(1)
@@ -171,21 +344,17 @@ class Log:
         Initialize Log class with a logger instance.
         """
         self.logger = logger
-        self.log_levels = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
-
-    def log_message(self, level: Optional[Union[int, str]], message: str) -> Result:
+        self.log_levels = _LOG_LEVELS
+
+    def log_message(self, level: Optional[Union[int, str]], message: str, *args: Any) -> Result:
         """
         Log a message with the specified log level.
 
         Args:
             - level : Log level as an integer or string ('INFO').
-            - message : The message to log.
+            - message : The message to log. With args, a %-style format string.
+            - args : Arguments merged into message only when the record is emitted,
+                     so filtered-out levels never pay for the formatting.
 
         Returns:
             Result: A Result object indicating success or failure of the logging operation.
@@ -197,6 +366,7 @@ class Log:
             >>>     logger = logger_result.data
             >>>     log_system = Log(logger)
             >>>     log_result = log_system.log_message('INFO', "This is an info message.")
+            >>>     log_system.log_message('DEBUG', "Key '%s' matches the condition.", key)  # formatted only if DEBUG is enabled
             >>>     if log_result.success:
             >>>         print("Log message sent successfully.")
             >>>     else:
@@ -208,10 +378,13 @@ class Log:
             return Result(False, None, "Logger is not initialized.", None)
         try:
             if isinstance(level, str):
-                level = self.log_levels.get(level.upper(), logging.INFO)
+                level = _LOG_LEVELS.get(level) or _LOG_LEVELS.get(level.upper(), logging.INFO)
 
-            self.logger.log(level, message)
-            return Result(True, None, None, "Log message sent successfully.")
+            # Filtered-out levels return before the logger builds a LogRecord
+            if isinstance(level, int) and not self.logger.isEnabledFor(level):
+                return _LOG_SENT
+            self.logger.log(level, message, *args)
+            return _LOG_SENT
         except Exception as e:
             return ExceptionTracker().get_exception_return(e)
         
@@ -45,6 +45,10 @@ class Result(NamedTuple):
     - Guarantees immutability by design
     - Supports attribute access by name for improved readability
     - Is lightweight and memory-efficient compared to regular classes
+      (namedtuple sets an empty __slots__, so instances have no per-instance __dict__;
+       do not add attributes outside the four fields, or that guarantee is lost)
+    - Constructs faster than a frozen dataclass (even with slots=True), whose __init__
+      assigns every field through object.__setattr__
 
     Attributes:
         success (Optional[bool]): Indicates whether the operation was successful.
@@ -63,6 +67,27 @@ class Result(NamedTuple):
     context: Optional[str]
     data: Any
 
+    @classmethod
+    def ok(cls, data: Any = None) -> "Result":
+        """
+        Creates a successful Result holding data.
+
+        Equivalent to Result(True, None, None, data), but builds the tuple directly instead of going through
+        the generated __new__, which makes it the cheaper choice on hot success paths.
+
+        Args:
+            data (Any): The data returned from the operation.
+
+        Returns:
+            Result: Result(True, None, None, data)
+
+        Example:
+            >>> result = Result.ok({"key": "value"})
+            >>> print(result)
+            >>> # Output: Result(success=True, error=None, context=None, data={'key': 'value'})
+        """
+        return tuple.__new__(cls, (True, None, None, data))
+
     def unwrap(self) -> Any:
         """
         Unwraps the Result to get the data if successful.
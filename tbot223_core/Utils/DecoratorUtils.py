@@ -1,5 +1,8 @@
 # external Modules
 import time
+import functools
+import logging
+from typing import Optional
 
 # internal Modules
 from tbot223_core.Exception import ExceptionTracker
@@ -9,8 +12,8 @@ class DecoratorUtils:
     This class provides utility decorators for various purposes.
 
     Methods:
-        - count_runtime() -> function
-            Decorator to measure and print the execution time of a function.
+        - count_runtime(logger=None) -> function
+            Decorator to measure and print (or log) the execution time of a function.
     """
 
     
@@ -21,17 +24,36 @@ class DecoratorUtils:
 
     # external Methods
     @staticmethod
-    def count_runtime():
+    def count_runtime(logger: Optional[logging.Logger]=None):
         """
         Decorator to measure and print the execution time of a function
+
+        Timing uses time.perf_counter_ns (monotonic, high resolution). When a logger is given the
+        runtime is logged at DEBUG level instead of printed, and only formatted if DEBUG is enabled.
+
+        Args:
+            - logger : Optional logger to report the runtime to. Defaults to None (print).
+
+        Returns:
+            The decorator.
+
+        Example:
+            >>> @DecoratorUtils.count_runtime()
+            >>> def work():
+            >>>     time.sleep(1)
+            >>> work()  # Output: This ran for 1.0001 seconds.
         """
+        perf_counter_ns = time.perf_counter_ns
         def decorator(func):
+            @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = perf_counter_ns()
                 result = func(*args, **kwargs)
-                end_time = time.time()
-                run_time = end_time - start_time
-                print(f"This ran for {run_time:.4f} seconds.")
+                run_time = (perf_counter_ns() - start_time) * 1e-9
+                if logger is None:
+                    print(f"This ran for {run_time:.4f} seconds.")
+                else:
+                    logger.debug("%s ran for %.4f seconds.", func.__qualname__, run_time)
                 return result
             return wrapper
-        return decorator
\ No newline at end of file
+        return decorator
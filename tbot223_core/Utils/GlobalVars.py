@@ -1,16 +1,53 @@
 # external Modules
 from multiprocessing import shared_memory, RLock, Lock
-import pickle, json
-from typing import Optional, Union
+import pickle, json, marshal
+from typing import Any, Callable, Optional, Union
 from pathlib import Path
 import logging
 import struct
+import sys
+from collections import OrderedDict
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # internal Modules
 from tbot223_core.Result import Result
 from tbot223_core.Exception import ExceptionTracker
 from tbot223_core.LogSys import LoggerManager, Log
 
+# GlobalVars._read_unlocked sentinels: _MISSING means "use the locked path", _ABSENT a consistently read missing key.
+# _MISSING is also __call__'s "no value given" default, so None can be set through call syntax
+_MISSING = object()
+_ABSENT = object()
+
+# Shared memory layout: an 8-byte unsigned length header followed by the serialized variables.
+# The pickle format then appends its out-of-band buffers: a marker and count, one length per buffer and the raw
+# buffer bytes. Segments without the marker (other formats, or written before out-of-band buffers) load the stream alone
+_SHM_HEADER = struct.Struct('Q')
+_SHM_OOB_TABLE = struct.Struct('8sQ')
+_SHM_OOB_MAGIC = b"TBOOB\x00\x00\x01"  # out-of-band table, layout version 1
+
+def _lock_held_probe(lock) -> Optional[Callable[[], bool]]:
+    """
+    Return a cheap "is the lock held by anyone" check for a multiprocessing lock, or None if there is none.
+
+    - SemLock._is_zero is a private CPython attribute, so it is looked up defensively.
+    - macOS has no working sem_getvalue; there _is_zero acquires and releases the semaphore, so it is not used.
+    - Without a probe, GlobalVars reads always take the locked path.
+    """
+    if sys.platform == "darwin":
+        return None
+    return getattr(getattr(lock, "_semlock", None), "_is_zero", None)
+
+# Serialization formats backed by optional packages, registered in GlobalVars.SERIALIZERS only when installed
+_OPTIONAL_SERIALIZERS = ("orjson", "msgpack")
+
 class GlobalVars:
     """
     This class manages global variables in a controlled manner.
@@ -100,12 +137,18 @@ class GlobalVars:
         >>> print(globals("api_key").data)  # Output: 12345
     
     Security:
-    - The shared-memory methods ('shm_sync', 'shm_update', etc.) support two 
-        serialization formats: 'pickle' (default) and 'json'.
+    - The shared-memory methods ('shm_sync', 'shm_update', etc.) support the
+        serialization formats 'pickle' (default), 'json' and 'marshal', plus
+        'orjson' and 'msgpack' when those packages are installed.
     - PICKLE: Unpickling untrusted data can execute arbitrary code. Use pickle 
         serialization only between trusted processes.
     - JSON: Safe for untrusted processes but has limitations (cannot serialize 
         all Python objects like custom classes, functions, etc.).
+    - MARSHAL: Fastest to serialize, but limited to builtin types and to processes
+        running the same Python version. Malformed marshal data can crash the
+        interpreter, so use it only between trusted processes.
+    - ORJSON / MSGPACK: Safe like JSON and much faster; limited to JSON-like data
+        (msgpack also handles bytes, and restores tuples as lists).
     - To use JSON serialization for safer inter-process communication:
         >>> gv.shm_sync("my_shm", serialize_format="json")
         >>> gv.shm_update("my_shm", serialize_format="json")
@@ -123,6 +166,10 @@ class GlobalVars:
         object.__setattr__(self, '__initializing__', True)
         object.__setattr__(self, '__vars__', {})
         object.__setattr__(self, '__lock__', RLock())
+        # Unlocked reads: writers bump the epoch (a one-element list, so it can be bumped without __setattr__)
+        # before modifying __vars__, and readers fall back to the lock if it is held or the epoch moved.
+        object.__setattr__(self, '__write_epoch__', [0])
+        object.__setattr__(self, '__lock_held__', _lock_held_probe(self.__lock__))  # True while any thread/process holds __lock__; None if unavailable
         
         # Initialize Paths
         self._BASE_DIR = Path(base_dir) if base_dir is not None else Path.cwd()
@@ -142,7 +189,7 @@ class GlobalVars:
 
         # Shared Memory Attributes
         self.__shm_name__ = set()
-        self.__shm_cache__ = {}
+        self.__shm_cache__ = OrderedDict()  # LRU order: least recently used first
         self.__shm_cache_max_size__ = shared_memory_cache_max_size
 
         self.SERIALIZERS = {
@@ -152,13 +199,74 @@ class GlobalVars:
             ),
             "json": (
                     lambda obj: json.dumps(obj).encode('utf-8'), 
-                    lambda byte_data: json.loads(byte_data.decode('utf-8'))
-            )
+                    lambda byte_data: json.loads(str(byte_data, 'utf-8'))  # accepts bytes or a memoryview
+            ),
+            # builtins only (no custom classes) and only between processes running the same Python version
+            "marshal": (marshal.dumps, marshal.loads)
         }
+        # C-extension formats: both read the shared buffer view directly
+        if orjson is not None:
+            self.SERIALIZERS["orjson"] = (orjson.dumps, orjson.loads)
+        if msgpack is not None:
+            self.SERIALIZERS["msgpack"] = (msgpack.packb, msgpack.unpackb)
 
         # Initialization complete
         object.__setattr__(self, '__initializing__', False)
         
+    def _read_unlocked(self, key: str, default: Any = _MISSING) -> Any:
+        """
+        Read a variable without taking the lock when no writer can be in the middle of an update.
+
+        The read is only used if the lock is free beforehand and no write started while it ran (epoch unchanged).
+        Otherwise, or if the platform offers no lock probe, _MISSING is returned and the caller takes the locked path, so readers never observe a
+        compound update made under lock() halfway through.
+
+        Args:
+            - key : The name of the global variable.
+            - default : Returned for a consistent read of a missing key. Defaults to _MISSING (use the locked path).
+
+        Returns:
+            The value, default for a missing key, or _MISSING if the locked path must be used.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> value = gv._read_unlocked("api_key")
+            >>> if value is _MISSING:
+            >>>     value = gv.get("api_key").data
+        """
+        write_epoch = self.__write_epoch__
+        epoch = write_epoch[0]
+        lock_held = self.__lock_held__
+        if lock_held is None or lock_held():
+            return _MISSING
+        value = self.__vars__.get(key, default)
+        if write_epoch[0] != epoch:
+            return _MISSING
+        return value
+
+    def _return_user_error(self, error: Exception, context: str) -> Result:
+        """
+        Build the failed Result for an expected, caller-caused error (missing or existing key, invalid name).
+
+        Unlike _exception_tracker.get_exception_return, no traceback, location or system info is collected;
+        the error string keeps the same "{type} :{message}" form and data holds only the "error" entry
+        of the tracker's error info, so callers reading result.data["error"] work for both paths.
+
+        Args:
+            - error : The KeyError/ValueError raised for the caller's input.
+            - context : Where the error was raised, e.g. "Core.GlobalVars.get".
+
+        Returns:
+            Result: Result(False, "{type} :{message}", context, {"success": False, "error": {"type": ..., "message": ...}})
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> return self._return_user_error(KeyError("Global variable 'x' does not exist."), "Core.GlobalVars.get")
+        """
+        error_type = type(error).__name__
+        message = str(error)
+        return Result(False, f"{error_type} :{message}", context, {"success": False, "error": {"type": error_type, "message": message}})
+
     def set(self, key: str, value: object, overwrite: bool=False) -> Result:
         """
         Set a global variable.
@@ -180,17 +288,26 @@ class GlobalVars:
             >>>     print(result.error)
         """
         try:
+            # validate before locking; isspace() short-circuits without allocating like strip() does
+            if not isinstance(key, str) or not key or key.isspace():
+                raise ValueError("key must be a non-empty string.")
+            vars_dict = self.__vars__
             with self.__lock__:
                 # inline existence check to avoid extra lock/log overhead from exists()
-                if key in self.__vars__ and not overwrite:
+                if key in vars_dict and not overwrite:
                     raise KeyError(f"Global variable '{key}' already exists.")
-                if key is None or not isinstance(key, str) or key.strip() == "":
-                    raise ValueError("key must be a non-empty string.")
+                self.__write_epoch__[0] += 1
+                vars_dict[key] = value
 
-                self.__vars__[key] = value
-                if self.__is_logging_enabled__:
-                    self.log.log_message("INFO", f"Global variable '{key}' set.")
-                return Result(True, None, None, f"Global variable '{key}' set.")
+            # logged after releasing the lock, so handler I/O never extends the critical section
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Global variable '{key}' set.")
+            return Result.ok(f"Global variable '{key}' set.")
+        except (KeyError, ValueError) as e:
+            # raised above for the caller's input; an expected outcome, so skip the traceback report
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to set global variable '{key}': {e}")
+            return self._return_user_error(e, "Core.GlobalVars.set")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to set global variable '{key}': {e}")
@@ -216,13 +333,25 @@ class GlobalVars:
             >>>     print(result.error)
         """
         try:
+            value = self._read_unlocked(key)
+            if value is not _MISSING:
+                if self.__is_logging_enabled__:
+                    self.log.log_message("INFO", f"Global variable '{key}' accessed.")
+                return Result.ok(value)
+
             with self.__lock__:
                 if key not in self.__vars__:
                     raise KeyError(f"Global variable '{key}' does not exist.")
+                value = self.__vars__[key]
 
-                if self.__is_logging_enabled__:
-                    self.log.log_message("INFO", f"Global variable '{key}' accessed.")
-                return Result(True, None, None, self.__vars__[key])
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Global variable '{key}' accessed.")
+            return Result.ok(value)
+        except (KeyError, ValueError) as e:
+            # raised above for the caller's input; an expected outcome, so skip the traceback report
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to get global variable '{key}': {e}")
+            return self._return_user_error(e, "Core.GlobalVars.get")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to get global variable '{key}': {e}")
@@ -252,10 +381,17 @@ class GlobalVars:
                 if key not in self.__vars__:
                     raise KeyError(f"Global variable '{key}' does not exist.")
 
+                self.__write_epoch__[0] += 1
                 del self.__vars__[key]
-                if self.__is_logging_enabled__:
-                    self.log.log_message("INFO", f"Global variable '{key}' deleted.")
-                return Result(True, None, None, f"Global variable '{key}' deleted.")
+
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Global variable '{key}' deleted.")
+            return Result.ok(f"Global variable '{key}' deleted.")
+        except (KeyError, ValueError) as e:
+            # raised above for the caller's input; an expected outcome, so skip the traceback report
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to delete global variable '{key}': {e}")
+            return self._return_user_error(e, "Core.GlobalVars.delete")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to delete global variable '{key}': {e}")
@@ -280,12 +416,12 @@ class GlobalVars:
         """
         try:
             with self.__lock__:
-                for name in list(self.__vars__.keys()):
-                    del self.__vars__[name]
+                self.__write_epoch__[0] += 1
+                self.__vars__.clear()  # in place, so references to the same dict stay valid
 
-                if self.__is_logging_enabled__:
-                    self.log.log_message("INFO", "All global variables cleared.")
-                return Result(True, None, None, "All global variables cleared.")
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", "All global variables cleared.")
+            return Result.ok("All global variables cleared.")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to clear global variables: {e}")
@@ -309,10 +445,22 @@ class GlobalVars:
             >>>     print(result.error)
         """
         try:
-            with self.__lock__:
-                if self.__is_logging_enabled__:
-                    self.log.log_message("INFO", "Listing all global variables.")
-                return Result(True, None, None, list(self.__vars__.keys()))
+            # Same check as _read_unlocked: copy without the lock unless a writer is active or starts meanwhile
+            write_epoch = self.__write_epoch__
+            epoch = write_epoch[0]
+            names = None
+            lock_held = self.__lock_held__
+            if lock_held is not None and not lock_held():
+                names = list(self.__vars__.keys())
+                if write_epoch[0] != epoch:
+                    names = None
+            if names is None:
+                with self.__lock__:
+                    names = list(self.__vars__.keys())
+
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", "Listing all global variables.")
+            return Result.ok(names)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to list global variables: {e}")
@@ -338,11 +486,19 @@ class GlobalVars:
             >>>     print(result.error)
         """
         try:
-            with self.__lock__:
-                exists = key in self.__vars__
+            value = self._read_unlocked(key, default=_ABSENT)
+            if value is not _MISSING:
+                exists = value is not _ABSENT
                 if self.__is_logging_enabled__:
                     self.log.log_message("INFO", f"Checked existence of global variable '{key}': {exists}")
-                return Result(True, None, None, exists)
+                return Result.ok(exists)
+
+            with self.__lock__:
+                exists = key in self.__vars__
+
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Checked existence of global variable '{key}': {exists}")
+            return Result.ok(exists)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to check existence of global variable '{key}': {e}")
@@ -364,10 +520,16 @@ class GlobalVars:
             >>> print(globals.api_key)  # Output: 12345 ( this part uses __getattr__ )
         """
         try:
-            with object.__getattribute__(self, '__lock__'):
-                if name not in self.__vars__:
+            # read from __dict__ directly, so an uninitialized instance fails here instead of recursing
+            state = object.__getattribute__(self, '__dict__')
+            lock, vars_dict = state['__lock__'], state['__vars__']
+            value = self._read_unlocked(name)
+            if value is not _MISSING:
+                return value
+            with lock:
+                if name not in vars_dict:
                     raise KeyError(f"Global variable '{name}' does not exist.")
-                return self.__vars__[name]
+                return vars_dict[name]
         except Exception as e:
             return "Key does not exist."
         
@@ -387,36 +549,31 @@ class GlobalVars:
             >>> globals.api_key = "12345" ( this part uses __setattr__ )
             >>> print(globals.api_key)  # Output: 12345
         """
-        # During initialization, use normal attribute setting
-        try:
-            if object.__getattribute__(self, '__initializing__'):
-                object.__setattr__(self, name, value)
-                return
-        except AttributeError:
-            # __initializing__ not set yet, must be during early init
+        # During initialization (or before __initializing__ exists), use normal attribute setting.
+        # Instance state is read from __dict__ in one lookup instead of one object.__getattribute__ call per field
+        state = self.__dict__
+        if state.get('__initializing__', True):
             object.__setattr__(self, name, value)
             return
         
         # After initialization, store in __vars__ dict
         try:
-            with object.__getattribute__(self, '__lock__'):
-                if name is None or not isinstance(name, str) or name.strip() == "":
-                    raise ValueError("name must be a non-empty string.")
-                
-                vars_dict = object.__getattribute__(self, '__vars__')
-                vars_dict[name] = value
+            if not isinstance(name, str) or not name or name.isspace():
+                raise ValueError("name must be a non-empty string.")
+            with state['__lock__']:
+                state['__write_epoch__'][0] += 1
+                state['__vars__'][name] = value
         except Exception as e:
-            exception_tracker = object.__getattribute__(self, '_exception_tracker')
-            return exception_tracker.get_exception_return(e)
+            return state['_exception_tracker'].get_exception_return(e)
         
-    def __call__(self, key: str, value: Optional[object]=None, overwrite: bool=False) -> Result:
+    def __call__(self, key: str, value: Any=_MISSING, overwrite: bool=False) -> Result:
         """
         Get or set a global variable using call syntax.
-        If value is provided, set the variable; otherwise, get it.
+        If value is provided (including None), set the variable; otherwise, get it.
 
         Args:
             - key : The name of the global variable.
-            - value : The value to set (optional).
+            - value : The value to set (optional). None is stored like any other value.
             - overwrite : If True, overwrite existing variable when setting. Defaults to False.
 
         Returns:
@@ -431,14 +588,88 @@ class GlobalVars:
             >>> else:
             >>>     print(result.error)
         """
-        try:
-            if value is not None:
-                return self.set(key, value, overwrite)
-            else:
-                return self.get(key)
-        except Exception as e:
-            return self._exception_tracker.get_exception_return(e)
+        # set() and get() already turn failures into a Result, so no extra try/except here
+        if value is _MISSING:
+            return self.get(key)
+        return self.set(key, value, overwrite)
         
+    def _shm_get_nolock(self, name: str) -> tuple:
+        """
+        Get a shared memory object from the cache, opening and caching it on a miss.
+        The caller must hold __lock__, so lookup, open and insert happen in one critical section.
+        Entries evicted by the insert are returned instead of closed; pass them to _close_evicted after releasing the lock.
+
+        Args:
+            - name: The name of the shared memory object.
+
+        Returns:
+            tuple: (shm, cached, evicted) where cached is False if the object was just opened
+            and evicted lists the (name, shm) pairs removed from the cache.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> with gv.lock():
+            >>>     shm, cached, evicted = gv._shm_get_nolock("my_shm")
+            >>> gv._close_evicted(evicted)
+        """
+        cache = self.__shm_cache__
+        shm = cache.get(name)
+        if shm is not None:
+            cache.move_to_end(name)  # cache hits mark the entry as most recently used
+            return shm, True, ()
+        shm = shared_memory.SharedMemory(name=name)
+        return shm, False, self._shm_cache_insert_nolock(name, shm)
+
+    def _shm_cache_insert_nolock(self, name: str, shm: shared_memory.SharedMemory) -> list:
+        """
+        Add a new entry to the shared memory cache, evicting the least recently used entries if it is full.
+        The caller must hold __lock__; the evicted segments are returned, not closed.
+
+        Args:
+            - name: The name of the shared memory object (not already cached).
+            - shm: The shared memory object.
+
+        Returns:
+            list: The evicted (name, shm) pairs, oldest first.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> with gv.lock():
+            >>>     evicted = gv._shm_cache_insert_nolock("my_shm", shm)
+            >>> gv._close_evicted(evicted)
+        """
+        cache = self.__shm_cache__
+        max_size = self.__shm_cache_max_size__
+        evicted = []
+        # evict only when adding a new entry, never the one being touched;
+        # a full cache sheds a tenth of its capacity at once so churn does not evict on every insert
+        if cache and len(cache) >= max_size:
+            evict_count = max(len(cache) - max_size + 1, max_size // 10)
+            for _ in range(min(evict_count, len(cache))):
+                evicted.append(cache.popitem(last=False))
+        cache[name] = shm
+        return evicted
+
+    def _close_evicted(self, evicted) -> None:
+        """
+        Close the shared memory segments evicted from the cache and log their removal.
+        Called after releasing __lock__, so closing and handler I/O never extend the critical section.
+
+        Args:
+            - evicted: The (name, shm) pairs returned by _shm_cache_insert_nolock or _shm_get_nolock.
+
+        Returns:
+            None
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> gv._close_evicted(evicted)
+        """
+        for oldest_key, oldest_shm in evicted:
+            oldest_shm.close()
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"Shared memory cache for '{oldest_key}' removed due to cache size limit.")
+
     def shm_cache_management(self, name: Optional[str], shm: Optional[shared_memory.SharedMemory]) -> Result:
         """
         Internal method to manage shared memory cache.
@@ -450,7 +681,8 @@ class GlobalVars:
         Args:
             - name: The name of the shared memory object.
             - shm: The shared memory object.
-            if name and shm are provided, it adds/updates the cache.
+            if name and shm are provided, it adds/updates the cache. (adding to a full cache evicts and closes the least recently used entries, a tenth of the capacity at least)
+            if only name is provided, it marks the cached entry as most recently used.
             if both are None, it clears the cache.
 
         Returns:
@@ -472,34 +704,35 @@ class GlobalVars:
                 raise ValueError("name must be a string or None")
             if shm is not None and not isinstance(shm, shared_memory.SharedMemory):
                 raise ValueError("shm must be a shared_memory.SharedMemory object or None")
+            log_enabled = self.__is_logging_enabled__
+            messages = []  # logged once the lock is released
+            evicted = []  # closed once the lock is released
             with self.__lock__:
-                if len(self.__shm_cache__) >= self.__shm_cache_max_size__:
-                    oldest_key = next(iter(self.__shm_cache__))
-                    self.__shm_cache__[oldest_key].close()
-                    del self.__shm_cache__[oldest_key]
-                    if self.__is_logging_enabled__:
-                        self.log.log_message("INFO", f"Shared memory cache for '{oldest_key}' removed due to cache size limit.")
-
-                if name not in self.__shm_cache__ and shm is not None:
-                    self.__shm_cache__[name] = shm
-                    if self.__is_logging_enabled__:
-                        self.log.log_message("INFO", f"Shared memory cache for '{name}' created.")
-                elif name in self.__shm_cache__ and shm is not None:
-                    self.__shm_cache__[name] = shm
-                    if self.__is_logging_enabled__:
-                        self.log.log_message("INFO", f"Shared memory cache for '{name}' updated.")
-                elif name is None and shm is None:
-                    self.__shm_cache__.clear()
-                    if self.__is_logging_enabled__:
-                        self.log.log_message("INFO", "All shared memory caches cleared.")
+                cache = self.__shm_cache__
+                if name is None and shm is None:
+                    cache.clear()
+                    if log_enabled:
+                        messages.append("All shared memory caches cleared.")
+                elif shm is not None and name in cache:
+                    cache[name] = shm
+                    cache.move_to_end(name)
+                    if log_enabled:
+                        messages.append(f"Shared memory cache for '{name}' updated.")
+                elif shm is not None:
+                    evicted = self._shm_cache_insert_nolock(name, shm)
+                    if log_enabled:
+                        messages.append(f"Shared memory cache for '{name}' created.")
+                elif name in cache:
+                    cache.move_to_end(name)
+                    if log_enabled:
+                        messages.append(f"Shared memory cache for '{name}' accessed.")
                 else:
-                    shm_obj = self.__shm_cache__.get(name)
-                    self.__shm_cache__.pop(name, None)
-                    self.__shm_cache__[name] = shm_obj
-                    if self.__is_logging_enabled__:
-                        self.log.log_message("INFO", f"Shared memory cache for '{name}' accessed.")
+                    raise KeyError(f"Shared memory cache for '{name}' does not exist.")
 
-            return Result(True, None, None, "success to manage shared memory cache")
+            self._close_evicted(evicted)
+            for message in messages:
+                self.log.log_message("INFO", message)
+            return Result.ok("success to manage shared memory cache")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to manage shared memory cache: {e}")
@@ -556,8 +789,8 @@ class GlobalVars:
             
             if create_lock:
                 lock = Lock()
-                return Result(True, None, None, lock)
-            return Result(True, None, None, "success to create shared memory object")
+                return Result.ok(lock)
+            return Result.ok("success to create shared memory object")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to create shared memory object: {e}")
@@ -593,16 +826,14 @@ class GlobalVars:
             >>>     gv_child.shm_sync("my_shm")
         """
         try:
-            res = self.shm_get(name)
-            if not res.success:
-                return res
-
-            if name not in self.__shm_name__:
+            with self.__lock__:
+                _, _, evicted = self._shm_get_nolock(name)
                 self.__shm_name__.add(name)
+            self._close_evicted(evicted)
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Connected to shared memory object '{name}'.")
-            return Result(True, None, None, f"Connected to shared memory object '{name}'.")
+            return Result.ok(f"Connected to shared memory object '{name}'.")
         except FileNotFoundError:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Shared memory object '{name}' does not exist.")
@@ -632,18 +863,17 @@ class GlobalVars:
             >>> print(shm.name)  # Output: my_shm
         """
         try:
-            if name not in self.__shm_cache__:
+            with self.__lock__:
+                shm, cached, evicted = self._shm_get_nolock(name)
+            self._close_evicted(evicted)
+            if not cached:
                 if self.__is_logging_enabled__:
                     self.log.log_message("WARNING", f"Shared memory object '{name}' not found in cache.")
-                shm = shared_memory.SharedMemory(name=name)
-                self.shm_cache_management(name, shm)
-                if self.__is_logging_enabled__:
                     self.log.log_message("INFO", f"Shared memory object '{name}' created and added to cache.")
-                return Result(True, None, None, shm)
-            shm = self.__shm_cache__[name]
+                return Result.ok(shm)
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Shared memory object '{name}' retrieved from cache.")
-            return Result(True, None, None, shm)
+            return Result.ok(shm)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to retrieve shared memory object '{name}' from cache: {e}")
@@ -653,14 +883,17 @@ class GlobalVars:
         """
         Synchronize the current object's variables to the shared memory object.
 
-        Security: This method supports 'pickle' (default) and 'json' serialization.
-        - pickle: Fast but dangerous with untrusted data (arbitrary code execution)
+        Security: This method supports 'pickle' (default), 'json', 'marshal', 'orjson' and 'msgpack' serialization.
+        - pickle: Fast but dangerous with untrusted data (arbitrary code execution).
+                  Large bytes-like values (bytearray, numpy arrays) are written out-of-band, without an extra copy
         - json: Safe but limited (cannot serialize custom classes, functions, etc.)
+        - marshal: Fastest for builtin types, same Python version only, trusted processes only
+        - orjson / msgpack: Safe and faster than json for JSON-like data; require the optional package
         For untrusted processes, always use serialize_format="json".
 
         Args:
             - name: The name of the shared memory object.
-            - serialize_format: The serialization format to use. Default is "pickle". ("pickle" or "json")
+            - serialize_format: The serialization format to use. Default is "pickle". ("pickle", "json", "marshal", "orjson" or "msgpack")
 
         Returns:
             Result: A Result object indicating success or failure.
@@ -675,31 +908,54 @@ class GlobalVars:
             >>> print(gv.some_variable)  # Output: 42
         """
         try:
-            if serialize_format not in self.SERIALIZERS:
+            serializer = self.SERIALIZERS.get(serialize_format)
+            if serializer is None:
+                if serialize_format in _OPTIONAL_SERIALIZERS:
+                    raise ImportError(f"{serialize_format} is not installed")
                 raise ValueError(f"Unsupported serialization format: {serialize_format}")
             
-            byte_dict = self.SERIALIZERS[serialize_format][0](self.__vars__)
-                
+            if serialize_format == "pickle":
+                # Protocol 5 hands contiguous bytes-like values (bytearray, numpy arrays, PickleBuffer) out-of-band,
+                # so they are copied once, straight into shared memory, instead of through the pickle stream
+                oob_buffers = []
+                byte_dict = pickle.dumps(self.__vars__, protocol=5, buffer_callback=oob_buffers.append)
+                oob_raws = [buffer.raw() for buffer in oob_buffers]
+                oob_table = _SHM_OOB_TABLE.pack(_SHM_OOB_MAGIC, len(oob_raws)) + struct.pack(f'{len(oob_raws)}Q', *(raw.nbytes for raw in oob_raws))
+            else:
+                byte_dict = serializer[0](self.__vars__)
+                oob_raws, oob_table = (), b""
+
             data_len = len(byte_dict)
-            header_size = 8 # bytes to store length of data
+            header_size = _SHM_HEADER.size
+            total_size = header_size + data_len + len(oob_table) + sum(raw.nbytes for raw in oob_raws)
 
             if name not in self.__shm_name__:
                 raise ValueError("Shared memory name does not match the created one.")
-            if name not in self.__shm_cache__:
-                shm = shared_memory.SharedMemory(name=name)
-                self.shm_cache_management(name, shm)
-            else:
-                shm = self.__shm_cache__[name]
+            with self.__lock__:
+                shm, _, evicted = self._shm_get_nolock(name)
+            self._close_evicted(evicted)
 
-            if data_len + header_size > shm.size:
-                raise MemoryError(f"Serialized data size ({data_len + header_size} bytes) exceeds shared memory size ({shm.size} bytes).")
+            if total_size > shm.size:
+                raise MemoryError(f"Serialized data size ({total_size} bytes) exceeds shared memory size ({shm.size} bytes).")
             
-            shm.buf[:header_size] = struct.pack('Q', data_len)
-            shm.buf[header_size:header_size+data_len] = byte_dict
+            _SHM_HEADER.pack_into(shm.buf, 0, data_len)
+            offset = header_size + data_len
+            shm.buf[header_size:offset] = byte_dict
+            if oob_table:
+                shm.buf[offset:offset+len(oob_table)] = oob_table
+                offset += len(oob_table)
+                for raw in oob_raws:
+                    shm.buf[offset:offset+raw.nbytes] = raw
+                    offset += raw.nbytes
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Shared memory object '{name}' synchronized.")
-            return Result(True, None, None, "success to synchronize shared memory object")
+            return Result.ok("success to synchronize shared memory object")
+        except ValueError as e:
+            # unknown name, format or unserializable variables: caused by the caller, so skip the traceback report
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to synchronize shared memory object '{name}': {e}")
+            return self._return_user_error(e, "Core.GlobalVars.shm_sync")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to synchronize shared memory object '{name}': {e}")
@@ -709,14 +965,18 @@ class GlobalVars:
         """
         Update the current object's variables from the shared memory object.
 
-        Security: This method supports 'pickle' and 'json' deserialization.
+        Security: This method supports 'pickle', 'json', 'marshal', 'orjson' and 'msgpack' deserialization.
         - pickle: Dangerous with untrusted data (can execute arbitrary code)
         - json: Safe for untrusted data but has serialization limitations
+        - marshal: Malformed data can crash the interpreter; trusted processes with the same Python version only
+        - orjson / msgpack: Safe for untrusted data, like json; require the optional package
         Always use the same format that was used in shm_sync().
+        Pickle segments carry a versioned out-of-band buffer table after the stream; segments without it
+        (e.g. written before out-of-band buffers were added) are read as a plain pickle stream.
         
         Args:
             - name: The name of the shared memory object.
-            - serialize_format: The serialization format to use. Default is "pickle". ("pickle" or "json")
+            - serialize_format: The serialization format to use. Default is "pickle". ("pickle", "json", "marshal", "orjson" or "msgpack")
 
         Returns:
             Result: A Result object indicating success or failure.
@@ -731,33 +991,68 @@ class GlobalVars:
             >>> print(gv.some_variable)  # Output: 42
         """
         try:
-            if serialize_format not in self.SERIALIZERS:
+            serializer = self.SERIALIZERS.get(serialize_format)
+            if serializer is None:
+                if serialize_format in _OPTIONAL_SERIALIZERS:
+                    raise ImportError(f"{serialize_format} is not installed")
                 raise ValueError(f"Unsupported serialization format: {serialize_format}")
             
-            shm = self.shm_get(name).data
-            header_size = 8 # bytes to store length of data
+            with self.__lock__:
+                shm, _, evicted = self._shm_get_nolock(name)
+            self._close_evicted(evicted)
+            header_size = _SHM_HEADER.size
 
-            packed_len = bytes(shm.buf[:header_size])
-            (data_len,) = struct.unpack('Q', packed_len)
+            (data_len,) = _SHM_HEADER.unpack_from(shm.buf)
+            shm_size = shm.size
+            if data_len > shm_size - header_size:
+                raise ValueError(f"Shared memory object '{name}' declares {data_len} bytes of data but holds {shm_size} bytes; it was not written by shm_sync or is corrupted.")
 
             if data_len == 0:
                 if self.__is_logging_enabled__:
                     self.log.log_message("WARNING", f"No data found in shared memory object '{name}'.")
-                return Result(True, None, None, "no data to update from shared memory object")
+                return Result.ok("no data to update from shared memory object")
             
-            byte_dict = bytes(shm.buf[header_size:header_size+data_len])
-
-            try:
-                obj_dict = self.SERIALIZERS[serialize_format][1](byte_dict)
-            except Exception as e:
-                raise ValueError(f"Unpickling error. Read {data_len} bytes from shared memory but failed to unpickle: {e}")
+            # Deserialize straight from a view of the shared buffer instead of copying it into bytes first;
+            # the view is released before returning so the shared memory can still be closed
+            oob_buffers = None
+            if serialize_format == "pickle":
+                # Out-of-band buffers are copied out of shared memory so the restored values neither alias
+                # the segment nor keep it exported
+                offset = header_size + data_len
+                if offset + _SHM_OOB_TABLE.size <= shm_size:
+                    magic, oob_count = _SHM_OOB_TABLE.unpack_from(shm.buf, offset)
+                    if magic == _SHM_OOB_MAGIC:
+                        offset += _SHM_OOB_TABLE.size
+                        if oob_count > (shm_size - offset) // header_size:
+                            raise ValueError(f"Shared memory object '{name}' has a corrupted out-of-band buffer table ({oob_count} entries).")
+                        oob_lengths = struct.unpack_from(f'{oob_count}Q', shm.buf, offset)
+                        offset += header_size * oob_count
+                        if sum(oob_lengths) > shm_size - offset:
+                            raise ValueError(f"Shared memory object '{name}' has out-of-band buffers extending past the segment.")
+                        oob_buffers = []
+                        for length in oob_lengths:
+                            with shm.buf[offset:offset+length] as raw:
+                                oob_buffers.append(bytearray(raw))
+                            offset += length
+
+            with shm.buf[header_size:header_size+data_len] as byte_dict:
+                try:
+                    obj_dict = pickle.loads(byte_dict, buffers=oob_buffers) if oob_buffers is not None else serializer[1](byte_dict)
+                except Exception as e:
+                    raise ValueError(f"Unpickling error. Read {data_len} bytes from shared memory but failed to unpickle: {e}")
 
             with self.__lock__:
+                self.__write_epoch__[0] += 1
                 self.__vars__.update(obj_dict)
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Shared memory object '{name}' updated.")
-            return Result(True, None, None, "success to update from shared memory object")
+            return Result.ok("success to update from shared memory object")
+        except FileNotFoundError as e:
+            # no segment with this name: an expected outcome, so skip the traceback report
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to update from shared memory object '{name}': {e}")
+            return self._return_user_error(e, "Core.GlobalVars.shm_update")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to update from shared memory object '{name}': {e}")
@@ -782,16 +1077,22 @@ class GlobalVars:
         try:
             if name not in self.__shm_name__:
                 raise ValueError("Shared memory name does not match the created one.")
-            shm = self.shm_get(name).data
-            shm.close()
-            if not close_only:
-                shm.unlink()
-                self.__shm_name__.discard(name)
-            self.__shm_cache__.pop(name, None)
+            with self.__lock__:
+                shm, _, evicted = self._shm_get_nolock(name)
+                shm.close()
+                if not close_only:
+                    shm.unlink()
+                    self.__shm_name__.discard(name)
+                self.__shm_cache__.pop(name, None)
+            self._close_evicted(evicted)
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Shared memory object '{name}' closed and unlinked.")
-            return Result(True, None, None, "success to close shared memory object")
+            return Result.ok("success to close shared memory object")
+        except ValueError as e:
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"Failed to close shared memory object '{name}': {e}")
+            return self._return_user_error(e, "Core.GlobalVars.shm_close")
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Failed to close shared memory object '{name}': {e}")
@@ -1,14 +1,68 @@
 # external Modules
-import hashlib, secrets
+import hashlib, hmac, secrets
 import logging
+import multiprocessing
+import operator
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import compress, repeat
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
 # internal Modules
 from tbot223_core.Exception import ExceptionTracker
 from tbot223_core.LogSys import LoggerManager, Log
 from tbot223_core.Result import Result
 
+# find_keys_by_value comparison table, shared by every call (the threshold is passed alongside, not captured)
+_COMPARISON_OPERATORS = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge,
+}
+
+# Process pool for parallel PBKDF2 blocks, created on first use and shared by every Utils instance
+_pbkdf2_executor: Optional[ProcessPoolExecutor] = None
+_pbkdf2_executor_lock = threading.Lock()
+
+def _get_pbkdf2_executor() -> ProcessPoolExecutor:
+    # one pool for the process lifetime instead of spawning workers on every derivation;
+    # forkserver (where available) avoids forking a process whose other threads may hold locks
+    global _pbkdf2_executor
+    with _pbkdf2_executor_lock:
+        if _pbkdf2_executor is None:
+            mp_context = multiprocessing.get_context("forkserver") if "forkserver" in multiprocessing.get_all_start_methods() else None
+            _pbkdf2_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=mp_context)
+        return _pbkdf2_executor
+
+def _discard_pbkdf2_executor(executor: ProcessPoolExecutor) -> None:
+    # a broken pool never recovers, so drop it and let the next derivation start a fresh one
+    global _pbkdf2_executor
+    with _pbkdf2_executor_lock:
+        if _pbkdf2_executor is executor:
+            _pbkdf2_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+@lru_cache(maxsize=256)
+def _path_of(path_str: str) -> Path:
+    # Path objects are immutable, so repeated path strings share one parsed instance
+    return Path(path_str)
+
 class Utils:
     """
     Utility class providing various helper functions.
@@ -18,20 +72,56 @@ class Utils:
             Convert a string to a Path object.
         
         - hashing(data, algorithm) -> Result
-            Hash a string using the specified algorithm.
+            Hash a string or bytes-like object using the specified algorithm.
 
-        - pbkdf2_hmac(password, algorithm, iterations, salt_size) -> Result
+        - pbkdf2_hmac(password, algorithm, iterations, salt_size, dklen) -> Result
             Generate a PBKDF2 HMAC hash of the given password.
 
-        - verify_pbkdf2_hmac(password, salt_hex, hash_hex, iterations, algorithm) -> Result
+        - verify_pbkdf2_hmac(password, salt_hex, hash_hex, iterations, algorithm, use_cache) -> Result
             Verify a PBKDF2 HMAC hash of the given password.
 
+        - verify_pbkdf2_hmac_batch(password, records) -> Result
+            Verify one password against several stored PBKDF2 HMAC hashes.
+
         - insert_at_intervals(data, interval, insert, at_start) -> Result
-            Insert a specified element into a list or string at regular intervals.
+            Insert a specified element into a list, string or bytes at regular intervals.
 
         - find_keys_by_value(dict_obj, threshold, comparison, nested) -> Result
             Find keys in a dictionary based on value comparisons.
     """
+
+    # PBKDF2 block parallelization: OpenSSL has no per-block entry point, so fanned-out blocks run the pure-Python HMAC
+    # chain, measured ~4x slower than hashlib.pbkdf2_hmac per block (0.53s vs 0.13s, 200k sha256 iterations).
+    # With W >= 8 workers and nblocks >= W the wall time is ~4/W of sequential OpenSSL, i.e. at least a 2x speedup.
+    PBKDF2_PARALLEL_MIN_WORKERS = 8
+    PBKDF2_PARALLEL_THRESHOLD = 4_000_000  # iterations * blocks, so the fan-out outweighs pickling and dispatch
+
+    # PBKDF2 verification cache (opt-in via verify_pbkdf2_hmac(use_cache=True)): entries hold U_k+1 ^ ... ^ U_c for a
+    # successfully verified (salt, iterations, algorithm, U_k), so repeat verifications only compute the first k iterations.
+    PBKDF2_CACHE_PREFIX_ITERATIONS = 16
+    PBKDF2_CACHE_TTL = 60.0  # seconds
+    PBKDF2_CACHE_MAX_SIZE = 128
+
+    # find_keys_by_value NumPy fast path: flat dicts of at least this many int-only or float-only values are
+    # compared with a single vectorized ufunc instead of the per-key Python loop (requires numpy).
+    VECTORIZED_LOOKUP_MIN_SIZE = 10_000
+
+    # insert_at_intervals NumPy interleave: below this many inserts the slice join is faster than the array setup
+    INTERLEAVE_MIN_INSERTS = 32
+
+    # Supported PBKDF2 algorithms and their digest sizes, resolved once instead of instantiating a hash per call
+    PBKDF2_DIGEST_SIZES = {algorithm: hashlib.new(algorithm).digest_size for algorithm in ('sha1', 'sha256', 'sha512')}
+
+    # blake2b/blake2s beat software SHA-2, but CPUs with SHA extensions (SHA-NI / ARMv8 SHA2) run OpenSSL's sha256 faster;
+    # neither blake2 is FIPS-approved. 'blake3' is only available if the blake3 package is installed.
+    HASHING_ALGORITHMS = frozenset(('md5', 'sha1', 'sha256', 'sha512', 'blake2b', 'blake2s') + (('blake3',) if blake3 is not None else ()))
+
+    # Direct constructors for HASHING_ALGORITHMS; skips the name lookup hashlib.new() does on every call
+    _HASH_CONSTRUCTORS = {
+        'md5': hashlib.md5, 'sha1': hashlib.sha1, 'sha256': hashlib.sha256, 'sha512': hashlib.sha512,
+        'blake2b': hashlib.blake2b, 'blake2s': hashlib.blake2s,
+        **({'blake3': blake3.blake3} if blake3 is not None else {})
+    }
     
     def __init__(self, is_logging_enabled: bool=False,
                  base_dir: Union[str, Path]=None,
@@ -56,16 +146,19 @@ class Utils:
             self._logger = logger or self._logger_manager.get_logger("UtilsLogger").data
         self.log = log_instance or Log(logger=self._logger)
 
+        # Initialize internal variables
+        self._pbkdf2_cache = {}
+
         if self.__is_logging_enabled__:
             self.log.log_message("INFO", "Utils initialized.")
 
     # Internal Methods
-    def _check_pbkdf2_params(self, password: str, algorithm: str, iterations: int, salt_size: int = 32) -> None:
+    def _check_pbkdf2_params(self, password: Union[str, bytes], algorithm: str, iterations: int, salt_size: int = 32) -> None:
         """
         Check parameters for PBKDF2 HMAC functions.
 
         Args:
-            - password : The password string.
+            - password : The password string or UTF-8 encoded bytes.
             - algorithm : The hashing algorithm to use.
             - iterations : Number of iterations.
             - salt_size : Size of the salt in bytes (default: 32).
@@ -79,15 +172,205 @@ class Utils:
             >>> utils._check_pdkdf2_params("my_password", "sha256", 100000, 32)
             >>> # No exception raised for valid parameters.
         """
-        if not isinstance(password, str):
-            raise ValueError("password must be a string")
-        if algorithm not in ['sha1', 'sha256', 'sha512']:
+        if not isinstance(password, (str, bytes)):
+            raise ValueError("password must be a string or bytes")
+        if algorithm not in self.PBKDF2_DIGEST_SIZES:
             raise ValueError("Unsupported algorithm. Supported algorithms: 'sha1', 'sha256', 'sha512'")
         if not isinstance(iterations, int) or iterations <= 0:
             raise ValueError("iterations must be a positive integer")
         if not isinstance(salt_size, int) or salt_size <= 0:
             raise ValueError("salt_size must be a positive integer")
+
+    @staticmethod
+    def _hmac_prf(password: bytes, algorithm: str) -> Callable[[bytes], bytes]:
+        """
+        Build an HMAC pseudo-random function for PBKDF2 with the ipad/opad states precomputed once.
+
+        Args:
+            - password : The password bytes (HMAC key).
+            - algorithm : The hashing algorithm to use.
+
+        Returns:
+            Callable[[bytes], bytes]: prf(message) -> HMAC(password, message) digest.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> prf = Utils._hmac_prf(b"my_password", "sha256")
+            >>> print(prf(b"message") == hmac.new(b"my_password", b"message", "sha256").digest())  # Output: True
+        """
+        inner = hashlib.new(algorithm)
+        outer = hashlib.new(algorithm)
+        block_size = inner.block_size
+        if len(password) > block_size:
+            password = hashlib.new(algorithm, password).digest()
+        password = password.ljust(block_size, b'\x00')
+        inner.update(password.translate(hmac.trans_36))
+        outer.update(password.translate(hmac.trans_5C))
+
+        def prf(message: bytes) -> bytes:
+            inner_ctx = inner.copy()
+            inner_ctx.update(message)
+            outer_ctx = outer.copy()
+            outer_ctx.update(inner_ctx.digest())
+            return outer_ctx.digest()
+        return prf
+
+    @staticmethod
+    def _pbkdf2_block(password: bytes, salt: bytes, iterations: int, algorithm: str, index: int) -> bytes:
+        """
+        Compute a single PBKDF2 block T_index = U_1 ^ U_2 ^ ... ^ U_iterations.
+
+        Blocks are independent of each other, so this is the unit of work submitted to worker processes.
+
+        Args:
+            - password : The password bytes.
+            - salt : The salt bytes.
+            - iterations : Number of iterations.
+            - algorithm : The hashing algorithm to use.
+            - index : 1-based block index.
+
+        Returns:
+            bytes: The derived block (digest_size bytes).
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> block = Utils._pbkdf2_block(b"my_password", salt, 100000, "sha256", 1)
+            >>> print(block == hashlib.pbkdf2_hmac("sha256", b"my_password", salt, 100000))  # Output: True
+        """
+        prf = Utils._hmac_prf(password, algorithm)
+        u = prf(salt + index.to_bytes(4, 'big'))
+        block = int.from_bytes(u, 'big')
+        for _ in range(iterations - 1):
+            u = prf(u)
+            block ^= int.from_bytes(u, 'big')
+        return block.to_bytes(len(u), 'big')
+
+    def _verify_pbkdf2_cached(self, password: bytes, salt: bytes, iterations: int, algorithm: str, expected_hash: bytes) -> bool:
+        """
+        Verify a single-block PBKDF2 hash using the verification cache.
+
+        The first PBKDF2_CACHE_PREFIX_ITERATIONS iterations are always computed. On a cache hit for
+        (salt, iterations, algorithm, digest of U_k), the stored XOR of U_k+1..U_c finishes the key.
+        On a miss the full block is computed with hashlib.pbkdf2_hmac and, if the password matches,
+        the suffix (block XOR prefix) is cached.
+
+        Args:
+            - password : The password bytes.
+            - salt : The salt bytes.
+            - iterations : Number of iterations.
+            - algorithm : The hashing algorithm to use.
+            - expected_hash : The stored hash bytes.
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> is_valid = utils._verify_pbkdf2_cached(b"my_password", salt, 100000, "sha256", expected_hash)
+        """
+        prf = self._hmac_prf(password, algorithm)
+        prefix_iterations = self.PBKDF2_CACHE_PREFIX_ITERATIONS
+        u = prf(salt + b'\x00\x00\x00\x01')
+        prefix = int.from_bytes(u, 'big')
+        for _ in range(prefix_iterations - 1):
+            u = prf(u)
+            prefix ^= int.from_bytes(u, 'big')
+
+        now = time.monotonic()
+        cache_key = (salt, iterations, algorithm, hashlib.sha256(u).digest())
+        cached = self._pbkdf2_cache.get(cache_key)
+        if cached is not None and cached[0] <= now:
+            self._pbkdf2_cache.pop(cache_key, None)
+            cached = None
+
+        if cached is not None:
+            suffix = cached[1]
+            if self.__is_logging_enabled__:
+                self.log.log_message("DEBUG", "PBKDF2 verification cache hit.")
+        else:
+            # the full block comes from OpenSSL, so a miss costs about one uncached verify; U_k+1..U_c = T ^ prefix
+            block = hashlib.pbkdf2_hmac(algorithm, password, salt, iterations)
+            suffix = int.from_bytes(block, 'big') ^ prefix
+
+        derived = (prefix ^ suffix).to_bytes(len(u), 'big')[:len(expected_hash)]
+        is_valid = hmac.compare_digest(derived, expected_hash)
+        if is_valid and cached is None:
+            self._pbkdf2_cache[cache_key] = (now + self.PBKDF2_CACHE_TTL, suffix)
+            while len(self._pbkdf2_cache) > self.PBKDF2_CACHE_MAX_SIZE:
+                self._pbkdf2_cache.pop(next(iter(self._pbkdf2_cache)), None)
+        return is_valid
+
+    def _derive_pbkdf2(self, password: bytes, salt: bytes, iterations: int, algorithm: str, dklen: Optional[int] = None) -> bytes:
+        """
+        Derive a PBKDF2 HMAC key, splitting independent blocks across processes for large dklen.
+
+        Args:
+            - password : The password bytes.
+            - salt : The salt bytes.
+            - iterations : Number of iterations.
+            - algorithm : The hashing algorithm to use.
+            - dklen : Length of the derived key in bytes. Defaults to the digest size of the algorithm.
+
+        Returns:
+            bytes: The derived key.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> key = utils._derive_pbkdf2(b"my_password", salt, 100000, "sha256", dklen=128)
+        """
+        digest_size = self.PBKDF2_DIGEST_SIZES[algorithm]
+        dklen = dklen or digest_size
+        nblocks = -(-dklen // digest_size)
+        workers = min(nblocks, os.cpu_count() or 1)
+        if workers < self.PBKDF2_PARALLEL_MIN_WORKERS or iterations * nblocks < self.PBKDF2_PARALLEL_THRESHOLD:
+            return hashlib.pbkdf2_hmac(algorithm, password, salt, iterations, dklen)
+
+        if self.__is_logging_enabled__:
+            self.log.log_message("DEBUG", f"Computing {nblocks} PBKDF2 blocks across {workers} processes.")
+        executor = _get_pbkdf2_executor()
+        try:
+            blocks = executor.map(self._pbkdf2_block, repeat(password), repeat(salt), repeat(iterations), repeat(algorithm), range(1, nblocks + 1))
+            return b''.join(blocks)[:dklen]
+        except BrokenProcessPool:
+            _discard_pbkdf2_executor(executor)
+            if self.__is_logging_enabled__:
+                self.log.log_message("WARNING", "PBKDF2 process pool broke; falling back to hashlib.pbkdf2_hmac.")
+            return hashlib.pbkdf2_hmac(algorithm, password, salt, iterations, dklen)
         
+    @staticmethod
+    def _interleave(buf: Union[bytes, bytearray], interval: int, byte: int, start_index: int) -> bytes:
+        """
+        Insert a single byte before every interval-sized chunk of buf, starting at start_index, using NumPy.
+
+        The full chunks are written as one (rows, interval + 1) strided copy, so the work is a couple of memory passes.
+
+        Args:
+            - buf : The original bytes. (must be longer than start_index)
+            - interval : The chunk size. (positive integer)
+            - byte : The byte value to insert. (0-255)
+            - start_index : The index of the first insertion.
+
+        Returns:
+            bytes: The interleaved bytes.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> print(Utils._interleave(b"abcdefgh", 4, ord("-"), 0))  # Output: b'-abcd-efgh'
+        """
+        src = np.frombuffer(buf, dtype=np.uint8)
+        body = src[start_index:]
+        rows, tail = divmod(len(body), interval)
+        out = np.empty(len(src) + rows + (1 if tail else 0), dtype=np.uint8)
+        out[:start_index] = src[:start_index]
+
+        full = out[start_index:start_index + rows * (interval + 1)].reshape(rows, interval + 1)
+        full[:, 0] = byte
+        full[:, 1:] = body[:rows * interval].reshape(rows, interval)
+        if tail:
+            out[-tail - 1] = byte
+            out[-tail:] = body[-tail:]
+        return out.tobytes()
+
     def _lookup_dict(self, dict_obj: Dict, threshold: Union[int, float, str, bool], comparison_func: Callable, comparison_type: str, nested: bool = False, separator: str = "/" , return_mod: str = "flat", prefix_marker: str = "") -> Union[List[Union[str, Dict]], Tuple[Union[str, Dict], ...]]:
         """
         Helper method to recursively look up keys in a dictionary based on a comparison function.
@@ -95,7 +378,7 @@ class Utils:
         Args:
             dict_obj : The dictionary to search.
             threshold : The value to compare against.
-            comparison_func : A callable that takes a value and returns True if it meets the condition.
+            comparison_func : A callable taking (value, threshold) that returns True if the value meets the condition. (e.g. operator.gt)
             comparison_type : The type of comparison being performed.
             nested : If True, search within nested dictionaries.
             separator : A string to prefix nested keys with. Defaults to "/". (If "tuple", returns tuple, if "list", returns list)
@@ -111,46 +394,101 @@ class Utils:
         Example:
             >>> # I'm not recommending to call this method directly, it's for internal use.
             >>> my_dict = {'a': 10, 'b': 20, 'c': 30}
-            >>> found_keys = app_core._lookup_dict(my_dict, threshold=20, comparison_func=lambda x: x > 20, comparison_type='gt', nested=False)
+            >>> found_keys = app_core._lookup_dict(my_dict, threshold=20, comparison_func=operator.gt, comparison_type='gt', nested=False)
             >>> print(found_keys)  # Output: ['c']
         """
+        log_enabled = self.__is_logging_enabled__
+        log_message = self.log.log_message  # bound once instead of resolving self.log per logged key; %-style args are formatted only if DEBUG is emitted
+        threshold_type = type(threshold)
+        skip_type_mismatch = comparison_type in ('eq', 'ne')
+
+        # Depth-first walk with an explicit stack of item iterators instead of recursion, so deep trees are not capped
+        # by the recursion limit and keep the same key order. Frame: (items, output list, key prefix, parent output, index in parent, key)
         found_keys = []
-        for key, value in dict_obj.items():
-            if isinstance(value, (tuple, list)):
-                if self.__is_logging_enabled__:
-                    self.log.log_message("DEBUG", f"Skipping iterable at key '{key}'.")
-                continue
-            if nested and isinstance(value, dict):
-                if self.__is_logging_enabled__:
-                    self.log.log_message("DEBUG", f"Searching nested dictionary at key '{key}'.")
-                if return_mod == "flat":
-                    found_keys.append(self._lookup_dict(value, threshold, comparison_func, comparison_type, nested, separator, "flat"))
-                elif return_mod == "forest":
-                    found_keys.append({key: self._lookup_dict(value, threshold, comparison_func, comparison_type, nested, separator, "forest")})
-                elif return_mod == "path":
-                    found_keys.extend(self._lookup_dict(value, threshold, comparison_func, comparison_type, nested, separator, "path", f"{prefix_marker}{key}{separator}"))
-            elif type(value) != type(threshold) and comparison_type in ('eq', 'ne'):
-                if self.__is_logging_enabled__:
-                    self.log.log_message("DEBUG", f"Type mismatch at key '{key}': {type(value).__name__} vs {type(threshold).__name__}. Skipping.")
-                continue
-            else:
-                if comparison_func(value):
+        stack = [(iter(dict_obj.items()), found_keys, prefix_marker, None, None, None)]
+        while stack:
+            items, current_keys, prefix, parent_keys, parent_index, parent_key = stack[-1]
+            for key, value in items:
+                if isinstance(value, (tuple, list)):
+                    if log_enabled:
+                        log_message("DEBUG", "Skipping iterable at key '%s'.", key)
+                    continue
+                if nested and isinstance(value, dict):
+                    if log_enabled:
+                        log_message("DEBUG", "Searching nested dictionary at key '%s'.", key)
+                    if return_mod == "path":
+                        stack.append((iter(value.items()), current_keys, f"{prefix}{key}{separator}", None, None, None))
+                        break
+                    if return_mod in ("flat", "forest"):
+                        nested_keys = []
+                        current_keys.append(nested_keys if return_mod == "flat" else {key: nested_keys})
+                        stack.append((iter(value.items()), nested_keys, "", current_keys, len(current_keys) - 1, key))
+                        break
+                elif type(value) != threshold_type and skip_type_mismatch:
+                    if log_enabled:
+                        log_message("DEBUG", "Type mismatch at key '%s': %s vs %s. Skipping.", key, type(value).__name__, threshold_type.__name__)
+                    continue
+                elif comparison_func(value, threshold):
                     if return_mod == "flat":
-                        found_keys.append(key)
+                        current_keys.append(key)
                     elif return_mod == "forest":
-                        found_keys.extend({key: value})
+                        current_keys.extend({key: value})
                     elif return_mod == "path":
-                        found_keys.append(f"{prefix_marker}{key}")
+                        current_keys.append(f"{prefix}{key}")
 
-                    if self.__is_logging_enabled__:
-                        self.log.log_message("DEBUG", f"Key '{prefix_marker}{key}' matches the condition.")
+                    if log_enabled:
+                        log_message("DEBUG", "Key '%s%s' matches the condition.", prefix, key)
+            else:
+                stack.pop()
+                if parent_keys is not None and separator == "tuple":
+                    parent_keys[parent_index] = tuple(current_keys) if return_mod == "flat" else {parent_key: tuple(current_keys)}
+        return tuple(found_keys) if separator == "tuple" else found_keys
+
+    def _lookup_dict_vectorized(self, dict_obj: Dict, threshold: Union[int, float], comparison_func: Callable, comparison_type: str, separator: str = "/") -> Optional[Union[List[str], Tuple[str, ...]]]:
+        """
+        NumPy fast path of _lookup_dict for large flat dictionaries of homogeneous numeric values.
+
+        Only used when every value has exactly the type of threshold (int or float, never bool), so the result matches
+        _lookup_dict including the 'eq'/'ne' type-mismatch rule. ints are compared as int64 to keep them exact.
+
+        Args:
+            dict_obj : The dictionary to search.
+            threshold : The int or float value to compare against.
+            comparison_func : A callable taking (values, threshold) that returns the match mask. (e.g. operator.gt)
+            comparison_type : The type of comparison being performed.
+            separator : If "tuple", returns tuple.
+
+        Returns:
+            The matching keys in dict order, or None if the dictionary does not qualify for the fast path.
+
+        Example:
+            >>> # I'm not recommending to call this method directly, it's for internal use.
+            >>> my_dict = {f"k{i}": i for i in range(20_000)}
+            >>> found_keys = app_core._lookup_dict_vectorized(my_dict, threshold=19_998, comparison_func=operator.gt, comparison_type='gt')
+            >>> print(found_keys)  # Output: ['k19999']
+        """
+        threshold_type = type(threshold)
+        if threshold_type not in (int, float) or set(map(type, dict_obj.values())) != {threshold_type}:
+            return None
+        try:
+            values = np.fromiter(dict_obj.values(), dtype=np.int64 if threshold_type is int else np.float64, count=len(dict_obj))
+            mask = comparison_func(values, threshold)
+        except OverflowError:
+            return None  # ints outside int64 keep Python's arbitrary precision on the slow path
+
+        found_keys = list(compress(dict_obj, mask.tolist()))
+        if self.__is_logging_enabled__:
+            self.log.log_message("DEBUG", f"Vectorized {comparison_type} lookup over {len(dict_obj)} values.")
         return tuple(found_keys) if separator == "tuple" else found_keys
 
     # external Methods
-    def str_to_path(self, path_str: str) -> Path:
+    def str_to_path(self, path_str: str) -> Result:
         """
         Convert a string to a Path object.
 
+        - Non-string input (including Path objects) is returned as-is.
+        - Converted paths are cached, so repeated strings return the same (immutable) Path object.
+
         Args:
             - path_str : The string representation of the path.
             
@@ -165,29 +503,31 @@ class Utils:
             >>> else:
             >>>     print(result.error)
         """
-        try:
-            if not isinstance(path_str, str):
-                return Result(True, None, None, path_str)
-
-            return Result(True, None, None, Path(path_str))
-        except Exception as e:
-            return self._exception_tracker.get_exception_return(e)
+        if isinstance(path_str, str):
+            return Result.ok(_path_of(path_str))
+        return Result.ok(path_str)
         
-    def hashing(self, data: str, algorithm: str='sha256') -> Result:
+    def hashing(self, data: Union[str, bytes, bytearray, memoryview], algorithm: str='sha256', raw: bool=False) -> Result:
         """
         Encrypt a string using the specified algorithm.
-        Supported algorithms: 'md5', 'sha1', 'sha256', 'sha512'
+        Supported algorithms: 'md5', 'sha1', 'sha256', 'sha512', 'blake2b', 'blake2s', 'blake3' (requires the blake3 package)
+
+        - Bytes-like data is hashed as-is without copying, in a single update call.
+        - For non-security content hashes (cache keys, deduplication), 'blake2b' is usually faster than 'sha256' on CPUs
+          without SHA extensions; on CPUs with them, the hardware-accelerated 'sha256' default is the faster choice.
 
         **WARNING**: 
             - Hashing is not encryption. Hashing is a one-way function and cannot be reversed.
             - md5 and sha1 are considered weak and not recommended for security-sensitive applications.
+            - blake2b, blake2s and blake3 are not FIPS-approved. Use a SHA-2 algorithm where FIPS compliance is required.
 
         Args:
-            - data : The string to encrypt.
+            - data : The string or bytes-like object to encrypt. Strings are encoded as UTF-8.
             - algorithm : The hashing algorithm to use. Defaults to 'sha256'
+            - raw : If True, return the digest as bytes instead of a hexadecimal string. Defaults to False.
 
         Returns:
-            Result: A Result object containing the encrypted string in hexadecimal format.
+            Result: A Result object containing the encrypted string in hexadecimal format (bytes if raw is True).
 
         Example:
             >>> result = utils.encrypt("my_secret_data", algorithm='sha256')
@@ -198,35 +538,39 @@ class Utils:
             >>>     print(result.error)
         """
         try:
-            if not isinstance(data, str):
-                raise ValueError("data must be a string")
-            if algorithm not in ['md5', 'sha1', 'sha256', 'sha512']:
-                raise ValueError("Unsupported algorithm. Supported algorithms: 'md5', 'sha1', 'sha256', 'sha512'")
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            elif not isinstance(data, (bytes, bytearray, memoryview)):
+                raise ValueError("data must be a string or bytes-like object")
+            constructor = self._HASH_CONSTRUCTORS.get(algorithm)
+            if constructor is None:
+                raise ValueError(f"Unsupported algorithm. Supported algorithms: {', '.join(sorted(self.HASHING_ALGORITHMS))}")
 
-            hash_func = getattr(hashlib, algorithm)()
-            hash_func.update(data.encode('utf-8'))
-            encrypted_data = hash_func.hexdigest()
+            hash_object = constructor(data)
+            encrypted_data = hash_object.digest() if raw else hash_object.hexdigest()
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"Data encrypted using {algorithm}.")
-            return Result(True, None, None, encrypted_data)
+            return Result.ok(encrypted_data)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Encryption failed: {e}")
             return self._exception_tracker.get_exception_return(e)
         
-    def pbkdf2_hmac(self, password: str, algorithm: str, iterations: int, salt_size: int) -> Result:
+    def pbkdf2_hmac(self, password: Union[str, bytes], algorithm: str, iterations: int, salt_size: int, dklen: Optional[int]=None) -> Result:
         """
         Generate a PBKDF2 HMAC hash of the given password.
         Supported algorithms: 'sha1', 'sha256', 'sha512'
 
         This function returns a dict containing the salt (hex), hash (hex), iterations, and algorithm used.
+        If dklen spans several hash blocks, the blocks are computed in parallel worker processes when it pays off.
 
         Args:
-            - password : The password string.
+            - password : The password string. Already encoded bytes are used as-is, skipping the UTF-8 encode.
             - algorithm : The hashing algorithm to use.
             - iterations : Number of iterations.
             - salt_size : Size of the salt in bytes.
+            - dklen : Length of the derived key in bytes. Defaults to None (digest size of the algorithm).
 
         Returns:
             Result: A Result object containing a dict with the following keys:
@@ -241,9 +585,13 @@ class Utils:
         """
         try:
             self._check_pbkdf2_params(password, algorithm, iterations, salt_size)
+            if dklen is not None and (not isinstance(dklen, int) or dklen <= 0):
+                raise ValueError("dklen must be a positive integer or None")
             
             salt = secrets.token_bytes(salt_size)
-            hash_bytes = hashlib.pbkdf2_hmac(algorithm, password.encode('utf-8'), salt, iterations)
+            if isinstance(password, str):
+                password = password.encode('utf-8')
+            hash_bytes = self._derive_pbkdf2(password, salt, iterations, algorithm, dklen)
 
             salt_hex = salt.hex()
             hash_hex = hash_bytes.hex()
@@ -256,25 +604,31 @@ class Utils:
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"PBKDF2 HMAC hash generated using {algorithm} with {iterations} iterations.")
-            return Result(True, None, None, result)
+            return Result.ok(result)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"PBKDF2 HMAC hash generation failed: {e}")
             return self._exception_tracker.get_exception_return(e)
         
-    def verify_pbkdf2_hmac(self, password: str, salt_hex: str, hash_hex: str, iterations: int, algorithm: str) -> Result:
+    def verify_pbkdf2_hmac(self, password: Union[str, bytes], salt_hex: str, hash_hex: str, iterations: int, algorithm: str, use_cache: bool=False) -> Result:
         """
         Verify a PBKDF2 HMAC hash of the given password.
         Supported algorithms: 'sha1', 'sha256', 'sha512'
 
         This function returns True if the password matches the hash, False otherwise.
 
+        **WARNING**:
+            - use_cache keeps password-derived intermediate state in memory for PBKDF2_CACHE_TTL seconds.
+              Anyone able to read process memory can test guesses for a cached entry in PBKDF2_CACHE_PREFIX_ITERATIONS
+              iterations instead of the full count. Only enable it for repeated authentication flows that need it.
+
         Args:
-            - password : The password string to verify.
+            - password : The password string to verify. Already encoded bytes are used as-is, skipping the UTF-8 encode.
             - salt_hex : The salt in hexadecimal format.
             - hash_hex : The hash in hexadecimal format.
             - iterations : Number of iterations.
             - algorithm : The hashing algorithm to use.
+            - use_cache : If True, reuse the cached iteration suffix of a previous successful verification. Defaults to False.
 
         Returns:
             Result: A Result object containing a boolean indicating whether the password matches the hash.
@@ -298,31 +652,93 @@ class Utils:
             if not isinstance(salt_hex, str) or not isinstance(hash_hex, str):
                 raise ValueError("salt_hex and hash_hex must be strings")
             
+            # Decode both hex inputs before deriving so malformed input fails fast, and compare raw digests
             salt = bytes.fromhex(salt_hex)
-            excepted_hash = bytes.fromhex(hash_hex)
-            hash_bytes = hashlib.pbkdf2_hmac(algorithm, password.encode('utf-8'), salt, iterations)
-
-            is_valid = secrets.compare_digest(hash_bytes, excepted_hash)
+            expected_hash = bytes.fromhex(hash_hex)
+            if isinstance(password, str):
+                password = password.encode('utf-8')
+            cacheable = (use_cache and iterations > self.PBKDF2_CACHE_PREFIX_ITERATIONS
+                         and 0 < len(expected_hash) <= self.PBKDF2_DIGEST_SIZES[algorithm])
+            if cacheable:
+                is_valid = self._verify_pbkdf2_cached(password, salt, iterations, algorithm, expected_hash)
+            else:
+                hash_bytes = self._derive_pbkdf2(password, salt, iterations, algorithm, len(expected_hash) or None)
+                is_valid = hmac.compare_digest(hash_bytes, expected_hash)
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"PBKDF2 HMAC hash verification using {algorithm} with {iterations} iterations. Result: {is_valid}")
-            return Result(True, None, None, is_valid)
+            return Result.ok(is_valid)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"PBKDF2 HMAC hash verification failed: {e}")
             return self._exception_tracker.get_exception_return(e)
         
-    def insert_at_intervals(self, data: Union[List, str], interval: int, insert: Any, at_start: bool=True) -> Result:
+    def verify_pbkdf2_hmac_batch(self, password: Union[str, bytes], records: List[Dict[str, Any]]) -> Result:
         """
-        Insert a specified element into a list or string at regular intervals.
+        Verify one password against several stored PBKDF2 HMAC hashes.
+        Supported algorithms: 'sha1', 'sha256', 'sha512'
+
+        The password is encoded once for the whole batch, and every record is validated before any key is derived,
+        so a malformed record fails the call without spending the iterations of the records before it.
 
         Args:
-            - data : The original list or string where elements will be inserted.
+            - password : The password string to verify. Already encoded bytes are used as-is.
+            - records : A list of dicts with the keys returned by pbkdf2_hmac(): "salt_hex", "hash_hex", "iterations", "algorithm".
+
+        Returns:
+            Result: A Result object containing a list of booleans, one per record in the same order.
+
+        Example:
+            >>> records = [utils.pbkdf2_hmac("my_password", "sha256", 100000, 32).data,
+            >>>            utils.pbkdf2_hmac("other_password", "sha512", 100000, 32).data]
+            >>> result = utils.verify_pbkdf2_hmac_batch("my_password", records)
+            >>> if result.success:
+            >>>     print(result.data)  # Output: [True, False]
+            >>> else:
+            >>>     print(result.error)
+        """
+        try:
+            if not isinstance(records, (list, tuple)):
+                raise ValueError("records must be a list of dicts")
+            decoded = []
+            for record in records:
+                if not isinstance(record, dict):
+                    raise ValueError("records must be a list of dicts")
+                self._check_pbkdf2_params(password, record.get("algorithm"), record.get("iterations"))
+                salt_hex, hash_hex = record.get("salt_hex"), record.get("hash_hex")
+                if not isinstance(salt_hex, str) or not isinstance(hash_hex, str):
+                    raise ValueError("salt_hex and hash_hex must be strings")
+                decoded.append((bytes.fromhex(salt_hex), bytes.fromhex(hash_hex), record["iterations"], record["algorithm"]))
+
+            if isinstance(password, str):
+                password = password.encode('utf-8')
+            results = [hmac.compare_digest(self._derive_pbkdf2(password, salt, iterations, algorithm, len(expected_hash) or None), expected_hash)
+                       for salt, expected_hash, iterations, algorithm in decoded]
+
+            if self.__is_logging_enabled__:
+                self.log.log_message("INFO", f"PBKDF2 HMAC batch verification of {len(results)} records. Matches: {sum(results)}")
+            return Result.ok(results)
+        except Exception as e:
+            if self.__is_logging_enabled__:
+                self.log.log_message("ERROR", f"PBKDF2 HMAC batch verification failed: {e}")
+            return self._exception_tracker.get_exception_return(e)
+
+    def insert_at_intervals(self, data: Union[List, str, bytes, bytearray], interval: int, insert: Any, at_start: bool=True) -> Result:
+        """
+        Insert a specified element into a list, string or bytes at regular intervals.
+
+        - Strings and bytes are built from slices in a single join. Bytes with a single-byte insert, and ASCII strings
+          with a single ASCII character insert, are interleaved with NumPy when available.
+        - Lists are preallocated and filled with strided slice assignments instead of repeated list.insert calls.
+
+        Args:
+            - data : The original list, string or bytes where elements will be inserted.
             - interval : The interval at which to insert the element. (must be a positive integer)
             - insert : The element to insert into the list or string. (if data is a string, using object like callable is not recommended as it will be converted to string)
+                If data is bytes, insert must be bytes or an int in range 0-255.
             - at_start : If True, insertion starts at the beginning (index 0). If False, insertion starts after the first interval. Defaults to True.
 
         Returns:
-            Result: A Result object containing the modified list or string.
+            Result: A Result object containing the modified list, string or bytes.
 
         Example:
             >>> utils = Utils()
@@ -334,35 +750,53 @@ class Utils:
             >>>    print(result.error)
         """
         try:
-            if not isinstance(data, (list, str)):
-                raise ValueError("data must be a list or string")
+            if not isinstance(data, (list, str, bytes, bytearray)):
+                raise ValueError("data must be a list, string or bytes")
             if not isinstance(interval, int) or interval <= 0:
                 raise ValueError("interval must be a positive integer")
             if not isinstance(at_start, bool):
                 raise ValueError("at_start must be a boolean value")
-        
-            original_type_is_str = False
-            if isinstance(data, str):
-                original_type_is_str = True
-                data = list(data)
 
-            # Build new list by inserting at intervals (iterate in reverse to avoid index shifting issues)
-            result_data = list(data)
             start_index = 0 if at_start else interval
-            insert_count = 0
-            
-            # Calculate positions from the end to maintain correct indices
-            positions_to_insert = list(range(start_index, len(result_data) + insert_count * (interval + 1), interval + 1))
-            
-            # Insert in reverse order to avoid index shifting
-            for pos in reversed(positions_to_insert):
-                if pos <= len(result_data):
-                    result_data.insert(pos, insert)
-                    insert_count += 1
-
-            if original_type_is_str:
-                result_data = ''.join(map(str, result_data))
-            return Result(True, None, None, result_data)
+            positions = range(start_index, len(data), interval)
+
+            if isinstance(data, (bytes, bytearray)):
+                if isinstance(insert, int) and 0 <= insert <= 255:
+                    insert = bytes((insert,))
+                if not isinstance(insert, (bytes, bytearray)):
+                    raise ValueError("insert must be bytes or an int in range 0-255 when data is bytes")
+
+                if len(positions) == 0:
+                    result_data = bytes(data)
+                elif np is not None and len(insert) == 1 and len(positions) >= self.INTERLEAVE_MIN_INSERTS:
+                    result_data = self._interleave(data, interval, insert[0], start_index)
+                else:
+                    result_data = data[:start_index] + insert + insert.join(data[pos:pos + interval] for pos in positions)
+                return Result.ok(bytearray(result_data) if isinstance(data, bytearray) else bytes(result_data))
+
+            if isinstance(data, str):
+                if len(positions) == 0:
+                    return Result.ok(data)
+                insert = str(insert)
+                if np is not None and len(positions) >= self.INTERLEAVE_MIN_INSERTS and len(insert) == 1 and insert.isascii() and data.isascii():
+                    return Result.ok(self._interleave(data.encode('ascii'), interval, ord(insert), start_index).decode('ascii'))
+                return Result.ok(data[:start_index] + insert + insert.join(data[pos:pos + interval] for pos in positions))
+
+            if len(positions) == 0:
+                return Result.ok(list(data))
+            # Preallocate the output filled with insert, then place data with C-level slice copies.
+            # Python-level iterations are min(interval, number of inserts), so never more than ~sqrt(len(data)).
+            if interval <= len(positions):
+                result_data = [insert] * (len(data) + len(positions))
+                result_data[:start_index] = data[:start_index]
+                for offset in range(interval):
+                    result_data[start_index + 1 + offset::interval + 1] = data[start_index + offset::interval]
+            else:
+                result_data = data[:start_index]
+                for pos in positions:
+                    result_data.append(insert)
+                    result_data += data[pos:pos + interval]
+            return Result.ok(result_data)
         except Exception as e:
             return self._exception_tracker.get_exception_return(e)
     
@@ -399,17 +833,8 @@ class Utils:
         - 'gt': greater than
         - 'ge': greater than or equal to
         """
-        comparison_operators = {
-            'eq': lambda x: x == threshold,
-            'ne': lambda x: x != threshold,
-            'lt': lambda x: x < threshold,
-            'le': lambda x: x <= threshold,
-            'gt': lambda x: x > threshold,
-            'ge': lambda x: x >= threshold,
-        }
-
         try:
-            if comparison not in comparison_operators:
+            if comparison not in _COMPARISON_OPERATORS:
                 raise ValueError(f"Unsupported comparison operator: {comparison}")
             if isinstance(dict_obj, dict) is False:
                 raise ValueError("Input data must be a dictionary")
@@ -424,12 +849,16 @@ class Utils:
             if return_mod == "path" and separator in ("list", "tuple"):
                 raise ValueError("separator cannot be 'list' or 'tuple' when return_mod is 'path'")
             
-            comparison_func = comparison_operators[comparison]
-            found_keys = self._lookup_dict(dict_obj, threshold, comparison_func, comparison, nested, separator=separator, return_mod=return_mod)
+            comparison_func = _COMPARISON_OPERATORS[comparison]
+            found_keys = None
+            if np is not None and return_mod == "flat" and len(dict_obj) >= self.VECTORIZED_LOOKUP_MIN_SIZE:
+                found_keys = self._lookup_dict_vectorized(dict_obj, threshold, comparison_func, comparison, separator)
+            if found_keys is None:
+                found_keys = self._lookup_dict(dict_obj, threshold, comparison_func, comparison, nested, separator=separator, return_mod=return_mod)
 
             if self.__is_logging_enabled__:
                 self.log.log_message("INFO", f"find_keys_by_value found {len(found_keys)} keys matching criteria.")
-            return Result(True, None, None, found_keys)
+            return Result.ok(found_keys)
         except Exception as e:
             if self.__is_logging_enabled__:
                 self.log.log_message("ERROR", f"Error in find_keys_by_value: {str(e)}")